@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Backtest queue worker: claims jobs from the backtest_job table and runs them.
+
+Start one or more per machine (all pointing at the same SLICE_DB_URL):
+
+    python scripts/backtest_worker.py
+    python scripts/backtest_worker.py --exit-when-idle --max-jobs 100
+
+Jobs are queued with slice.quant_engine.interface.job_queue.submit_backtest()
+or submit_sweep().
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Ensure src/ is on sys.path
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+# Optional: load .env if available
+try:
+    from dotenv import load_dotenv  # type: ignore
+
+    load_dotenv(PROJECT_ROOT / ".env")
+except ImportError:
+    pass
+
+from slice.quant_engine.interface.job_queue import main
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
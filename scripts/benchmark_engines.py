@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+"""
+Backtest engine throughput benchmark on synthetic data (no Postgres needed).
+
+For every registered strategy it sweeps ticker count, history length and
+rebalance frequency, feeding synthetic OHLCV through
+loader.set_price_source() and synthetic econ series through
+seed_econ_series(), then times each phase of a run:
+
+  generate  synthetic frames
+  load      load_price_panel() through the injected source
+  build     build_cerebro() (backtrader engine only)
+  run       Cerebro.run() / run_vectorized()
+  metrics   returns extraction + compute_backtest_metrics()
+
+and reports bars/second (ticker-bars over build + run) and the tracemalloc
+peak of build + run. Results are written as JSON; pass --baseline to
+compare bars/second against an earlier file.
+
+  PYTHONPATH=src python scripts/benchmark_engines.py --quick -o bench.json
+  PYTHONPATH=src python scripts/benchmark_engines.py --baseline bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# add src/ to sys.path
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+import backtrader as bt
+import numpy as np
+import pandas as pd
+
+from slice.quant_engine.core.cerebro import build_cerebro
+from slice.quant_engine.core.metrics import compute_backtest_metrics
+from slice.quant_engine.core.vectorized import run_vectorized
+from slice.quant_engine.data import invalidate_econ_cache, seed_econ_series
+from slice.quant_engine.data.loader import load_price_panel, set_price_source
+from slice.quant_engine.data.synthetic import (
+    SyntheticPriceSource,
+    synthetic_dates,
+    synthetic_econ_series,
+    synthetic_price_panel,
+    synthetic_tickers,
+)
+from slice.quant_engine.strategies.registry import list_strategies, resolve_strategy, strategy_metadata
+from slice.quant_engine.strategies.strategy_base import REBALANCE_FREQUENCIES
+
+
+FULL_GRID = {"tickers": [1, 10, 100, 500], "years": [1, 5, 20, 50]}
+QUICK_GRID = {"tickers": [1, 10], "years": [1, 5]}
+ENGINES = ("backtrader", "vectorized")
+
+
+def _case_key(case: Dict[str, Any]) -> tuple:
+    return (case["strategy"], case["engine"], case["tickers"], case["years"], case["rebalance_frequency"])
+
+
+def _prepare(strategy_id: str, n_tickers: int, years: float, seed: int):
+    """
+    Synthetic prices for the strategy's price_symbol plus filler tickers,
+    and seeded econ series for every series it requires.
+    """
+    meta = strategy_metadata(strategy_id)
+    include = [meta.params["price_symbol"]] if meta.params.get("price_symbol") else []
+    tickers = synthetic_tickers(n_tickers, include=include)
+    dates = synthetic_dates(years)
+
+    frames = synthetic_price_panel(tickers, dates, seed=seed)
+    invalidate_econ_cache()
+    for i, series_id in enumerate(meta.required_econ_series):
+        seed_econ_series(series_id, synthetic_econ_series(dates, seed=seed + 1 + i))
+    return tickers, frames
+
+
+def _run_once(strategy_cls, engine: str, price_data, strategy_params, analyzers: str) -> Dict[str, float]:
+    seconds: Dict[str, float] = {}
+
+    if engine == "vectorized":
+        t0 = time.perf_counter()
+        run = run_vectorized(strategy_cls, price_data, strategy_params=strategy_params)
+        seconds["build"] = 0.0
+        seconds["run"] = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        compute_backtest_metrics(run.returns)
+        seconds["metrics"] = time.perf_counter() - t0
+        return seconds
+
+    t0 = time.perf_counter()
+    cerebro = build_cerebro(
+        strategy_cls, price_data, strategy_params=strategy_params, analyzers=analyzers
+    )
+    seconds["build"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    strat = cerebro.run()[0]
+    seconds["run"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    if analyzers == "none":
+        values = strat.analyzers.equity.get_analysis()["value"]
+        returns = values / np.concatenate([[cerebro.broker.startingcash], values[:-1]]) - 1.0
+    else:
+        returns = np.fromiter(strat.analyzers.returns.get_analysis().values(), dtype=float)
+    compute_backtest_metrics(returns)
+    seconds["metrics"] = time.perf_counter() - t0
+    return seconds
+
+
+def run_case(
+    strategy_id: str,
+    engine: str,
+    n_tickers: int,
+    years: float,
+    frequency: str,
+    repeat: int = 1,
+    memory: bool = True,
+    analyzers: str = "standard",
+    seed: int = 0,
+) -> Dict[str, Any]:
+    strategy_cls = resolve_strategy(strategy_id)
+    strategy_params = {"rebalance_frequency": frequency}
+
+    t0 = time.perf_counter()
+    tickers, frames = _prepare(strategy_id, n_tickers, years, seed)
+    generate = time.perf_counter() - t0
+
+    set_price_source(SyntheticPriceSource(frames))
+    try:
+        t0 = time.perf_counter()
+        price_data = load_price_panel(tickers)
+        load = time.perf_counter() - t0
+
+        # fastest of `repeat` runs, per phase
+        runs = [_run_once(strategy_cls, engine, price_data, strategy_params, analyzers) for _ in range(repeat)]
+        seconds = {"generate": generate, "load": load}
+        seconds.update({phase: min(r[phase] for r in runs) for phase in runs[0]})
+
+        peak_mb: Optional[float] = None
+        if memory:
+            tracemalloc.start()
+            try:
+                _run_once(strategy_cls, engine, price_data, strategy_params, analyzers)
+                peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+            finally:
+                tracemalloc.stop()
+    finally:
+        set_price_source(None)
+        invalidate_econ_cache()
+
+    n_bars = len(next(iter(frames.values())))
+    engine_seconds = seconds["build"] + seconds["run"]
+    return {
+        "strategy": strategy_id,
+        "engine": engine,
+        "tickers": n_tickers,
+        "years": years,
+        "rebalance_frequency": frequency,
+        "bars": n_bars,
+        "ticker_bars": n_bars * n_tickers,
+        "seconds": seconds,
+        "bars_per_second": n_bars * n_tickers / engine_seconds if engine_seconds > 0 else None,
+        "peak_memory_mb": peak_mb,
+    }
+
+
+def _environment() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": pd.Timestamp.now(tz="UTC").isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "backtrader": bt.__version__,
+    }
+
+
+def _compare(cases: List[Dict[str, Any]], baseline_path: Path) -> None:
+    baseline = {_case_key(c): c for c in json.loads(baseline_path.read_text())["cases"]}
+    print(f"\nbars/second vs {baseline_path}:")
+    for case in cases:
+        old = baseline.get(_case_key(case))
+        if old is None or not old.get("bars_per_second") or not case["bars_per_second"]:
+            continue
+        ratio = case["bars_per_second"] / old["bars_per_second"]
+        print(f"  {' '.join(map(str, _case_key(case))):<55} x{ratio:.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--strategies", nargs="+", default=None, help="strategy ids (default: all registered)")
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES), choices=ENGINES)
+    parser.add_argument("--tickers", nargs="+", type=int, default=None)
+    parser.add_argument("--years", nargs="+", type=float, default=None)
+    parser.add_argument("--frequencies", nargs="+", default=list(REBALANCE_FREQUENCIES), choices=REBALANCE_FREQUENCIES)
+    parser.add_argument("--analyzers", default="standard", choices=("standard", "none"))
+    parser.add_argument("--quick", action="store_true", help="small ticker/year grid")
+    parser.add_argument("--max-ticker-bars", type=int, default=None, help="skip larger cases")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", type=Path, default=Path("benchmark_results.json"))
+    parser.add_argument("--baseline", type=Path, default=None, help="earlier results file to compare against")
+    args = parser.parse_args()
+
+    grid = QUICK_GRID if args.quick else FULL_GRID
+    strategies = args.strategies or list_strategies()
+    ticker_counts = args.tickers or grid["tickers"]
+    year_counts = args.years or grid["years"]
+
+    cases: List[Dict[str, Any]] = []
+    for strategy_id, engine, n_tickers, years, frequency in itertools.product(
+        strategies, args.engines, ticker_counts, year_counts, args.frequencies
+    ):
+        ticker_bars = len(synthetic_dates(years)) * n_tickers
+        if args.max_ticker_bars is not None and ticker_bars > args.max_ticker_bars:
+            continue
+
+        case = run_case(
+            strategy_id, engine, n_tickers, years, frequency,
+            repeat=args.repeat, memory=not args.no_memory, analyzers=args.analyzers, seed=args.seed,
+        )
+        cases.append(case)
+        peak = f"{case['peak_memory_mb']:.1f} MB" if case["peak_memory_mb"] is not None else "-"
+        print(
+            f"{strategy_id:<20} {engine:<10} tickers={n_tickers:<4} years={years:<5g} "
+            f"{frequency:<8} {case['bars_per_second'] or 0:>12,.0f} bars/s  peak {peak}"
+        )
+
+    args.output.write_text(json.dumps({"environment": _environment(), "cases": cases}, indent=2))
+    print(f"\nwrote {len(cases)} cases to {args.output}")
+
+    if args.baseline is not None:
+        _compare(cases, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Advance paper-trading portfolios over the bars added since their last run
+and write the simulated fills to the trade table.
+
+    python scripts/paper_trade.py paper_portfolios.json
+
+The config is a JSON list of {"portfolio_id", "strategy_id", "params",
+"thesis_ref"} objects, see slice.quant_engine.interface.paper_trading.
+scripts/update_data.py runs this too when SLICE_PAPER_CONFIG is set.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Ensure src/ is on sys.path
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+# Optional: load .env if available
+try:
+    from dotenv import load_dotenv  # type: ignore
+
+    load_dotenv(PROJECT_ROOT / ".env")
+except ImportError:
+    pass
+
+from slice.quant_engine.interface.paper_trading import main
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
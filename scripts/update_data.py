@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
@@ -19,6 +20,7 @@ try:
 except ImportError:
     pass
 
+from slice.quant_engine.interface.paper_trading import load_portfolios, run_paper_trading
 from slice.update import update_daily_prices, update_macro_data
 
 
@@ -31,6 +33,16 @@ def main() -> int:
     update_macro_data()
     print("\n--- Macro update complete ---\n")
 
+    # Paper portfolios only evaluate the bars just added
+    paper_config = os.getenv("SLICE_PAPER_CONFIG")
+    if paper_config:
+        summaries = run_paper_trading(load_portfolios(paper_config))
+        for summary in summaries:
+            print(f"[PAPER] {summary}")
+        print("\n--- Paper trading complete ---\n")
+        if any(s["error"] for s in summaries):
+            return 1
+
     return 0
 
 
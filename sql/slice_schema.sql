@@ -33,3 +33,68 @@ CREATE TABLE IF NOT EXISTS econ_data (
 
 CREATE INDEX IF NOT EXISTS idx_econ_data_series_date
     ON econ_data (series_id, date);
+
+-- ------------------------------------------------------------
+-- 3. Derived Strategy Signals (quant_engine/data/signal_store.py)
+-- ------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS strategy_signal_meta (
+    signal_key      VARCHAR(64) PRIMARY KEY,   -- hash of (name, inputs, window)
+    name            TEXT        NOT NULL,
+    inputs          JSONB       NOT NULL,      -- econ_data series ids
+    window_len      INTEGER     NOT NULL,
+    input_state     JSONB       NOT NULL,      -- digests of the inputs used
+    indicator_state JSONB       NOT NULL,      -- rolling-mean state after last_date
+    last_date       DATE        NOT NULL,
+    updated_at      TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS strategy_signal (
+    signal_key      VARCHAR(64) NOT NULL,
+    date            DATE        NOT NULL,
+    level           DOUBLE PRECISION,          -- e.g. 10Y-2Y slope
+    value           DOUBLE PRECISION,          -- rolling mean of level
+    PRIMARY KEY (signal_key, date)
+);
+
+-- ------------------------------------------------------------
+-- 4. Distributed Backtest Jobs (quant_engine/interface/job_queue.py)
+-- ------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS backtest_job (
+    job_id          BIGSERIAL   PRIMARY KEY,
+    batch_id        VARCHAR(64),               -- jobs submitted together (e.g. one sweep)
+    strategy_id     TEXT        NOT NULL,
+    params          JSONB       NOT NULL,      -- run_backtest() params
+    point           JSONB,                     -- grid point of a sweep job
+    status          VARCHAR(16) NOT NULL DEFAULT 'queued',  -- queued | running | done | failed
+    attempts        INTEGER     NOT NULL DEFAULT 0,
+    max_attempts    INTEGER     NOT NULL DEFAULT 3,
+    worker_id       TEXT,
+    heartbeat_at    TIMESTAMPTZ,
+    result          JSONB,                     -- backtest_id, metrics, period
+    error           TEXT,
+    created_at      TIMESTAMPTZ NOT NULL DEFAULT now(),
+    started_at      TIMESTAMPTZ,
+    finished_at     TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_backtest_job_status
+    ON backtest_job (status, job_id);
+
+CREATE INDEX IF NOT EXISTS idx_backtest_job_batch
+    ON backtest_job (batch_id);
+
+-- ------------------------------------------------------------
+-- 5. Paper Trading State (quant_engine/interface/paper_trading.py)
+-- ------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS paper_portfolio (
+    portfolio_id    TEXT        PRIMARY KEY,
+    strategy_id     TEXT        NOT NULL,
+    params_key      TEXT        NOT NULL,      -- path-relevant params the state was built with
+    last_date       DATE        NOT NULL,      -- last bar evaluated
+    cash            DOUBLE PRECISION NOT NULL,
+    equity          DOUBLE PRECISION NOT NULL, -- account value at last_date's close
+    positions       JSONB       NOT NULL,      -- {symbol: [size, avg price]}
+    strategy_state  JSONB       NOT NULL,      -- StrategyBase.get_state() + rebalance period
+    targets         JSONB       NOT NULL,      -- target weights decided on last_date
+    updated_at      TIMESTAMPTZ NOT NULL DEFAULT now()
+);
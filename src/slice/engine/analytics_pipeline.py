@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
+from slice.quant_engine.core.results import ColumnarBacktestResult
 from slice.quant_engine.interface.run_backtest import run_backtest
 from slice.risk.aggregator import aggregate_from_backtest
 from slice.risk.report import build_risk_report
-from slice.risk.schemas import BacktestResult, PortfolioReturnSeries, RiskReport
+from slice.risk.schemas import PortfolioReturnSeries, RiskReport
 
 def run_backtest_with_risk(
     strategy_id: str,
@@ -19,7 +20,7 @@ def run_backtest_with_risk(
     """
     Phase 3 orchestration entrypoint.
 
-    1. Calls Dev A's run_backtest(...) → BacktestResult
+    1. Calls Dev A's run_backtest(...) → ColumnarBacktestResult
     2. Aggregates into a PortfolioReturnSeries via aggregate_from_backtest(...)
     3. Builds a RiskReport via build_risk_report(...)
     """
@@ -33,8 +34,11 @@ def run_backtest_with_risk(
     if portfolio_id is None:
         portfolio_id = f"PORT_{strategy_id}"
 
-    # 1) Dev A – backtest
-    backtest: BacktestResult = run_backtest(strategy_id=strategy_id, params=params)
+    # 1) Dev A – backtest (columnar: aggregated from arrays, no per-bar models)
+    backtest: ColumnarBacktestResult = run_backtest(
+        strategy_id=strategy_id,
+        params={**params, "result_format": "columnar"},
+    )
 
     # 2) Dev B – aggregate to portfolio series
     portfolio: PortfolioReturnSeries = aggregate_from_backtest(
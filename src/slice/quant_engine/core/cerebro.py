@@ -2,60 +2,114 @@
 
 from __future__ import annotations
 
-from typing import Dict, Type, List, Tuple
+from time import perf_counter
+from typing import Any, Dict, Mapping, Optional, Sequence, Type, List, Tuple, Union
 
 import backtrader as bt
+import numpy as np
 import pandas as pd
 
 from slice.quant_engine.data.feed import SlicePandasData
-from slice.quant_engine.strategies.strategy_base import StrategyBase
+from slice.quant_engine.strategies.strategy_base import StrategyBase, bt_dates
+
+
+# "standard": TimeReturn / SharpeRatio / DrawDown plus Backtrader's default
+# observers. "none": only EquityRecorder; metrics are computed afterwards.
+ANALYZER_SETS = ("standard", "none")
+
+# A loaded OHLCV frame, or a ready Backtrader feed such as SliceStreamingData.
+PriceInput = Union[pd.DataFrame, bt.feed.AbstractDataBase]
+
+
+class EquityRecorder(bt.Analyzer):
+    """
+    Minimal analyzer: broker value at the end of every bar, with the bar's
+    date. Stands in for TimeReturn / SharpeRatio / DrawDown
+    when metrics are computed post hoc from the equity array.
+
+    With sub_account=True it records the strategy's own sub-account value
+    (StrategyBase.account_value()) instead of the shared broker value.
+    """
+
+    params = (("sub_account", False),)
+
+    def start(self) -> None:
+        self.dts: List[float] = []
+        self.values: List[float] = []
+        self._value = self.strategy.broker.getvalue()
+
+    def notify_cashvalue(self, cash: float, value: float) -> None:
+        self._value = value
+
+    def next(self) -> None:
+        self.dts.append(self.strategy.datetime[0])
+        self.values.append(self.strategy.account_value() if self.p.sub_account else self._value)
+
+    def get_analysis(self) -> Dict[str, np.ndarray]:
+        return {
+            "date": bt_dates(np.asarray(self.dts, dtype=float)),
+            "value": np.asarray(self.values, dtype=float),
+        }
 
 
 def build_cerebro(
     strategy_cls: Type[StrategyBase],
-    price_data: Dict[str, pd.DataFrame],
+    price_data: Dict[str, PriceInput],
     cash: float = 100_000.0,
     commission: float = 0.0,
+    strategy_params: Optional[Mapping[str, Any]] = None,
+    analyzers: str = "standard",
+    preload: bool = True,
+    exactbars: int = 0,
 ) -> bt.Cerebro:
     """
     Construct a Backtrader Cerebro engine with:
       - given StrategyBase subclass
       - dict of {symbol: price_dataframe}
       - basic broker configuration
-      - standard analyzers (returns, sharpe, drawdown)
+      - standard analyzers (returns, sharpe, drawdown), or with
+        analyzers="none" only an EquityRecorder and no observers
 
     Parameters
     ----------
     strategy_cls : subclass of StrategyBase
     price_data   : mapping of symbol -> pandas DataFrame (OHLCV, datetime index)
+                   or Backtrader feed (e.g. SliceStreamingData)
     cash         : initial cash
     commission   : per-trade commission fraction (0.001 = 10 bps)
+    strategy_params : extra params passed to the strategy (e.g. target_long)
+    analyzers    : "standard" | "none", see ANALYZER_SETS
+    preload      : preload every feed before the run (Backtrader default);
+                   False lets streaming feeds deliver bars as they are read
+    exactbars    : Backtrader exactbars; 1 keeps only the bars needed by
+                   lookback windows (implies no preload / runonce)
 
     Returns
     -------
     bt.Cerebro
     """
-    c = bt.Cerebro()
+    if analyzers not in ANALYZER_SETS:
+        raise ValueError(f"Unknown analyzers '{analyzers}'. Supported: {list(ANALYZER_SETS)}")
+
+    c = bt.Cerebro(
+        stdstats=analyzers == "standard",
+        preload=preload,
+        runonce=preload,
+        exactbars=exactbars,
+    )
 
     # Broker setup
     c.broker.setcash(cash)
     c.broker.setcommission(commission=commission)
 
-    # Add data feeds
-    symbols: List[str] = []
-    for symbol, df in price_data.items():
-        if not isinstance(df, pd.DataFrame):
-            raise TypeError(f"price_data[{symbol}] is not a DataFrame")
-
-        # deterministic index order
-        df = df.sort_index()
-
-        data_feed = SlicePandasData(dataname=df)
-        c.adddata(data_feed, name=symbol)
-        symbols.append(symbol)
+    symbols = _add_feeds(c, price_data)
 
     # Add strategy
-    c.addstrategy(strategy_cls, symbols=symbols)
+    c.addstrategy(strategy_cls, symbols=symbols, **dict(strategy_params or {}))
+
+    if analyzers == "none":
+        c.addanalyzer(EquityRecorder, _name="equity")
+        return c
 
     # Standard analyzers for Dev A contract
     c.addanalyzer(
@@ -77,38 +131,118 @@ def build_cerebro(
     return c
 
 
+def _add_feeds(c: bt.Cerebro, price_data: Dict[str, PriceInput]) -> List[str]:
+    symbols: List[str] = []
+    for symbol, df in price_data.items():
+        if isinstance(df, bt.feed.AbstractDataBase):
+            c.adddata(df, name=symbol)
+            symbols.append(symbol)
+            continue
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError(f"price_data[{symbol}] is neither a DataFrame nor a Backtrader feed")
+
+        # deterministic index order
+        df = df.sort_index()
+
+        data_feed = SlicePandasData(dataname=df)
+        c.adddata(data_feed, name=symbol)
+        symbols.append(symbol)
+    return symbols
+
+
 def run_cerebro(
     strategy_cls: Type[StrategyBase],
-    price_data: Dict[str, pd.DataFrame],
+    price_data: Dict[str, PriceInput],
     cash: float = 100_000.0,
     commission: float = 0.0,
+    strategy_params: Optional[Mapping[str, Any]] = None,
+    analyzers: str = "standard",
+    preload: bool = True,
+    exactbars: int = 0,
+    instrument: bool = False,
 ) -> Tuple[StrategyBase, Dict[str, bt.Analyzer]]:
     """
     Convenience wrapper:
       - builds Cerebro
       - runs it
-      - returns (strategy_instance, analyzers)
+      - returns (strategy_instance, analyzers), where analyzers is
+        {"returns", "sharpe", "drawdown"} or {"equity"} for analyzers="none"
+
+    With instrument=True the strategy runs with its `instrument` param set
+    and strat.profiler also holds the wall time of building Cerebro and of
+    the run (feed preloading, strategy setup, all bars).
 
     This will later be called by the run_backtest() interface layer.
     """
+    if instrument:
+        strategy_params = dict(strategy_params or {}, instrument=True)
+
+    t0 = perf_counter()
     cerebro = build_cerebro(
         strategy_cls=strategy_cls,
         price_data=price_data,
         cash=cash,
         commission=commission,
+        strategy_params=strategy_params,
+        analyzers=analyzers,
+        preload=preload,
+        exactbars=exactbars,
     )
 
+    t1 = perf_counter()
     results = cerebro.run()
     if not results:
         raise RuntimeError("Cerebro.run() returned no strategies")
 
     # We only support a single strategy instance
     strat: StrategyBase = results[0]
+    if strat.profiler is not None:
+        strat.profiler.add_phase("cerebro_build", t1 - t0)
+        strat.profiler.add_phase("cerebro_run", perf_counter() - t1)
+
+    if analyzers == "none":
+        return strat, {"equity": strat.analyzers.equity}
 
-    analyzers: Dict[str, bt.Analyzer] = {
+    return strat, {
         "returns": strat.analyzers.returns,
         "sharpe": strat.analyzers.sharpe,
         "drawdown": strat.analyzers.drawdown,
     }
 
-    return strat, analyzers
\ No newline at end of file
+
+def run_cerebro_combined(
+    strategies: Sequence[Tuple[Type[StrategyBase], Mapping[str, Any]]],
+    price_data: Dict[str, pd.DataFrame],
+    commission: float = 0.0,
+) -> List[Tuple[StrategyBase, Dict[str, bt.Analyzer]]]:
+    """
+    Run several strategies in one Cerebro pass over shared feeds.
+
+    Each (strategy_cls, params) must set params["symbols"] (its feeds) and
+    params["sub_account"] (its starting cash). Strategies size and book
+    orders against their own sub-account; the broker holds the sum of the
+    sub-account cash. Each strategy gets a sub-account EquityRecorder.
+
+    Returns [(strategy_instance, {"equity": recorder}), ...] in input order.
+    """
+    c = bt.Cerebro(stdstats=False)
+
+    total_cash = 0.0
+    for _, params in strategies:
+        if params.get("sub_account") is None or not params.get("symbols"):
+            raise ValueError("combined strategies need 'symbols' and 'sub_account' params.")
+        total_cash += float(params["sub_account"])
+
+    c.broker.setcash(total_cash)
+    c.broker.setcommission(commission=commission)
+    _add_feeds(c, price_data)
+
+    for strategy_cls, params in strategies:
+        c.addstrategy(strategy_cls, **dict(params))
+    c.addanalyzer(EquityRecorder, _name="equity", sub_account=True)
+
+    results = c.run()
+    if len(results) != len(strategies):
+        raise RuntimeError("Cerebro.run() did not return every strategy")
+
+    return [(strat, {"equity": strat.analyzers.equity}) for strat in results]
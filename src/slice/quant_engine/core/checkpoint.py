@@ -0,0 +1,68 @@
+# src/slice/quant_engine/core/checkpoint.py
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+# Keys of run_backtest params that do not change the simulated path and
+# therefore do not invalidate a checkpoint.
+_NON_PATH_KEYS = {"end", "checkpoint", "cache", "result_format", "analyzers", "streaming", "exactbars", "regimes", "instrument"}
+
+
+@dataclass
+class BacktestCheckpoint:
+    """
+    End state of a Backtrader run_backtest() call, enough to continue the
+    run over bars after `last_date` and merge the results.
+
+    positions       : {symbol: [size, average_price]} at the close of last_date
+    strategy_state  : StrategyBase.get_state() of the strategy instance
+    returns         : [[iso_date, return], ...] of the run so far
+    orders / trades : order_log / trade_log records with isoformat datetimes
+    """
+    strategy_id: str
+    params_key: str
+    last_date: str
+    cash: float
+    positions: Dict[str, List[float]] = field(default_factory=dict)
+    strategy_state: Dict[str, Any] = field(default_factory=dict)
+    returns: List[Tuple[str, float]] = field(default_factory=list)
+    orders: List[Dict[str, Any]] = field(default_factory=list)
+    trades: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def checkpoint_params_key(params: Dict[str, Any]) -> str:
+    """
+    Canonical JSON of the params that determine the simulated path.
+    A checkpoint is only resumed for an identical key.
+    """
+    relevant = {k: v for k, v in params.items() if k not in _NON_PATH_KEYS}
+    return json.dumps(relevant, sort_keys=True, default=str)
+
+
+def load_checkpoint(path: Union[str, Path]) -> Optional[BacktestCheckpoint]:
+    """
+    Read a checkpoint written by save_checkpoint(); None if it does not exist.
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    raw["returns"] = [tuple(item) for item in raw.get("returns", [])]
+    return BacktestCheckpoint(**raw)
+
+
+def save_checkpoint(path: Union[str, Path], checkpoint: BacktestCheckpoint) -> None:
+    """
+    Atomically write `checkpoint` as JSON (write to a temp file, then rename).
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(asdict(checkpoint), default=str), encoding="utf-8")
+    os.replace(tmp, path)
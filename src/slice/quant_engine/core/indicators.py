@@ -0,0 +1,383 @@
+# src/slice/quant_engine/core/indicators.py
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+I = TypeVar("I", bound="Indicator")
+
+
+class Indicator:
+    """
+    Incremental indicator: update(x) consumes one observation in O(1)
+    (amortized for min/max) and returns the current value, NaN until the
+    indicator is warmed up.
+
+    batch(values) computes the whole output array with NumPy and leaves
+    the indicator in the same state as feeding `values` one by one, so a
+    run can switch from the batch path to per-bar updates.
+
+    get_state() / from_state() round-trip the __slots__ state as a dict of
+    plain floats / ints / lists (json.dump writes NaN), e.g. inside
+    StrategyBase.get_state() for checkpoints. Slots listed in _derived are
+    rebuilt from the rest on restore instead of being stored.
+    """
+
+    __slots__ = ()
+    _derived: Tuple[str, ...] = ()
+
+    def update(self, x: float) -> float:
+        raise NotImplementedError
+
+    @property
+    def value(self) -> float:
+        raise NotImplementedError
+
+    def batch(self, values: Iterable[float]) -> np.ndarray:
+        values = np.asarray(values, dtype=float)
+        return np.fromiter((self.update(x) for x in values), dtype=float, count=len(values))
+
+    def get_state(self) -> Dict[str, Any]:
+        state: Dict[str, Any] = {}
+        for name in self._state_slots():
+            value = getattr(self, name)
+            state[name] = list(value) if isinstance(value, list) else value
+        return state
+
+    @classmethod
+    def from_state(cls: Type[I], state: Dict[str, Any]) -> I:
+        obj = cls.__new__(cls)
+        for name in obj._state_slots():
+            value = state[name]
+            setattr(obj, name, list(value) if isinstance(value, list) else value)
+        obj._restore()
+        return obj
+
+    def _state_slots(self) -> List[str]:
+        names = [s for klass in type(self).__mro__ for s in getattr(klass, "__slots__", ())]
+        return [s for s in names if s not in self._derived]
+
+    def _restore(self) -> None:
+        """
+        Rebuild the _derived slots after from_state().
+        """
+
+
+class _Window(Indicator):
+    """
+    Ring buffer of the last `window` observations. Subclasses keep their
+    running aggregates over its finite values in _add() / _remove().
+    """
+
+    __slots__ = ("window", "_buf", "_pos", "_count", "_nans")
+
+    def __init__(self, window: int) -> None:
+        if int(window) < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        self.window = int(window)
+        self._buf = [0.0] * self.window
+        self._pos = 0
+        self._count = 0
+        self._nans = 0
+        self._reset()
+
+    @property
+    def ready(self) -> bool:
+        return self._count >= self.window and self._nans == 0
+
+    def update(self, x: float) -> float:
+        x = float(x)
+        if self._count >= self.window:
+            old = self._buf[self._pos]
+            if math.isnan(old):
+                self._nans -= 1
+            else:
+                self._remove(old)
+        else:
+            self._count += 1
+
+        self._buf[self._pos] = x
+        self._pos = (self._pos + 1) % self.window
+        if math.isnan(x):
+            self._nans += 1
+        else:
+            self._add(x)
+        return self.value
+
+    def _ordered(self) -> List[float]:
+        """
+        Buffered observations, oldest first.
+        """
+        n = self._count
+        return [self._buf[(self._pos - n + k) % self.window] for k in range(n)]
+
+    def _reset(self) -> None:
+        raise NotImplementedError
+
+    def _add(self, x: float) -> None:
+        raise NotImplementedError
+
+    def _remove(self, x: float) -> None:
+        raise NotImplementedError
+
+    def _restore(self) -> None:
+        # Replay the buffer into fresh aggregates (also undoes float drift)
+        ordered = self._ordered()
+        self._reset()
+        for x in ordered:
+            if not math.isnan(x):
+                self._add(x)
+
+    def _batch_output(self, values: np.ndarray, reduce) -> np.ndarray:
+        """
+        reduce(windows) over every full window, then the state that
+        update() would have reached feeding `values` to a fresh indicator.
+        """
+        out = np.full(len(values), np.nan)
+        if len(values) >= self.window:
+            out[self.window - 1:] = reduce(sliding_window_view(values, self.window))
+
+        tail = values[-self.window:].tolist()
+        self._count = len(tail)
+        self._buf = tail + [0.0] * (self.window - len(tail))
+        self._pos = len(tail) % self.window
+        self._nans = sum(1 for x in tail if math.isnan(x))
+        self._restore()
+        return out
+
+
+class RollingMean(_Window):
+    """
+    Mean of the last `window` observations.
+    """
+
+    __slots__ = ("_sum",)
+    _derived = ("_sum",)
+
+    def _reset(self) -> None:
+        self._sum = 0.0
+
+    def _add(self, x: float) -> None:
+        self._sum += x
+
+    def _remove(self, x: float) -> None:
+        self._sum -= x
+
+    @property
+    def value(self) -> float:
+        return self._sum / self.window if self.ready else math.nan
+
+    def batch(self, values: Iterable[float]) -> np.ndarray:
+        return self._batch_output(np.asarray(values, dtype=float), lambda w: w.mean(axis=1))
+
+
+class RollingStd(_Window):
+    """
+    Standard deviation of the last `window` observations (ddof=1 like
+    pandas), kept with Welford's add/remove updates.
+    """
+
+    __slots__ = ("ddof", "_n", "_mean", "_m2")
+    _derived = ("_n", "_mean", "_m2")
+
+    def __init__(self, window: int, ddof: int = 1) -> None:
+        if int(window) - int(ddof) < 1:
+            raise ValueError(f"window must exceed ddof, got window={window}, ddof={ddof}")
+        self.ddof = int(ddof)
+        super().__init__(window)
+
+    def _reset(self) -> None:
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def _add(self, x: float) -> None:
+        self._n += 1
+        delta = x - self._mean
+        self._mean += delta / self._n
+        self._m2 += delta * (x - self._mean)
+
+    def _remove(self, x: float) -> None:
+        self._n -= 1
+        if self._n == 0:
+            self._reset()
+            return
+        delta = x - self._mean
+        self._mean -= delta / self._n
+        self._m2 -= delta * (x - self._mean)
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self.ready else math.nan
+
+    @property
+    def value(self) -> float:
+        if not self.ready:
+            return math.nan
+        return math.sqrt(max(self._m2, 0.0) / (self.window - self.ddof))
+
+    def batch(self, values: Iterable[float]) -> np.ndarray:
+        return self._batch_output(
+            np.asarray(values, dtype=float), lambda w: w.std(axis=1, ddof=self.ddof)
+        )
+
+
+class RollingZScore(RollingStd):
+    """
+    (x - rolling mean) / rolling std over the last `window` observations,
+    x included. NaN while the std is zero.
+    """
+
+    __slots__ = ()
+
+    @property
+    def value(self) -> float:
+        std = super().value
+        if math.isnan(std) or std == 0.0:
+            return math.nan
+        last = self._buf[(self._pos - 1) % self.window]
+        return (last - self._mean) / std
+
+    def batch(self, values: Iterable[float]) -> np.ndarray:
+        def zscore(w: np.ndarray) -> np.ndarray:
+            std = w.std(axis=1, ddof=self.ddof)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                z = (w[:, -1] - w.mean(axis=1)) / std
+            return np.where(std == 0.0, np.nan, z)
+
+        return self._batch_output(np.asarray(values, dtype=float), zscore)
+
+
+class _RollingExtreme(_Window):
+    """
+    Rolling min/max from a monotonic deque of (sequence number, value):
+    amortized O(1) per update.
+    """
+
+    __slots__ = ("_seen", "_deque")
+    _derived = ("_deque",)
+    _sign = 1.0   # +1 keeps the minimum at the front, -1 the maximum
+
+    def __init__(self, window: int) -> None:
+        self._seen = 0
+        super().__init__(window)
+
+    def update(self, x: float) -> float:
+        self._seen += 1
+        return super().update(x)
+
+    @property
+    def value(self) -> float:
+        return self._deque[0][1] if self.ready else math.nan
+
+    def _reset(self) -> None:
+        self._deque = deque()
+
+    def _add(self, x: float) -> None:
+        self._append(self._seen, x)
+
+    def _remove(self, x: float) -> None:
+        # the observation leaving the window has sequence number _seen - window
+        while self._deque and self._deque[0][0] <= self._seen - self.window:
+            self._deque.popleft()
+
+    def _append(self, seq: int, x: float) -> None:
+        key = self._sign * x
+        while self._deque and self._sign * self._deque[-1][1] >= key:
+            self._deque.pop()
+        self._deque.append((seq, x))
+
+    def _restore(self) -> None:
+        ordered = self._ordered()
+        first = self._seen - len(ordered) + 1
+        self._reset()
+        for k, x in enumerate(ordered):
+            if not math.isnan(x):
+                self._append(first + k, x)
+
+    def _batch_output(self, values: np.ndarray, reduce) -> np.ndarray:
+        self._seen = len(values)
+        return super()._batch_output(values, reduce)
+
+
+class RollingMin(_RollingExtreme):
+    """
+    Minimum of the last `window` observations.
+    """
+
+    __slots__ = ()
+    _sign = 1.0
+
+    def batch(self, values: Iterable[float]) -> np.ndarray:
+        return self._batch_output(np.asarray(values, dtype=float), lambda w: w.min(axis=1))
+
+
+class RollingMax(_RollingExtreme):
+    """
+    Maximum of the last `window` observations.
+    """
+
+    __slots__ = ()
+    _sign = -1.0
+
+    def batch(self, values: Iterable[float]) -> np.ndarray:
+        return self._batch_output(np.asarray(values, dtype=float), lambda w: w.max(axis=1))
+
+
+class EWMA(Indicator):
+    """
+    Exponentially weighted moving average, as pandas
+    ewm(span=... | alpha=..., adjust=..., ignore_na=True).mean(): NaN
+    observations are skipped. NaN until `min_periods` observations.
+    """
+
+    __slots__ = ("alpha", "adjust", "min_periods", "_num", "_den", "_count")
+
+    def __init__(
+        self,
+        span: Optional[float] = None,
+        alpha: Optional[float] = None,
+        adjust: bool = True,
+        min_periods: int = 1,
+    ) -> None:
+        if (span is None) == (alpha is None):
+            raise ValueError("EWMA needs exactly one of span or alpha.")
+        if span is not None:
+            if span < 1:
+                raise ValueError(f"span must be >= 1, got {span}")
+            alpha = 2.0 / (span + 1.0)
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+        self.alpha = float(alpha)
+        self.adjust = bool(adjust)
+        self.min_periods = int(min_periods)
+        self._num = 0.0
+        self._den = 0.0
+        self._count = 0
+
+    def update(self, x: float) -> float:
+        x = float(x)
+        if not math.isnan(x):
+            decay = 1.0 - self.alpha
+            if self.adjust:
+                # weighted sum / sum of weights, weights (1 - alpha)^age
+                self._num = x + decay * self._num
+                self._den = 1.0 + decay * self._den
+            elif self._count == 0:
+                self._num, self._den = x, 1.0
+            else:
+                self._num = decay * self._num + self.alpha * x
+            self._count += 1
+        return self.value
+
+    @property
+    def value(self) -> float:
+        if self._count == 0 or self._count < self.min_periods:
+            return math.nan
+        return self._num / self._den
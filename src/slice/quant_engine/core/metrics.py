@@ -0,0 +1,70 @@
+# src/slice/quant_engine/core/metrics.py
+
+from __future__ import annotations
+
+from typing import Any, Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+from slice.risk.metrics import compute_return_stats
+
+
+def compute_backtest_metrics(returns: np.ndarray) -> Dict[str, Any]:
+    """
+    Compute the run_backtest() metrics dict from an array of per-bar returns,
+    via risk.metrics.compute_return_stats() (the Dev B risk metrics code).
+
+    Definitions mirror the Backtrader analyzers attached by build_cerebro():
+      - total_return     : Π(1 + r_t) - 1
+      - sharpe           : mean(r) / std(r) (population std, not annualized,
+                           riskfreerate=0), as bt.analyzers.SharpeRatio
+      - max_drawdown     : peak-to-trough decline of equity, in percent
+      - max_drawdown_len : longest run of bars spent below a prior peak
+
+    Returns
+    -------
+    dict with keys total_return, sharpe, max_drawdown, max_drawdown_len
+    """
+    r = np.asarray(returns, dtype=float)
+
+    if r.size == 0:
+        return {
+            "total_return": None,
+            "sharpe": None,
+            "max_drawdown": None,
+            "max_drawdown_len": None,
+        }
+
+    stats = compute_return_stats(r, annualize=False, ddof=0, drawdown_from_initial=True)
+    stats["max_drawdown"] = abs(stats["max_drawdown"]) * 100.0
+    return stats
+
+
+def compute_grouped_metrics(returns: np.ndarray, labels: Sequence[Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    compute_backtest_metrics() for every group of bars sharing a label
+    (a regime, a calendar year), from one groupby over the run's returns.
+
+    Each group is scored as its own return series: its bars compound in
+    date order from 1.0, skipping the bars of other groups, so the
+    drawdown of a regime is the drawdown of holding the strategy only
+    while that regime is on. Bars labelled None / NaN are left out.
+
+    Returns
+    -------
+    {label: dict with keys bars, total_return, sharpe, max_drawdown,
+    max_drawdown_len}, labels as strings in sorted order
+    """
+    r = np.asarray(returns, dtype=float)
+    labels = pd.Series(np.asarray(labels, dtype=object))
+    if len(labels) != r.size:
+        raise ValueError(f"Got {len(labels)} labels for {r.size} returns.")
+
+    frame = pd.DataFrame({"label": labels.where(labels.notna()).map(str, na_action="ignore"), "r": r})
+    frame = frame.dropna(subset=["label"])
+
+    return {
+        label: {"bars": int(group.size), **compute_backtest_metrics(group.to_numpy())}
+        for label, group in frame.groupby("label", sort=True)["r"]
+    }
@@ -0,0 +1,83 @@
+# src/slice/quant_engine/core/profiling.py
+
+from __future__ import annotations
+
+from collections import defaultdict
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+
+class BarProfiler:
+    """
+    Wall-time samples of the per-bar hot path of one strategy run.
+
+    StrategyBase creates one when its `instrument` param is set and routes
+    compute_target_weights(), order submission and notify_order() through
+    call(); without it those paths run as before behind a single `is None`
+    check per call. Samples are kept in nanoseconds and only reduced to
+    summaries in summary().
+    """
+
+    def __init__(self) -> None:
+        self.samples: Dict[str, List[int]] = defaultdict(list)
+        self.orders_per_bar: List[int] = []
+        self.phases: Dict[str, float] = {}
+
+    def call(self, section: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        fn(*args), recording its wall time under `section`.
+        """
+        t0 = perf_counter_ns()
+        result = fn(*args)
+        self.samples[section].append(perf_counter_ns() - t0)
+        return result
+
+    def count_orders(self, n: int) -> None:
+        self.orders_per_bar.append(int(n))
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        """
+        Wall time of a whole run phase (building Cerebro, running it, ...).
+        """
+        self.phases[name] = self.phases.get(name, 0.0) + float(seconds)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        JSON-serializable summary: phase times in seconds, per-section
+        duration statistics (see duration_summary) and the distribution of
+        orders submitted per bar.
+        """
+        orders = np.asarray(self.orders_per_bar, dtype=np.int64)
+        counts = np.bincount(orders) if orders.size else np.zeros(0, dtype=np.int64)
+        return {
+            **{f"{name}_s": seconds for name, seconds in self.phases.items()},
+            "sections": {name: duration_summary(ns) for name, ns in sorted(self.samples.items())},
+            "orders_per_bar": {
+                "bars": int(orders.size),
+                "total": int(orders.sum()),
+                "mean": float(orders.mean()) if orders.size else 0.0,
+                "max": int(orders.max()) if orders.size else 0,
+                "histogram": {str(k): int(c) for k, c in enumerate(counts) if c},
+            },
+        }
+
+
+def duration_summary(samples_ns: List[int]) -> Dict[str, Any]:
+    """
+    calls, total seconds and mean / p50 / p90 / p99 / max in microseconds.
+    """
+    us = np.asarray(samples_ns, dtype=float) / 1_000.0
+    if us.size == 0:
+        return {"calls": 0, "total_s": 0.0}
+    p50, p90, p99 = np.percentile(us, [50, 90, 99])
+    return {
+        "calls": int(us.size),
+        "total_s": float(us.sum() / 1e6),
+        "mean_us": float(us.mean()),
+        "p50_us": float(p50),
+        "p90_us": float(p90),
+        "p99_us": float(p99),
+        "max_us": float(us.max()),
+    }
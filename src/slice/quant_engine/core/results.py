@@ -0,0 +1,170 @@
+# src/slice/quant_engine/core/results.py
+
+from __future__ import annotations
+
+import copy
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from slice.risk.schemas import BacktestResult, StrategyReturnSeries, TimeSeriesPoint
+
+
+@dataclass
+class ColumnarBacktestResult:
+    """
+    Array-backed output of one strategy backtest.
+
+    Holds what run_backtest() computes without building per-bar Python
+    objects; the Pydantic BacktestResult (one TimeSeriesPoint per bar) is
+    only materialized by to_backtest_result() for JSON / LLM consumers.
+
+    dates     : datetime64[D] bar dates
+    returns   : float64 per-bar portfolio returns (net of commission)
+    equity    : float64 portfolio value at each close
+    positions : len(dates) × len(symbols) shares held at each close
+    orders / trades : raw order_log / trade_log records of the run
+    """
+    backtest_id: str
+    strategy_id: str
+    frequency: str
+    dates: np.ndarray
+    returns: np.ndarray
+    equity: np.ndarray
+    symbols: List[str]
+    positions: np.ndarray
+    orders: List[dict] = field(default_factory=list)
+    trades: List[dict] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return int(self.dates.shape[0])
+
+    # ---------- Array views ----------
+
+    def returns_series(self) -> pd.Series:
+        return pd.Series(self.returns, index=pd.DatetimeIndex(self.dates, name="date"), name=self.strategy_id)
+
+    def equity_series(self) -> pd.Series:
+        return pd.Series(self.equity, index=pd.DatetimeIndex(self.dates, name="date"), name=self.strategy_id)
+
+    def positions_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.positions, index=pd.DatetimeIndex(self.dates, name="date"), columns=self.symbols)
+
+    def strategy_returns(self) -> Dict[str, pd.Series]:
+        """
+        {strategy_id: date-indexed return series}; consumed directly by
+        risk.aggregator.aggregate_from_backtest().
+        """
+        return {self.strategy_id: self.returns_series()}
+
+    # ---------- Materialization ----------
+
+    def to_points(self) -> List[TimeSeriesPoint]:
+        """
+        TimeSeriesPoint per bar. Values come from typed arrays, so Pydantic
+        validation is skipped (model_construct).
+        """
+        return [
+            TimeSeriesPoint.model_construct(date=d, value=v)
+            for d, v in zip(self.dates.tolist(), self.returns.tolist())
+        ]
+
+    def to_backtest_result(self) -> BacktestResult:
+        series = StrategyReturnSeries.model_construct(
+            strategy_id=self.strategy_id,
+            frequency=self.frequency,
+            returns=self.to_points(),
+        )
+        return BacktestResult.model_construct(
+            backtest_id=self.backtest_id,
+            frequency=self.frequency,
+            strategies=[series],
+            metadata=copy.deepcopy(self.metadata),
+        )
+
+    def copy(self) -> "ColumnarBacktestResult":
+        return copy.deepcopy(self)
+
+    # ---------- Storage ----------
+
+    def save_npz(self, fh) -> None:
+        """
+        Write arrays plus a JSON header (ids, orders, trades, metadata) to an
+        open binary file as .npz. Datetimes in orders/trades become strings.
+        """
+        header = {
+            "backtest_id": self.backtest_id,
+            "strategy_id": self.strategy_id,
+            "frequency": self.frequency,
+            "orders": self.orders,
+            "trades": self.trades,
+            "metadata": self.metadata,
+        }
+        np.savez(
+            fh,
+            dates=self.dates.astype("datetime64[D]").astype(np.int64),
+            returns=self.returns,
+            equity=self.equity,
+            symbols=np.array(self.symbols, dtype=str),
+            positions=self.positions,
+            header=np.array(json.dumps(header, default=str)),
+        )
+
+    @classmethod
+    def load_npz(cls, fh) -> "ColumnarBacktestResult":
+        with np.load(fh, allow_pickle=False) as npz:
+            header = json.loads(str(npz["header"]))
+            return cls(
+                dates=npz["dates"].astype("datetime64[D]"),
+                returns=npz["returns"],
+                equity=npz["equity"],
+                symbols=[str(s) for s in npz["symbols"]],
+                positions=npz["positions"],
+                **header,
+            )
+
+
+def backtest_id_for(strategy_id: str, dates: np.ndarray) -> str:
+    if len(dates) == 0:
+        return f"{strategy_id}_EMPTY"
+    return f"{strategy_id}_{dates[0]}_{dates[-1]}"
+
+
+def positions_from_orders(
+    dates: np.ndarray,
+    symbols: Sequence[str],
+    orders: Sequence[dict],
+) -> np.ndarray:
+    """
+    Shares held at each close, accumulated from executed order records
+    (symbol, size, datetime of execution) starting flat.
+    """
+    positions = np.zeros((len(dates), len(symbols)))
+    column = {s: i for i, s in enumerate(symbols)}
+
+    if len(dates) and orders:
+        when = pd.to_datetime([o["datetime"] for o in orders]).values.astype("datetime64[D]")
+        rows = np.searchsorted(dates, when)
+        cols = np.array([column.get(o["symbol"], -1) for o in orders])
+        sizes = np.array([float(o["size"]) for o in orders])
+        keep = (rows < len(dates)) & (cols >= 0)
+        np.add.at(positions, (rows[keep], cols[keep]), sizes[keep])
+
+    return np.cumsum(positions, axis=0)
+
+
+def positions_from_fills(dates: np.ndarray, n_symbols: int, fills: np.ndarray) -> np.ndarray:
+    """
+    positions_from_orders() for a FILL_DTYPE log (core/trade_log.py),
+    whose symbol codes index the result's symbols.
+    """
+    positions = np.zeros((len(dates), n_symbols))
+    if len(dates) and len(fills):
+        rows = np.searchsorted(dates, fills["day"].astype("datetime64[D]"))
+        keep = rows < len(dates)
+        np.add.at(positions, (rows[keep], fills["symbol"][keep]), fills["size"][keep])
+    return np.cumsum(positions, axis=0)
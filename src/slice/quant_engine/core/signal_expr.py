@@ -0,0 +1,250 @@
+# src/slice/quant_engine/core/signal_expr.py
+
+from __future__ import annotations
+
+import ast
+import operator
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from slice.quant_engine.data.signal_store import SignalSpec, SignalStore, get_signal_store
+
+
+# Grammar (Python expression syntax, nothing else is accepted):
+#   names            econ_data series ids, e.g. DGS10, T10YIE
+#   numbers          1, 0.5
+#   + - * /          arithmetic, unary - and +
+#   > >= < <= == !=  one comparison per pair of operands (no chains)
+#   and, or, not     combine conditions
+#   ma(x, n)         rolling mean of x over its last n observations
+#   ma(n)            as a comparison operand: ma of the other operand,
+#                    e.g. "DGS10 - DGS2 > ma(60)"
+
+_BINARY: Dict[type, Callable] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+_COMPARE: Dict[type, Callable] = {
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+}
+
+
+@dataclass(frozen=True)
+class SignalExpression:
+    """
+    A parsed signal expression over econ_data series.
+
+    evaluate() computes it in one vectorized NumPy pass over the dates on
+    which every referenced series has a value (rolling means use the
+    signal store, so they are shared with the strategies and reused across
+    runs). Conditions evaluate to 1.0 / 0.0, and to NaN where an operand
+    is NaN (e.g. a rolling mean still warming up), so "no signal yet"
+    stays distinguishable from "off".
+    """
+    text: str
+    tree: ast.Expression
+    series_ids: Tuple[str, ...]
+    is_condition: bool
+
+    def evaluate(
+        self,
+        frames: Mapping[str, pd.DataFrame],
+        store: Optional[SignalStore] = None,
+    ) -> Optional[pd.Series]:
+        """
+        Expression values indexed by date, from {series_id: frame with
+        date | value}. None if the series have no date in common.
+        """
+        missing = [s for s in self.series_ids if s not in frames]
+        if missing:
+            raise ValueError(f"Signal '{self.text}' needs econ series {missing}.")
+
+        dates, columns = _joined(frames, self.series_ids)
+        if len(dates) == 0:
+            return None
+        evaluator = _Evaluator(frames, dates, columns, store or get_signal_store())
+        values = np.asarray(evaluator.visit(self.tree.body), dtype=float)
+        return pd.Series(np.broadcast_to(values, (len(dates),)).copy(), index=dates, name=self.text)
+
+
+def compile_signal(text: str) -> SignalExpression:
+    """
+    Parse and validate a signal expression; raises ValueError on anything
+    outside the grammar above.
+    """
+    try:
+        tree = ast.parse(text.strip(), mode="eval")
+    except SyntaxError as exc:
+        raise ValueError(f"Invalid signal expression '{text}': {exc.msg}") from exc
+
+    names: List[str] = []
+    is_condition = _check(tree.body, names, text, ma_shorthand=False)
+    if not names:
+        raise ValueError(f"Signal expression '{text}' references no econ series.")
+    return SignalExpression(
+        text=text.strip(),
+        tree=tree,
+        series_ids=tuple(dict.fromkeys(names)),
+        is_condition=is_condition,
+    )
+
+
+def _check(node: ast.AST, names: List[str], text: str, ma_shorthand: bool) -> bool:
+    """
+    Validate `node`, collect series names; True if it is a condition.
+    """
+    def fail(why: str) -> None:
+        raise ValueError(f"Invalid signal expression '{text}': {why}")
+
+    if isinstance(node, ast.Name):
+        names.append(node.id)
+        return False
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            fail(f"unsupported constant {node.value!r}")
+        return False
+    if isinstance(node, ast.UnaryOp):
+        if isinstance(node.op, ast.Not):
+            if not _check(node.operand, names, text, False):
+                fail("'not' needs a condition")
+            return True
+        if not isinstance(node.op, (ast.USub, ast.UAdd)):
+            fail("unsupported unary operator")
+        if _check(node.operand, names, text, False):
+            fail("arithmetic on a condition")
+        return False
+    if isinstance(node, ast.BinOp):
+        if type(node.op) not in _BINARY:
+            fail(f"unsupported operator {type(node.op).__name__}")
+        if _check(node.left, names, text, False) or _check(node.right, names, text, False):
+            fail("arithmetic on a condition")
+        return False
+    if isinstance(node, ast.Compare):
+        if len(node.ops) != 1 or type(node.ops[0]) not in _COMPARE:
+            fail("use one comparison per pair of operands")
+        left, right = node.left, node.comparators[0]
+        for a, b in ((left, right), (right, left)):
+            if _is_ma_shorthand(a) and any(isinstance(n, ast.Call) for n in ast.walk(b)):
+                fail("ma(n) needs an operand without ma() on the other side")
+        if _check(left, names, text, True) or _check(right, names, text, True):
+            fail("comparison of conditions")
+        return True
+    if isinstance(node, ast.BoolOp):
+        for value in node.values:
+            if not _check(value, names, text, False):
+                fail("'and' / 'or' need conditions")
+        return True
+    if isinstance(node, ast.Call):
+        if not (isinstance(node.func, ast.Name) and node.func.id == "ma") or node.keywords:
+            fail("the only function is ma(x, n)")
+        if len(node.args) == 1:
+            if not ma_shorthand:
+                fail("ma(n) is only allowed as a comparison operand")
+            window = node.args[0]
+        elif len(node.args) == 2:
+            if any(isinstance(n, ast.Call) for n in ast.walk(node.args[0])):
+                fail("nested ma() is not supported")
+            if _check(node.args[0], names, text, False):
+                fail("ma() of a condition")
+            window = node.args[1]
+        else:
+            fail("ma() takes (x, n) or (n)")
+        if not (isinstance(window, ast.Constant) and isinstance(window.value, int) and window.value >= 1):
+            fail("ma() window must be a positive integer")
+        return False
+    fail(f"unsupported syntax {type(node).__name__}")
+    return False
+
+
+def _is_ma_shorthand(node: ast.AST) -> bool:
+    return isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "ma" and len(node.args) == 1
+
+
+def _joined(frames: Mapping[str, pd.DataFrame], series_ids) -> Tuple[pd.Index, Dict[str, np.ndarray]]:
+    """
+    Dates (date-only) on which every series has a non-missing value, and
+    each series' values on those dates.
+    """
+    columns = {}
+    for series_id in series_ids:
+        df = frames[series_id].sort_values("date")
+        columns[series_id] = pd.Series(
+            df["value"].astype(float).to_numpy(), index=pd.to_datetime(df["date"]).dt.date
+        )
+    joined = pd.DataFrame(columns).dropna()
+    return joined.index, {k: joined[k].to_numpy() for k in joined.columns}
+
+
+class _Evaluator:
+    """
+    Evaluates a validated expression tree to NumPy arrays (or scalars)
+    aligned to `dates`.
+    """
+
+    def __init__(self, frames, dates: pd.Index, columns: Dict[str, np.ndarray], store: SignalStore) -> None:
+        self.frames = frames
+        self.dates = dates
+        self.columns = columns
+        self.store = store
+
+    def visit(self, node: ast.AST, other: Optional[ast.AST] = None):
+        if isinstance(node, ast.Name):
+            return self.columns[node.id]
+        if isinstance(node, ast.Constant):
+            return float(node.value)
+        if isinstance(node, ast.UnaryOp):
+            value = self.visit(node.operand)
+            if isinstance(node.op, ast.Not):
+                return np.where(np.isnan(value), np.nan, 1.0 - value)
+            return -value if isinstance(node.op, ast.USub) else value
+        if isinstance(node, ast.BinOp):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return _BINARY[type(node.op)](self.visit(node.left), self.visit(node.right))
+        if isinstance(node, ast.Compare):
+            left_node, right_node = node.left, node.comparators[0]
+            left = self.visit(left_node, other=right_node)
+            right = self.visit(right_node, other=left_node)
+            result = np.asarray(_COMPARE[type(node.ops[0])](left, right), dtype=float)
+            return np.where(np.isnan(left) | np.isnan(right), np.nan, result)
+        if isinstance(node, ast.BoolOp):
+            values = [self.visit(v) for v in node.values]
+            combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            result = combine.reduce([v == 1.0 for v in values]).astype(float)
+            return np.where(np.any([np.isnan(v) for v in values], axis=0), np.nan, result)
+        if isinstance(node, ast.Call):
+            if len(node.args) == 1:
+                return self._rolling_mean(other, node.args[0].value)
+            return self._rolling_mean(node.args[0], node.args[1].value)
+        raise ValueError(f"unsupported syntax {type(node).__name__}")
+
+    def _rolling_mean(self, node: ast.AST, window: int) -> np.ndarray:
+        """
+        Rolling mean of the sub-expression `node` over its own observation
+        dates, via the signal store, then taken on the joined dates.
+        """
+        source = ast.unparse(node)
+        inputs = tuple(dict.fromkeys(n.id for n in ast.walk(node) if isinstance(n, ast.Name)))
+
+        def level_fn(frames: List[pd.DataFrame]) -> pd.Series:
+            sub = SignalExpression(source, ast.Expression(body=node), inputs, False)
+            return sub.evaluate(dict(zip(inputs, frames)), store=self.store)
+
+        signal = self.store.get(
+            SignalSpec(f"expr.{source}", inputs, int(window)),
+            [self.frames[s] for s in inputs],
+            level_fn,
+        )
+        if signal is None:
+            return np.full(len(self.dates), np.nan)
+        _, ma = signal
+        return ma.reindex(self.dates).to_numpy(dtype=float)
@@ -0,0 +1,228 @@
+# src/slice/quant_engine/core/trade_log.py
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# One executed order (fill) per row. day: days since 1970-01-01; symbol:
+# index into the run's symbol list; size: signed units (+ buy, - sell);
+# value: Backtrader's executed.value (cost basis of the units moved).
+FILL_DTYPE = np.dtype([
+    ("day", np.int32),
+    ("symbol", np.int32),
+    ("size", np.float64),
+    ("price", np.float64),
+    ("value", np.float64),
+    ("commission", np.float64),
+    ("order_ref", np.int64),
+    ("partial", np.bool_),
+])
+
+# One FIFO-matched round trip per row: `size` units opened by one fill and
+# closed by a later one (size > 0 long, < 0 short), at the fills' prices.
+TRADE_DTYPE = np.dtype([
+    ("symbol", np.int32),
+    ("day_open", np.int32),
+    ("day_close", np.int32),
+    ("size", np.float64),
+    ("price_open", np.float64),
+    ("price_close", np.float64),
+    ("pnl", np.float64),
+    ("pnl_commission", np.float64),
+])
+
+
+class RecordLog:
+    """
+    Append-only structured array that grows by doubling: per-event
+    logging at the cost of one row write instead of one dict per event.
+    """
+
+    def __init__(self, dtype: np.dtype, capacity: int = 64) -> None:
+        self._rows = np.zeros(max(int(capacity), 1), dtype=dtype)
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def append(self, row: Tuple[Any, ...]) -> None:
+        if self._n == len(self._rows):
+            grown = np.zeros(2 * len(self._rows), dtype=self._rows.dtype)
+            grown[: self._n] = self._rows
+            self._rows = grown
+        self._rows[self._n] = row
+        self._n += 1
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        The rows logged so far (a view; copy it to keep it past more appends).
+        """
+        return self._rows[: self._n]
+
+
+def opening_lots(
+    positions: Mapping[str, Sequence[float]],
+    symbols: Sequence[str],
+    day: int,
+) -> np.ndarray:
+    """
+    {symbol: (size, price)} holdings a run starts with (e.g. from a
+    checkpoint) as FILL_DTYPE rows dated `day`, so match_fifo_lots() can
+    close them. Each holding is one lot at its average price.
+    """
+    column = {s: i for i, s in enumerate(symbols)}
+    lots = np.zeros(len(positions), dtype=FILL_DTYPE)
+    for row, (symbol, (size, price)) in enumerate(positions.items()):
+        lots[row] = (day, column[symbol], float(size), float(price), abs(float(size)) * float(price), 0.0, 0, False)
+    return lots[lots["size"] != 0.0]
+
+
+def match_fifo_lots(fills: np.ndarray, opening: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Round-trip trades of a fill log, matched first-in first-out per symbol.
+
+    Each fill is split into the part that reduces the position and the
+    part that opens (or adds to) it, so a fill that flips a position
+    closes the old side and opens the other. Per symbol and side, the k-th
+    unit closed is the k-th unit opened: the matched pieces are the
+    overlaps of the cumulative open and close quantities, found with one
+    searchsorted instead of a lot queue. Commissions are charged to each
+    piece pro rata to its share of both fills. Lots still open at the end
+    are not trades.
+
+    `opening` (FILL_DTYPE rows, e.g. from opening_lots()) are treated as
+    fills before the first one.
+
+    Returns a TRADE_DTYPE array ordered by symbol, then close.
+    """
+    if opening is not None and len(opening):
+        fills = np.concatenate([opening.astype(FILL_DTYPE), fills])
+    pieces = [
+        _match_side(fills[fills["symbol"] == code], side)
+        for code in np.unique(fills["symbol"])
+        for side in (1.0, -1.0)
+    ]
+    pieces = [p for p in pieces if len(p)]
+    if not pieces:
+        return np.zeros(0, dtype=TRADE_DTYPE)
+
+    trades = np.concatenate(pieces)
+    return trades[np.lexsort((trades["day_open"], trades["day_close"], trades["symbol"]))]
+
+
+def _match_side(fills: np.ndarray, side: float) -> np.ndarray:
+    """
+    FIFO pieces of one symbol's long (side=1) or short (side=-1) lots.
+    """
+    size = fills["size"]
+    if size.size == 0:
+        return np.zeros(0, dtype=TRADE_DTYPE)
+    tol = 1e-9 * float(np.abs(size).max())
+
+    after = np.cumsum(size)
+    before = after - size
+    before[np.abs(before) <= tol] = 0.0
+    reducing = np.sign(size) == -np.sign(before)
+    closed = np.where(reducing, np.minimum(np.abs(size), np.abs(before)), 0.0)
+    opened = np.abs(size) - closed
+
+    open_qty = np.where(np.sign(size) == side, opened, 0.0)
+    close_qty = np.where(np.sign(before) == side, closed, 0.0)
+    open_idx = np.flatnonzero(open_qty > tol)
+    close_idx = np.flatnonzero(close_qty > tol)
+    if open_idx.size == 0 or close_idx.size == 0:
+        return np.zeros(0, dtype=TRADE_DTYPE)
+
+    opens_cum = np.cumsum(open_qty[open_idx])
+    closes_cum = np.cumsum(close_qty[close_idx])
+    edges = np.unique(np.concatenate([[0.0], opens_cum, closes_cum]))
+    edges = edges[edges <= min(opens_cum[-1], closes_cum[-1]) + tol]
+    lo, qty = edges[:-1], np.diff(edges)
+    keep = qty > tol
+    lo, qty = lo[keep], qty[keep]
+
+    o = open_idx[np.minimum(np.searchsorted(opens_cum, lo + tol, side="left"), open_idx.size - 1)]
+    c = close_idx[np.minimum(np.searchsorted(closes_cum, lo + tol, side="left"), close_idx.size - 1)]
+
+    trades = np.zeros(qty.size, dtype=TRADE_DTYPE)
+    trades["symbol"] = fills["symbol"][o]
+    trades["day_open"] = fills["day"][o]
+    trades["day_close"] = fills["day"][c]
+    trades["size"] = side * qty
+    trades["price_open"] = fills["price"][o]
+    trades["price_close"] = fills["price"][c]
+    trades["pnl"] = side * qty * (trades["price_close"] - trades["price_open"])
+    commission = qty * (
+        fills["commission"][o] / np.abs(size[o]) + fills["commission"][c] / np.abs(size[c])
+    )
+    trades["pnl_commission"] = trades["pnl"] - commission
+    return trades
+
+
+def _datetimes(days: np.ndarray, iso: bool = False) -> List[Any]:
+    """
+    Epoch days → datetime.datetime at midnight (what bt.num2date gives for
+    daily bars), or with iso=True their isoformat() strings.
+    """
+    stamps = np.asarray(days, dtype=np.int64).astype("datetime64[D]").astype("datetime64[s]")
+    if iso:
+        return np.datetime_as_string(stamps).tolist()
+    return stamps.astype("datetime64[us]").tolist()
+
+
+def fill_records(fills: np.ndarray, symbols: Sequence[str], iso: bool = False) -> List[Dict[str, Any]]:
+    """
+    Fill rows as order_log dicts: datetime, symbol, size, price, value,
+    commission, order_ref, direction, status. iso=True gives isoformat
+    datetime strings (checkpoint / JSON form).
+    """
+    when = _datetimes(fills["day"], iso)
+    names = np.asarray(symbols, dtype=object)[fills["symbol"]].tolist()
+    columns = zip(
+        when,
+        names,
+        fills["size"].tolist(),
+        fills["price"].tolist(),
+        fills["value"].tolist(),
+        fills["commission"].tolist(),
+        fills["order_ref"].tolist(),
+        fills["partial"].tolist(),
+    )
+    return [
+        {
+            "datetime": dt,
+            "symbol": symbol,
+            "size": size,
+            "price": price,
+            "value": value,
+            "commission": commission,
+            "order_ref": ref,
+            "direction": "buy" if size > 0 else "sell",
+            "status": "partial" if partial else "completed",
+        }
+        for dt, symbol, size, price, value, commission, ref, partial in columns
+    ]
+
+
+def trade_records(trades: np.ndarray, symbols: Sequence[str], iso: bool = False) -> List[Dict[str, Any]]:
+    """
+    Trade rows as trade_log dicts: symbol, dt_open, dt_close, size,
+    price_open, price_close, pnl, pnl_commission.
+    """
+    names = np.asarray(symbols, dtype=object)[trades["symbol"]].tolist()
+    columns = zip(
+        names,
+        _datetimes(trades["day_open"], iso),
+        _datetimes(trades["day_close"], iso),
+        trades["size"].tolist(),
+        trades["price_open"].tolist(),
+        trades["price_close"].tolist(),
+        trades["pnl"].tolist(),
+        trades["pnl_commission"].tolist(),
+    )
+    keys = ("symbol", "dt_open", "dt_close", "size", "price_open", "price_close", "pnl", "pnl_commission")
+    return [dict(zip(keys, row)) for row in columns]
@@ -0,0 +1,261 @@
+# src/slice/quant_engine/core/vectorized.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type
+
+import numpy as np
+import pandas as pd
+
+from slice.quant_engine.core.trade_log import FILL_DTYPE, fill_records, match_fifo_lots, trade_records
+from slice.quant_engine.strategies.strategy_base import StrategyBase
+
+
+@dataclass
+class VectorizedRun:
+    """
+    Output of run_vectorized(), shaped like what run_backtest() extracts
+    from a Cerebro run.
+    """
+    dates: pd.DatetimeIndex
+    returns: np.ndarray                 # per-bar portfolio return (net of commission)
+    equity: np.ndarray                  # per-bar portfolio value
+    weights: pd.DataFrame               # target weights decided at each bar close
+    turnover: np.ndarray                # per-bar sum of |weight change|
+    commissions: np.ndarray             # per-bar commission paid (currency)
+    positions: np.ndarray               # dates × symbols units held after each bar's trades
+    order_log: List[dict] = field(default_factory=list)
+    trade_log: List[dict] = field(default_factory=list)
+
+
+def build_price_panels(
+    price_data: Dict[str, pd.DataFrame],
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Combine {symbol: OHLCV frame} into wide dates × symbols (opens, closes).
+
+    The index is the union of all feed calendars (Backtrader advances on any
+    feed's bar); closes are forward-filled across gaps and stay NaN before a
+    symbol's first bar. Missing opens fall back to the close.
+    """
+    opens: Dict[str, pd.Series] = {}
+    closes: Dict[str, pd.Series] = {}
+    for symbol, df in price_data.items():
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError(f"price_data[{symbol}] is not a DataFrame")
+        df = df.sort_index()
+        closes[symbol] = df["close"].astype(float)
+        opens[symbol] = df["open"].astype(float) if "open" in df.columns else closes[symbol]
+
+    close_panel = pd.DataFrame(closes).sort_index().ffill()
+    open_panel = pd.DataFrame(opens).reindex(close_panel.index)
+    open_panel = open_panel.fillna(close_panel)
+    return open_panel, close_panel
+
+
+def run_vectorized(
+    strategy_cls: Type[StrategyBase],
+    price_data: Dict[str, pd.DataFrame],
+    cash: float = 100_000.0,
+    commission: float = 0.0,
+    strategy_params: Optional[Mapping[str, Any]] = None,
+) -> VectorizedRun:
+    """
+    Array-based alternative to run_cerebro() for target-weight strategies.
+
+    The strategy produces a full dates × symbols weight matrix via
+    StrategyBase.compute_weight_matrix(). As with Backtrader market orders,
+    weights decided at the close of bar t are executed at the open of bar
+    t+1; rebalancing costs `commission` × turnover, where turnover is
+    measured against the weights after they drifted with prices.
+
+    Rebalance policy params (rebalance_frequency, rebalance_band,
+    min_trade_value) are applied as in StrategyBase.next(): symbols that are
+    not traded keep their drifted weight. Because that makes each bar depend
+    on the previous one, policies are simulated with a loop over bars.
+
+    Positions are fractional (Backtrader sizes whole shares from the
+    signal-bar close), so results track run_cerebro() closely but not to
+    the cent.
+    """
+    opens, closes = build_price_panels(price_data)
+    symbols = list(closes.columns)
+    n_syms = closes.shape[1]
+
+    p = strategy_cls.resolve_params(dict(strategy_params or {}, symbols=symbols))
+    target = strategy_cls.compute_weight_matrix(closes, p)
+    if not isinstance(target, pd.DataFrame):
+        raise TypeError("compute_weight_matrix() must return a pandas DataFrame.")
+
+    unknown = [s for s in target.columns if s not in closes.columns]
+    if unknown:
+        raise ValueError(f"compute_weight_matrix() returned unknown symbols: {unknown}")
+
+    target = target.reindex(index=closes.index, columns=symbols).fillna(0.0)
+
+    px_open = opens.to_numpy(dtype=float)
+    px_close = closes.to_numpy(dtype=float)
+    listed = ~np.isnan(px_close)
+    w = np.where(listed, target.to_numpy(dtype=float), 0.0)
+
+    prev_close = np.vstack([px_close[:1], px_close[:-1]])
+
+    # Overnight gap (close t-1 → open t) and intraday (open t → close t) moves.
+    gap_ret = np.where(listed & ~np.isnan(prev_close), px_open / prev_close - 1.0, 0.0)
+    intra_ret = np.where(listed, px_close / px_open - 1.0, 0.0)
+
+    if _has_rebalance_policy(p):
+        executed, pre_trade, gap_gain, intra_gain = _simulate_with_policy(
+            w=w,
+            gap_ret=gap_ret,
+            intra_ret=intra_ret,
+            rebalance=strategy_cls.rebalance_mask(closes.index, p),
+            band=float(p.rebalance_band),
+            min_trade_value=float(p.min_trade_value),
+            cash=cash,
+            commission=commission,
+        )
+    else:
+        zeros = np.zeros((1, n_syms))
+
+        # Weights executed at the open of t are the targets set at the close of t-1.
+        executed = np.vstack([zeros, w[:-1]])
+        intra_gain = (executed * intra_ret).sum(axis=1)
+
+        # Weights carried into bar t: executed weights of t-1 drifted to its close.
+        carried = np.vstack([zeros, _drift(executed, intra_ret, intra_gain)[:-1]])
+        gap_gain = (carried * gap_ret).sum(axis=1)
+        pre_trade = _drift(carried, gap_ret, gap_gain)
+
+    trade_w = executed - pre_trade
+    turnover = np.abs(trade_w).sum(axis=1)
+    cost_frac = commission * turnover
+
+    net = (1.0 + gap_gain) * (1.0 - cost_frac) * (1.0 + intra_gain) - 1.0
+    equity = cash * np.cumprod(1.0 + net)
+
+    # Portfolio value at the open of each bar, just before rebalancing.
+    pre_trade_value = np.concatenate([[cash], equity[:-1]]) * (1.0 + gap_gain)
+    commissions = cost_frac * pre_trade_value
+
+    # Units bought at the open are held through the close.
+    invested = executed * pre_trade_value[:, None] * (1.0 - cost_frac)[:, None]
+    positions = np.divide(invested, px_open, out=np.zeros_like(invested), where=listed)
+
+    fills = _fills_from_weight_changes(
+        dates=closes.index,
+        trade_w=trade_w,
+        px=px_open,
+        pre_trade_value=pre_trade_value,
+        commission=commission,
+    )
+
+    return VectorizedRun(
+        dates=closes.index,
+        returns=net,
+        equity=equity,
+        weights=pd.DataFrame(w, index=closes.index, columns=symbols),
+        turnover=turnover,
+        commissions=commissions,
+        positions=positions,
+        order_log=fill_records(fills, symbols),
+        trade_log=trade_records(match_fifo_lots(fills), symbols),
+    )
+
+
+def _has_rebalance_policy(p) -> bool:
+    return (
+        str(p.rebalance_frequency).upper() != "DAILY"
+        or p.rebalance_band > 0.0
+        or p.min_trade_value > 0.0
+    )
+
+
+def _simulate_with_policy(
+    w: np.ndarray,
+    gap_ret: np.ndarray,
+    intra_ret: np.ndarray,
+    rebalance: np.ndarray,
+    band: float,
+    min_trade_value: float,
+    cash: float,
+    commission: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bar-by-bar version of the executed / pre-trade weight recursion.
+
+    At the close of each rebalance bar, a symbol is queued for trading if
+    |target - weight at close| exceeds `band` and its notional reaches
+    `min_trade_value`, or if the target closes the position. Queued
+    symbols trade to target at the next open; the rest keep their weight.
+    """
+    n, k = w.shape
+    executed = np.zeros((n, k))
+    pre_trade = np.zeros((n, k))
+    gap_gain = np.zeros(n)
+    intra_gain = np.zeros(n)
+
+    close_w = np.zeros(k)
+    pending = np.full(k, np.nan)
+    value = cash
+
+    for t in range(n):
+        gap_gain[t] = close_w @ gap_ret[t]
+        pre_trade[t] = _drift(close_w[None, :], gap_ret[t][None, :], gap_gain[t:t + 1])[0]
+        executed[t] = np.where(np.isnan(pending), pre_trade[t], pending)
+
+        turnover = np.abs(executed[t] - pre_trade[t]).sum()
+        intra_gain[t] = executed[t] @ intra_ret[t]
+        value *= (1.0 + gap_gain[t]) * (1.0 - commission * turnover) * (1.0 + intra_gain[t])
+        close_w = _drift(executed[t][None, :], intra_ret[t][None, :], intra_gain[t:t + 1])[0]
+
+        pending = np.full(k, np.nan)
+        if rebalance[t] and value > 0.0:
+            diff = np.abs(w[t] - close_w)
+            trade = (diff > band) & (diff > 0.0) & (diff * value >= min_trade_value)
+            trade |= (w[t] == 0.0) & (close_w != 0.0)
+            pending = np.where(trade, w[t], np.nan)
+
+    return executed, pre_trade, gap_gain, intra_gain
+
+
+def _drift(weights: np.ndarray, asset_ret: np.ndarray, port_ret: np.ndarray) -> np.ndarray:
+    """
+    Weights after each asset moved by asset_ret and the portfolio by port_ret.
+    """
+    growth = (1.0 + port_ret)[:, None]
+    return np.divide(
+        weights * (1.0 + asset_ret),
+        growth,
+        out=np.zeros_like(weights),
+        where=growth != 0.0,
+    )
+
+
+def _fills_from_weight_changes(
+    dates: pd.DatetimeIndex,
+    trade_w: np.ndarray,
+    px: np.ndarray,
+    pre_trade_value: np.ndarray,
+    commission: float,
+    tol: float = 1e-12,
+) -> np.ndarray:
+    """
+    Express each non-zero weight change as a FILL_DTYPE row, the fill log
+    StrategyBase.notify_order() keeps; symbol codes are column indexes.
+    """
+    rows, cols = np.nonzero(np.abs(trade_w) > tol)
+    fills = np.zeros(rows.size, dtype=FILL_DTYPE)
+    if rows.size == 0:
+        return fills
+
+    value = trade_w[rows, cols] * pre_trade_value[rows]
+    fills["day"] = dates.values.astype("datetime64[D]").astype(np.int64)[rows]
+    fills["symbol"] = cols
+    fills["price"] = px[rows, cols]
+    fills["size"] = value / fills["price"]
+    fills["value"] = np.abs(value)
+    fills["commission"] = np.abs(value) * commission
+    fills["order_ref"] = np.arange(1, rows.size + 1)
+    return fills
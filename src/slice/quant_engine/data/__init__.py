@@ -1 +1,8 @@
-from .econ_loader import load_econ_series
\ No newline at end of file
+from .econ_loader import (
+    configure_econ_cache,
+    econ_cache_info,
+    econ_series_snapshot,
+    invalidate_econ_cache,
+    load_econ_series,
+    seed_econ_series,
+)
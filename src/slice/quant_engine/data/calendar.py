@@ -0,0 +1,94 @@
+# src/slice/quant_engine/data/calendar.py
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Mapping, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+# "asof": latest value available on or before the bar (after the release
+# lag); "exact": only a value dated on the bar itself.
+ALIGNMENTS = ("asof", "exact")
+
+LagSpec = Union[int, Mapping[str, int]]
+
+
+def check_alignment(how: str) -> str:
+    if how not in ALIGNMENTS:
+        raise ValueError(f"Unknown econ alignment '{how}'. Supported: {list(ALIGNMENTS)}")
+    return how
+
+
+def trading_calendar(indexes: Iterable[pd.Index]) -> pd.DatetimeIndex:
+    """
+    Union of the bar dates of several price feeds (normalized, sorted,
+    unique): the calendar every econ series is aligned onto.
+    """
+    days = [np.asarray(pd.DatetimeIndex(ix).normalize().values, dtype="datetime64[D]") for ix in indexes]
+    union = np.unique(np.concatenate(days)) if days else np.array([], dtype="datetime64[D]")
+    return pd.DatetimeIndex(union.astype("datetime64[ns]"), name="date")
+
+
+def prepare_series(series: pd.Series, release_lag_days: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (availability dates as datetime64[D], float values) of a date-indexed
+    series: missing values dropped, one value per date (the last), each
+    date shifted by the release lag.
+    """
+    s = pd.Series(series.to_numpy(dtype=float), index=pd.to_datetime(pd.Index(series.index)).normalize())
+    s = s.dropna()
+    s = s[~s.index.duplicated(keep="last")].sort_index()
+    dates = s.index.values.astype("datetime64[D]") + np.timedelta64(int(release_lag_days), "D")
+    return dates, s.to_numpy(dtype=float)
+
+
+def align_prepared(
+    prepared: Tuple[np.ndarray, np.ndarray],
+    bar_dates: np.ndarray,
+    how: str = "asof",
+) -> np.ndarray:
+    """
+    Values of a prepare_series() result on `bar_dates` (datetime64[D],
+    sorted or not), NaN where nothing is available.
+    """
+    dates, values = prepared
+    bar_dates = np.asarray(bar_dates, dtype="datetime64[D]")
+    out = np.full(len(bar_dates), np.nan)
+    if len(dates) == 0:
+        return out
+
+    if how == "asof":
+        idx = np.searchsorted(dates, bar_dates, side="right") - 1
+        ok = idx >= 0
+    else:
+        idx = np.minimum(np.searchsorted(dates, bar_dates, side="left"), len(dates) - 1)
+        ok = dates[idx] == bar_dates
+    out[ok] = values[idx[ok]]
+    return out
+
+
+def align_to_calendar(
+    series: Mapping[str, pd.Series],
+    calendar: pd.Index,
+    how: str = "asof",
+    release_lag_days: LagSpec = 0,
+) -> Dict[str, np.ndarray]:
+    """
+    As-of join of every date-indexed series onto `calendar` in one
+    vectorized pass per series (merge_asof semantics, backward direction).
+
+    release_lag_days (one int, or {name: int}) delays each value: a print
+    dated d is first usable on the first bar on or after d + lag days.
+    With how="exact" only bars dated exactly d + lag get the value.
+
+    Returns {name: float array aligned to calendar}.
+    """
+    check_alignment(how)
+    bar_dates = pd.DatetimeIndex(calendar).normalize().values.astype("datetime64[D]")
+    out: Dict[str, np.ndarray] = {}
+    for name, s in series.items():
+        lag = release_lag_days.get(name, 0) if isinstance(release_lag_days, Mapping) else release_lag_days
+        out[name] = align_prepared(prepare_series(s, lag), bar_dates, how)
+    return out
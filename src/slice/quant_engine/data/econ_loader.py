@@ -1,11 +1,230 @@
 from __future__ import annotations
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Mapping, NamedTuple, Optional, Set, Tuple
 import pandas as pd
 
 from sqlalchemy import text
 from slice.db import get_engine
 
 
+DEFAULT_ECON_CACHE_SIZE = 64
+
+_CacheKey = Tuple[str, Optional[str], Optional[str]]
+
+# (row count, last date, value checksum) of one series in econ_data
+EconVersion = Tuple[int, Optional[str], Optional[float]]
+
+
+class EconCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class EconSeriesCache:
+    """
+    Size-bounded LRU cache of econ_data frames for this process.
+
+    Keyed by (series_id, start, end). A cached full history (start=end=None)
+    also answers any date-range request for that series. Entries installed
+    with pinned=True (seeded data for sweep workers) are never evicted.
+
+    Entries may carry the EconVersion of the rows they were read from; a
+    get() with a different version drops the series and misses, so the
+    caller reloads it. Versions are only checked when probe_interval is
+    set (seconds between checks of one series); by default hits never
+    touch the database and staleness is handled by invalidate().
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_ECON_CACHE_SIZE,
+        probe_interval: Optional[float] = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.probe_interval = probe_interval
+        self._entries: "OrderedDict[_CacheKey, pd.DataFrame]" = OrderedDict()
+        self._pinned: Set[_CacheKey] = set()
+        self._versions: Dict[_CacheKey, Any] = {}
+        self._checked: Dict[str, float] = {}
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        series_id: str,
+        start=None,
+        end=None,
+        version: Optional[EconVersion] = None,
+    ) -> Optional[pd.DataFrame]:
+        key = _cache_key(series_id, start, end)
+        full_key = _cache_key(series_id, None, None)
+        with self._lock:
+            if version is not None and any(
+                k[0] == series_id and k not in self._pinned and self._versions.get(k) != version
+                for k in self._entries
+            ):
+                self._drop(series_id)
+            elif version is not None:
+                self._checked[series_id] = time.monotonic()
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key].copy()
+            if full_key in self._entries:
+                self._entries.move_to_end(full_key)
+                self._hits += 1
+                return _filter_dates(self._entries[full_key].copy(), start, end)
+            self._misses += 1
+            return None
+
+    def put(
+        self,
+        series_id: str,
+        df: pd.DataFrame,
+        start=None,
+        end=None,
+        pinned: bool = False,
+        version: Optional[EconVersion] = None,
+    ) -> None:
+        key = _cache_key(series_id, start, end)
+        with self._lock:
+            self._entries[key] = df.copy()
+            self._entries.move_to_end(key)
+            self._versions[key] = version
+            if version is not None:
+                self._checked[series_id] = time.monotonic()
+            if pinned:
+                self._pinned.add(key)
+            self._evict()
+
+    def needs_probe(self, series_id: str) -> bool:
+        """
+        True if probing is enabled and `series_id` has unpinned cached
+        entries whose version was last checked probe_interval or more
+        seconds ago.
+        """
+        with self._lock:
+            if self.probe_interval is None:
+                return False
+            if not any(k[0] == series_id and k not in self._pinned for k in self._entries):
+                return False
+            checked = self._checked.get(series_id)
+            return checked is None or time.monotonic() - checked >= self.probe_interval
+
+    def invalidate(self, series_id: Optional[str] = None) -> None:
+        """
+        Drop every entry for `series_id` (all series if None).
+        """
+        with self._lock:
+            self._drop(series_id)
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def set_probe_interval(self, probe_interval: Optional[float]) -> None:
+        with self._lock:
+            self.probe_interval = probe_interval
+            self._checked.clear()
+
+    def info(self) -> EconCacheInfo:
+        with self._lock:
+            return EconCacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def _drop(self, series_id: Optional[str]) -> None:
+        keys = [k for k in self._entries if series_id is None or k[0] == series_id]
+        for key in keys:
+            del self._entries[key]
+            self._pinned.discard(key)
+            self._versions.pop(key, None)
+        if series_id is None:
+            self._checked.clear()
+        else:
+            self._checked.pop(series_id, None)
+
+    def _evict(self) -> None:
+        evictable = [k for k in self._entries if k not in self._pinned]
+        while len(self._entries) > self.maxsize and evictable:
+            key = evictable.pop(0)
+            del self._entries[key]
+            self._versions.pop(key, None)
+
+
+_CACHE = EconSeriesCache()
+
+# Frames fixed for the current run by econ_series_snapshot()
+_SNAPSHOT: ContextVar[Mapping[str, pd.DataFrame]] = ContextVar("econ_series_snapshot", default={})
+
+
+def seed_econ_series(series_id: str, df: pd.DataFrame) -> None:
+    """
+    Install the full history of `series_id` (date | value) for this process.
+    Subsequent load_econ_series() calls are answered from it.
+    """
+    _CACHE.put(series_id, df, pinned=True)
+
+
+def invalidate_econ_cache(series_id: Optional[str] = None) -> None:
+    """
+    Forget cached frames for `series_id` (all series if None). Called by
+    update_macro_data() after inserting rows. Long-lived processes that
+    must see another process's updates either call this themselves or
+    enable the probe with configure_econ_cache(probe_interval=...).
+    """
+    _CACHE.invalidate(series_id)
+
+
+@contextmanager
+def econ_series_snapshot(frames: Mapping[str, pd.DataFrame]) -> Iterator[None]:
+    """
+    Within the block, load_econ_series() answers the series in `frames`
+    (date | value) from them, without the cache or econ_data, so a run
+    reads exactly the frames its caller already loaded and fingerprinted.
+    """
+    token = _SNAPSHOT.set({**_SNAPSHOT.get(), **frames})
+    try:
+        yield
+    finally:
+        _SNAPSHOT.reset(token)
+
+
+_UNSET: Any = object()
+
+
+def configure_econ_cache(
+    maxsize: Optional[int] = None,
+    probe_interval: Optional[float] = _UNSET,
+) -> None:
+    """
+    Resize the process-level econ cache and/or set its probe interval:
+    seconds after which a cache hit first re-checks the series in
+    econ_data, None (the default) to never probe.
+    """
+    if maxsize is not None:
+        if maxsize < 1:
+            raise ValueError("econ cache maxsize must be >= 1")
+        _CACHE.resize(maxsize)
+    if probe_interval is not _UNSET:
+        if probe_interval is not None and probe_interval < 0:
+            raise ValueError("econ cache probe_interval must be >= 0")
+        _CACHE.set_probe_interval(probe_interval)
+
+
+def econ_cache_info() -> EconCacheInfo:
+    """
+    Hit/miss counters and size of the process-level econ cache.
+    """
+    return _CACHE.info()
+
+
 def load_econ_series(
     series_id: str,
     start: Optional[pd.Timestamp] = None,
@@ -14,8 +233,53 @@ def load_econ_series(
     """
     Load econ_data for a given series_id, returning:
         date | value
+
+    The full history is read once per process and cached (see
+    EconSeriesCache); date ranges are sliced from it, and cache hits do
+    not touch the database. If a probe interval is configured (see
+    configure_econ_cache()), a hit at most that often runs one aggregate
+    probe of econ_data and reloads the series if it changed since it was
+    read, e.g. by update_macro_data() in another process. Seeded frames
+    are never probed.
+    """
+    snapshot = _SNAPSHOT.get().get(series_id)
+    if snapshot is not None:
+        return _filter_dates(snapshot.copy(), start, end)
+
+    version = _probe_econ_series(series_id) if _CACHE.needs_probe(series_id) else None
+    cached = _CACHE.get(series_id, start, end, version=version)
+    if cached is not None:
+        return cached
+
+    # Probe before reading: rows landing in between make the stored
+    # version older than the frame, which costs a reload, never a stale hit
+    if version is None and _CACHE.probe_interval is not None:
+        version = _probe_econ_series(series_id)
+    df = _query_econ_series(series_id)
+    _CACHE.put(series_id, df, version=version)
+    return _filter_dates(df, start, end)
+
+
+def _probe_econ_series(series_id: str) -> EconVersion:
+    """
+    Row count, last date and value checksum of `series_id` in econ_data.
     """
+    query = """
+        SELECT COUNT(*), MAX(date), SUM(value)
+        FROM econ_data
+        WHERE series_id = :series_id;
+    """
+    with get_engine().connect() as conn:
+        count, last, total = conn.execute(text(query), {"series_id": series_id}).one()
+
+    return (
+        int(count),
+        None if last is None else str(last),
+        None if total is None else round(float(total), 8),
+    )
 
+
+def _query_econ_series(series_id: str) -> pd.DataFrame:
     engine = get_engine()
 
     query = """
@@ -35,9 +299,25 @@ def load_econ_series(
     df["date"] = pd.to_datetime(df["date"])
     df = df[["date", "value"]]   # <-- IMPORTANT: enforce column order
 
+    return df
+
+
+def _cache_key(series_id: str, start, end) -> _CacheKey:
+    def norm(value) -> Optional[str]:
+        return None if value is None else pd.to_datetime(value).date().isoformat()
+
+    return (series_id, norm(start), norm(end))
+
+
+def _filter_dates(
+    df: pd.DataFrame,
+    start: Optional[pd.Timestamp],
+    end: Optional[pd.Timestamp],
+) -> pd.DataFrame:
+    if df.empty:
+        return df
     if start is not None:
         df = df[df["date"] >= pd.to_datetime(start)]
     if end is not None:
         df = df[df["date"] <= pd.to_datetime(end)]
-
-    return df
\ No newline at end of file
+    return df
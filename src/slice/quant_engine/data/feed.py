@@ -1,6 +1,18 @@
 # src/slice/quant_engine/data/feed.py
 
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
 import backtrader as bt
+import pandas as pd
+from sqlalchemy import text
+
+from slice.db import get_engine
+from slice.quant_engine.data.loader import OHLCV_COLUMNS, _price_query, get_price_source
+
+
+DEFAULT_STREAM_CHUNK_SIZE = 5_000
+
 
 class SlicePandasData(bt.feeds.PandasData):
     """
@@ -14,4 +26,177 @@ class SlicePandasData(bt.feeds.PandasData):
         ('close',    'close'),
         ('volume',   'volume'),
         ('openinterest', None),
-    )
\ No newline at end of file
+    )
+
+
+class PriceStream:
+    """
+    One server-side cursor over market_data for a set of tickers, in date
+    order, whose rows are handed out per ticker. All feeds of a run share
+    it, so a backtest holds a single pooled connection however many
+    tickers it streams.
+
+    Rows read ahead of a ticker's feed wait in that ticker's buffer; as
+    Backtrader advances feeds in date order these stay small wherever the
+    tickers' histories overlap.
+    The cursor is opened on the first row requested and closed once it is
+    exhausted or every feed has released its ticker. An injected price
+    source (loader.set_price_source) is read instead of Postgres.
+    """
+
+    def __init__(
+        self,
+        tickers: Iterable[str],
+        start=None,
+        end=None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> None:
+        self.tickers: List[str] = list(dict.fromkeys(tickers))
+        self.start = start
+        self.end = end
+        self.chunk_size = chunk_size
+        self._buffers: Dict[str, Deque[Tuple]] = {}
+        self._active: Set[str] = set()
+        self._rows: Optional[Iterator[Tuple]] = None
+        self._conn = None
+
+    def acquire(self, ticker: str) -> None:
+        if ticker not in self.tickers:
+            raise ValueError(f"PriceStream does not cover ticker {ticker!r}.")
+        if not self._active:
+            self._buffers = {t: deque() for t in self.tickers}
+        self._active.add(ticker)
+
+    def release(self, ticker: str) -> None:
+        self._active.discard(ticker)
+        self._buffers.pop(ticker, None)
+        if not self._active:
+            self.close()
+
+    def next_row(self, ticker: str) -> Optional[Tuple]:
+        """
+        Next (date, open, high, low, close, volume) row of `ticker`, None
+        once it has no more.
+        """
+        buffer = self._buffers[ticker]
+        if self._rows is None:
+            self._rows = self._iter_rows()
+        while not buffer:
+            row = next(self._rows, None)
+            if row is None:
+                return None
+            target = self._buffers.get(row[0])
+            if target is not None:
+                target.append(row[1:])
+        return buffer.popleft()
+
+    def close(self) -> None:
+        rows, self._rows = self._rows, None
+        if rows is not None:
+            rows.close()
+        self._close_conn()
+
+    def _iter_rows(self) -> Iterator[Tuple]:
+        """
+        (ticker, date, open, high, low, close, volume) rows ordered by
+        date, then ticker.
+        """
+        source = get_price_source()
+        if source is not None:
+            frames = source(self.tickers, self.start, self.end)
+            if frames:
+                panel = pd.concat(
+                    {ticker: df[OHLCV_COLUMNS] for ticker, df in frames.items()}
+                ).swaplevel().sort_index()
+                for (date, ticker), *values in panel.itertuples(name=None):
+                    yield (ticker, date, *values)
+            return
+
+        sql, params = _price_query(self.tickers, self.start, self.end, by_date=True)
+        self._conn = get_engine().connect().execution_options(
+            stream_results=True, yield_per=self.chunk_size
+        )
+        try:
+            result = self._conn.execute(text(sql), params)
+            for chunk in result.partitions(self.chunk_size):
+                for row in chunk:
+                    yield tuple(row)
+        finally:
+            self._close_conn()
+
+    def _close_conn(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class SliceStreamingData(bt.feed.DataBase):
+    """
+    Backtrader datafeed that reads one ticker's market_data rows through a
+    server-side cursor, `chunk_size` rows at a time, instead of holding a
+    DataFrame of the full history. Feeds given the same `stream`
+    (PriceStream) share its cursor; without one, the feed opens its own.
+
+    Meant for Cerebro(preload=False, exactbars=1): the feed then keeps only
+    the bars still in some indicator's lookback window.
+    """
+
+    params = (
+        ("ticker", None),
+        ("start", None),
+        ("end", None),
+        ("chunk_size", DEFAULT_STREAM_CHUNK_SIZE),
+        ("stream", None),
+    )
+
+    def start(self) -> None:
+        super().start()
+        if not self.p.ticker:
+            raise ValueError("SliceStreamingData needs a ticker.")
+        self._stream = self.p.stream or PriceStream(
+            [self.p.ticker], self.p.start, self.p.end, self.p.chunk_size
+        )
+        self._stream.acquire(self.p.ticker)
+
+    def stop(self) -> None:
+        self._stream.release(self.p.ticker)
+        super().stop()
+
+    def _load(self) -> bool:
+        row = self._stream.next_row(self.p.ticker)
+        if row is None:
+            return False
+
+        date, open_, high, low, close, volume = row
+        self.lines.datetime[0] = bt.date2num(pd.Timestamp(date).to_pydatetime())
+        self.lines.open[0] = float(open_)
+        self.lines.high[0] = float(high)
+        self.lines.low[0] = float(low)
+        self.lines.close[0] = float(close)
+        self.lines.volume[0] = float(volume)
+        self.lines.openinterest[0] = 0.0
+        return True
+
+
+def streaming_feeds(
+    tickers: Iterable[str],
+    start=None,
+    end=None,
+    chunk_size: Optional[int] = None,
+) -> Dict[str, SliceStreamingData]:
+    """
+    {ticker: SliceStreamingData} for build_cerebro()/run_cerebro() in
+    place of loaded DataFrames, all reading one shared PriceStream.
+    """
+    chunk_size = chunk_size or DEFAULT_STREAM_CHUNK_SIZE
+    stream = PriceStream(tickers, start, end, chunk_size)
+    return {
+        ticker: SliceStreamingData(
+            ticker=ticker,
+            start=start,
+            end=end,
+            chunk_size=chunk_size,
+            stream=stream,
+        )
+        for ticker in stream.tickers
+    }
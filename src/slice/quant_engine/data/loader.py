@@ -1,11 +1,37 @@
 # src/slice/quant_engine/data/loader.py
 
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
 import pandas as pd
 from sqlalchemy import text
 
 from slice.db import get_engine
 
 
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+_OHLCV_DTYPES = {col: "float64" for col in OHLCV_COLUMNS}
+
+# (tickers, start, end) -> {ticker: OHLCV frame}
+PriceSource = Callable[[List[str], object, object], Dict[str, pd.DataFrame]]
+
+_PRICE_SOURCE: Optional[PriceSource] = None
+
+
+def set_price_source(source: Optional[PriceSource]) -> None:
+    """
+    Answer load_price_panel() / load_price_data() from `source` instead of
+    market_data (e.g. data.synthetic.SyntheticPriceSource for benchmarks
+    and offline runs). None restores the Postgres loader.
+    """
+    global _PRICE_SOURCE
+    _PRICE_SOURCE = source
+
+
+def get_price_source() -> Optional[PriceSource]:
+    return _PRICE_SOURCE
+
+
 def load_price_data(ticker: str, start=None, end=None) -> pd.DataFrame:
     """
     Deterministic loader for OHLCV data from Postgres.
@@ -22,36 +48,101 @@ def load_price_data(ticker: str, start=None, end=None) -> pd.DataFrame:
     pd.DataFrame indexed by datetime with columns:
     open, high, low, close, volume
     """
-    engine = get_engine()
+    frames = load_price_panel([ticker], start=start, end=end)
+    if ticker in frames:
+        return frames[ticker]
 
-    sql = """
-        SELECT date, open, high, low, close, volume
-        FROM market_data
-        WHERE ticker = :ticker
-        ORDER BY date ASC
+    empty = pd.DataFrame(columns=OHLCV_COLUMNS, dtype=float)
+    empty.index = pd.DatetimeIndex([], name="date")
+    return empty
+
+
+def load_price_panel(
+    tickers: Iterable[str],
+    start=None,
+    end=None,
+    as_panel: bool = False,
+    field: str = "close",
+) -> Union[Dict[str, pd.DataFrame], pd.DataFrame]:
+    """
+    Load OHLCV data for several tickers in a single query, with the date
+    window applied in SQL.
+
+    Parameters
+    ----------
+    tickers  : iterable of ticker strings
+    start    : datetime/date or None
+    end      : datetime/date or None
+    as_panel : if True, return a wide dates × tickers frame of `field`
+    field    : OHLCV column used for the wide panel
+
+    Returns
+    -------
+    dict {ticker: DataFrame} shaped like load_price_data() (tickers without
+    rows are omitted), or the wide panel when as_panel=True.
     """
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        raise ValueError("load_price_panel() needs at least one ticker.")
+    if as_panel and field not in OHLCV_COLUMNS:
+        raise ValueError(f"field must be one of {OHLCV_COLUMNS}, got '{field}'.")
+
+    if _PRICE_SOURCE is not None:
+        frames = _PRICE_SOURCE(tickers, start, end)
+        frames = {t: frames[t] for t in tickers if t in frames and not frames[t].empty}
+        if as_panel:
+            return pd.DataFrame({t: f[field] for t, f in frames.items()}).rename_axis(
+                index="date", columns="ticker"
+            )
+        return frames
 
-    params = {"ticker": ticker}
+    sql, params = _price_query(tickers, start, end)
 
-    df = pd.read_sql(text(sql), engine, params=params)
+    engine = get_engine()
+    with engine.connect() as conn:
+        df = pd.read_sql(text(sql), conn, params=params, dtype=_OHLCV_DTYPES)
 
-    # Convert to datetime index
     df["date"] = pd.to_datetime(df["date"])
-    df.set_index("date", inplace=True)
-
-    # Enforce Backtrader-friendly dtypes
-    df = df.astype({
-        "open": float,
-        "high": float,
-        "low": float,
-        "close": float,
-        "volume": float,
-    })
-
-    # Apply optional date filtering
-    if start:
-        df = df[df.index >= pd.to_datetime(start)]
-    if end:
-        df = df[df.index <= pd.to_datetime(end)]
-
-    return df
+
+    if as_panel:
+        return df.pivot(index="date", columns="ticker", values=field).reindex(
+            columns=[t for t in tickers if t in set(df["ticker"])]
+        )
+
+    frames: Dict[str, pd.DataFrame] = {}
+    for ticker, group in df.groupby("ticker", sort=False):
+        frames[ticker] = group.set_index("date")[OHLCV_COLUMNS]
+    return {t: frames[t] for t in tickers if t in frames}
+
+
+def _price_query(
+    tickers: List[str],
+    start=None,
+    end=None,
+    by_date: bool = False,
+) -> Tuple[str, Dict[str, object]]:
+    """
+    (sql, params) selecting ticker, date, OHLCV from market_data for
+    `tickers`, ordered by ticker and date (date and ticker if `by_date`),
+    with the date window applied.
+    """
+    clauses = ["ticker = ANY(:tickers)"]
+    params: Dict[str, object] = {"tickers": tickers}
+    if start is not None and end is not None:
+        clauses.append("date BETWEEN :start AND :end")
+    elif start is not None:
+        clauses.append("date >= :start")
+    elif end is not None:
+        clauses.append("date <= :end")
+    if start is not None:
+        params["start"] = pd.to_datetime(start).date()
+    if end is not None:
+        params["end"] = pd.to_datetime(end).date()
+
+    sql = f"""
+        SELECT ticker, date, open, high, low, close, volume
+        FROM market_data
+        WHERE {" AND ".join(clauses)}
+        ORDER BY {"date ASC, ticker ASC" if by_date else "ticker ASC, date ASC"}
+    """
+    return sql, params
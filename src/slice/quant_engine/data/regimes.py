@@ -0,0 +1,175 @@
+# src/slice/quant_engine/data/regimes.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from slice.quant_engine.core.signal_expr import compile_signal
+from slice.quant_engine.data.calendar import align_to_calendar
+
+
+# Labels every bar with its calendar year; needs no econ data.
+CALENDAR_YEAR = "year"
+
+LevelFn = Callable[[Mapping[str, pd.DataFrame]], Optional[pd.Series]]
+
+
+@dataclass(frozen=True)
+class RegimeSpec:
+    """
+    A regime labelling of the trading calendar derived from econ_data.
+
+    level(frames) computes a date-indexed level from {series_id: frame with
+    date | value}; each bar takes the level as of its date (after
+    release_lag_days) and the label of the band it falls in: below bins[0]
+    → labels[0], in [bins[i-1], bins[i]) → labels[i], at or above bins[-1]
+    → labels[-1]. Bars with no level yet get no label.
+    """
+    name: str
+    series_ids: Tuple[str, ...]
+    level: Optional[LevelFn]
+    bins: Tuple[float, ...] = ()
+    labels: Tuple[str, ...] = ()
+    release_lag_days: int = 0
+
+    def __post_init__(self) -> None:
+        if self.level is not None and len(self.labels) != len(self.bins) + 1:
+            raise ValueError(
+                f"Regime '{self.name}' needs len(bins) + 1 labels, "
+                f"got {len(self.bins)} bins and {len(self.labels)} labels."
+            )
+        if list(self.bins) != sorted(self.bins):
+            raise ValueError(f"Regime '{self.name}' bins must be ascending, got {list(self.bins)}.")
+
+
+def expression_level(text: str) -> LevelFn:
+    """
+    Level given by a signal expression (core/signal_expr.py), e.g.
+    "DGS10 - DGS2"; conditions give 1.0 / 0.0.
+    """
+    expression = compile_signal(text)
+    return lambda frames: expression.evaluate(frames)
+
+
+def yoy_level(series_id: str, periods: int = 12) -> LevelFn:
+    """
+    Year-over-year change of a series, as a fraction: value over the value
+    `periods` observations earlier (12 for monthly series such as CPI).
+    """
+    def level(frames: Mapping[str, pd.DataFrame]) -> pd.Series:
+        df = frames[series_id].sort_values("date")
+        values = pd.Series(df["value"].astype(float).to_numpy(), index=pd.to_datetime(df["date"]))
+        return values / values.shift(periods) - 1.0
+    return level
+
+
+BUILTIN_REGIMES: Dict[str, RegimeSpec] = {
+    # 10y - 2y Treasury spread: inverted below zero
+    "curve_sign": RegimeSpec(
+        name="curve_sign",
+        series_ids=("DGS10", "DGS2"),
+        level=expression_level("DGS10 - DGS2"),
+        bins=(0.0,),
+        labels=("inverted", "normal"),
+    ),
+    # CPI YoY inflation band. FRED dates CPI at the start of the reference
+    # month and it is published about six weeks later.
+    "cpi_yoy": RegimeSpec(
+        name="cpi_yoy",
+        series_ids=("CPIAUCSL",),
+        level=yoy_level("CPIAUCSL", 12),
+        bins=(0.02, 0.04),
+        labels=("below_2pct", "2_to_4pct", "above_4pct"),
+        release_lag_days=45,
+    ),
+    CALENDAR_YEAR: RegimeSpec(name=CALENDAR_YEAR, series_ids=(), level=None),
+}
+
+
+def resolve_regime(regime: Union[str, Mapping[str, Any], RegimeSpec]) -> RegimeSpec:
+    """
+    A RegimeSpec from a built-in name ("curve_sign", "cpi_yoy", "year") or
+    a dict:
+      {"name": "real_rates", "expression": "DGS10 - T10YIE",
+       "bins": [0, 1], "labels": ["negative", "low", "high"],
+       "release_lag_days": 0}
+    For a condition expression (e.g. "DGS10 < DGS2") bins and labels
+    default to "off" / "on".
+    """
+    if isinstance(regime, RegimeSpec):
+        return regime
+    if isinstance(regime, str):
+        if regime not in BUILTIN_REGIMES:
+            raise ValueError(f"Unknown regime '{regime}'. Built-in regimes: {sorted(BUILTIN_REGIMES)}")
+        return BUILTIN_REGIMES[regime]
+    if not isinstance(regime, Mapping):
+        raise TypeError(f"A regime is a name, a dict or a RegimeSpec, got {type(regime).__name__}.")
+
+    unknown = set(regime) - {"name", "expression", "bins", "labels", "release_lag_days"}
+    if unknown:
+        raise ValueError(f"Unknown regime keys {sorted(unknown)}.")
+    if not regime.get("name") or not regime.get("expression"):
+        raise ValueError("A regime dict needs 'name' and 'expression'.")
+
+    expression = compile_signal(regime["expression"])
+    default_bins, default_labels = ((0.5,), ("off", "on")) if expression.is_condition else ((), ())
+    return RegimeSpec(
+        name=str(regime["name"]),
+        series_ids=expression.series_ids,
+        level=expression_level(expression.text),
+        bins=tuple(float(b) for b in regime.get("bins", default_bins)),
+        labels=tuple(str(label) for label in regime.get("labels", default_labels)),
+        release_lag_days=int(regime.get("release_lag_days", 0)),
+    )
+
+
+def resolve_regimes(regimes: Iterable[Union[str, Mapping[str, Any], RegimeSpec]]) -> List[RegimeSpec]:
+    if isinstance(regimes, (str, Mapping, RegimeSpec)):
+        regimes = [regimes]
+    specs = [resolve_regime(r) for r in regimes]
+    names = [spec.name for spec in specs]
+    duplicated = sorted({n for n in names if names.count(n) > 1})
+    if duplicated:
+        raise ValueError(f"Duplicate regime names {duplicated}.")
+    return specs
+
+
+def regime_series_ids(specs: Iterable[RegimeSpec]) -> List[str]:
+    """
+    Every econ series the regimes read, sorted and unique.
+    """
+    return sorted({series_id for spec in specs for series_id in spec.series_ids})
+
+
+def regime_labels(
+    spec: RegimeSpec,
+    dates: np.ndarray,
+    frames: Mapping[str, pd.DataFrame],
+) -> np.ndarray:
+    """
+    Label of each bar date (object array; None where the regime has no
+    value yet), as-of aligned to the bars after the release lag, so a bar
+    only sees econ data published by its date.
+    """
+    calendar = pd.DatetimeIndex(np.asarray(dates, dtype="datetime64[D]").astype("datetime64[ns]"))
+    if spec.level is None:
+        return calendar.year.astype(str).to_numpy(dtype=object)
+
+    labels = np.full(len(calendar), None, dtype=object)
+    if any(frames[s].empty for s in spec.series_ids):
+        return labels
+    level = spec.level(frames)
+    if level is None or len(calendar) == 0:
+        return labels
+
+    aligned = align_to_calendar(
+        {spec.name: level}, calendar, how="asof", release_lag_days=spec.release_lag_days
+    )[spec.name]
+    known = ~np.isnan(aligned)
+    bands = np.searchsorted(np.asarray(spec.bins, dtype=float), aligned[known], side="right")
+    labels[known] = np.asarray(spec.labels, dtype=object)[bands]
+    return labels
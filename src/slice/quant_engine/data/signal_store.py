@@ -0,0 +1,362 @@
+# src/slice/quant_engine/data/signal_store.py
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+from sqlalchemy import text
+
+from slice.db import get_engine
+from slice.quant_engine.core.indicators import RollingMean
+
+
+logger = logging.getLogger("slice.quant_engine.signal_store")
+
+# "memory" (default): keep signals for this process only.
+# "postgres": also persist to strategy_signal / strategy_signal_meta.
+SIGNAL_STORE_ENV = "SLICE_SIGNAL_STORE"
+
+# Econ input frames (date | value) -> signal level indexed by date, or None.
+LevelFn = Callable[[List[pd.DataFrame]], Optional[pd.Series]]
+
+
+@dataclass(frozen=True)
+class SignalSpec:
+    """
+    Identity of a stored signal: a level series derived from econ inputs
+    and its rolling mean over `window` observations.
+    """
+    name: str                 # e.g. "curve_steepener.slope"
+    inputs: Tuple[str, ...]   # econ_data series ids, in level_fn order
+    window: int
+
+    @property
+    def key(self) -> str:
+        payload = json.dumps([self.name, list(self.inputs), int(self.window)])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+@dataclass
+class _StoredSignal:
+    level: pd.Series
+    ma: pd.Series
+    indicator_state: Dict[str, Any]   # RollingMean state after the last level
+    input_state: List[Dict[str, Any]] # per input, see _input_state()
+
+    @property
+    def last_date(self):
+        return self.level.index[-1]
+
+
+class SignalStore:
+    """
+    Econ-derived strategy signals (level + rolling mean), computed once
+    and reused by every strategy instance and sweep point; with
+    persist=True also by every process, through the strategy_signal table.
+
+    get() answers from the in-process memo (or, persisted, the table)
+    while the econ inputs are unchanged. When inputs have only grown
+    (rows after the stored last date), just the new rows go through
+    level_fn and continue the stored RollingMean state; any other change
+    recomputes the signal in full.
+    """
+
+    def __init__(self, persist: bool = False) -> None:
+        self.persist = persist
+        self._memo: Dict[str, _StoredSignal] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        spec: SignalSpec,
+        frames: Sequence[pd.DataFrame],
+        level_fn: LevelFn,
+    ) -> Optional[Tuple[pd.Series, pd.Series]]:
+        """
+        (level, rolling mean) for `spec`, with `frames` the current econ
+        inputs (date | value, in spec.inputs order). level_fn must only
+        emit dates on which every input has a row. None if level_fn
+        yields no data.
+        """
+        frames = [_dated(df) for df in frames]
+        fingerprint = [_digest(df) for df in frames]
+
+        with self._lock:
+            stored = self._memo.get(spec.key)
+        if stored is None:
+            stored = self._read(spec)
+
+        if stored is not None:
+            if [s["digest"] for s in stored.input_state] == fingerprint:
+                self._remember(spec, stored)
+                return stored.level, stored.ma
+            if self._appendable(stored, frames):
+                stored = self._append(spec, stored, frames, level_fn)
+                return stored.level, stored.ma
+
+        stored = self._compute(spec, frames, level_fn)
+        if stored is None:
+            return None
+        return stored.level, stored.ma
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """
+        Forget stored signals named `name` (all if None), in this process
+        and in the database, e.g. after econ_data history was revised.
+        """
+        with self._lock:
+            self._memo = {k: v for k, v in self._memo.items() if name is not None and v.level.name != name}
+        if not self.persist:
+            return
+        try:
+            with get_engine().begin() as conn:
+                keys_sql = "SELECT signal_key FROM strategy_signal_meta"
+                params: Dict[str, Any] = {}
+                if name is not None:
+                    keys_sql += " WHERE name = :name"
+                    params["name"] = name
+                conn.execute(text(f"DELETE FROM strategy_signal WHERE signal_key IN ({keys_sql})"), params)
+                conn.execute(text(keys_sql.replace("SELECT signal_key", "DELETE", 1)), params)
+        except Exception as exc:
+            self._disable(exc)
+
+    # ---------- computation ----------
+
+    def _compute(self, spec: SignalSpec, frames: List[pd.DataFrame], level_fn: LevelFn) -> Optional[_StoredSignal]:
+        level = level_fn(frames)
+        if level is None or level.empty:
+            return None
+
+        level = level.astype(float).rename(spec.name)
+        indicator = RollingMean(spec.window)
+        ma = pd.Series(indicator.batch(level.to_numpy()), index=level.index, name=spec.name)
+        stored = _StoredSignal(level, ma, indicator.get_state(), _input_state(frames, level.index[-1]))
+
+        self._write(spec, stored, stored.level.index, replace=True)
+        self._remember(spec, stored)
+        return stored
+
+    @staticmethod
+    def _appendable(stored: _StoredSignal, frames: List[pd.DataFrame]) -> bool:
+        last = pd.Timestamp(stored.last_date)
+        return all(
+            _digest(df[df["date"] <= last]) == state["digest_upto"]
+            for df, state in zip(frames, stored.input_state)
+        )
+
+    def _append(
+        self,
+        spec: SignalSpec,
+        stored: _StoredSignal,
+        frames: List[pd.DataFrame],
+        level_fn: LevelFn,
+    ) -> _StoredSignal:
+        last = pd.Timestamp(stored.last_date)
+        new_frames = [df[df["date"] > last] for df in frames]
+        new_level = None
+        if all(not df.empty for df in new_frames):
+            new_level = level_fn(new_frames)
+
+        if new_level is None or new_level.empty:
+            updated = _StoredSignal(
+                stored.level, stored.ma, stored.indicator_state, _input_state(frames, stored.last_date)
+            )
+            self._write(spec, updated, [], replace=False)
+            self._remember(spec, updated)
+            return updated
+
+        new_level = new_level.astype(float).rename(spec.name)
+        indicator = RollingMean.from_state(stored.indicator_state)
+        new_ma = pd.Series(
+            [indicator.update(x) for x in new_level.to_numpy()], index=new_level.index, name=spec.name
+        )
+        updated = _StoredSignal(
+            pd.concat([stored.level, new_level]),
+            pd.concat([stored.ma, new_ma]),
+            indicator.get_state(),
+            _input_state(frames, new_level.index[-1]),
+        )
+        self._write(spec, updated, new_level.index, replace=False)
+        self._remember(spec, updated)
+        return updated
+
+    def _remember(self, spec: SignalSpec, stored: _StoredSignal) -> None:
+        with self._lock:
+            self._memo[spec.key] = stored
+
+    # ---------- persistence ----------
+
+    def _read(self, spec: SignalSpec) -> Optional[_StoredSignal]:
+        if not self.persist:
+            return None
+        try:
+            with get_engine().connect() as conn:
+                meta = conn.execute(
+                    text(
+                        "SELECT input_state, indicator_state FROM strategy_signal_meta "
+                        "WHERE signal_key = :key"
+                    ),
+                    {"key": spec.key},
+                ).first()
+                if meta is None:
+                    return None
+                rows = pd.read_sql(
+                    text(
+                        "SELECT date, level, value FROM strategy_signal "
+                        "WHERE signal_key = :key ORDER BY date ASC"
+                    ),
+                    conn,
+                    params={"key": spec.key},
+                )
+        except Exception as exc:
+            self._disable(exc)
+            return None
+
+        if rows.empty:
+            return None
+        index = pd.Index(pd.to_datetime(rows["date"]).dt.date)
+        input_state, indicator_state = (_json_value(v) for v in meta)
+        return _StoredSignal(
+            level=pd.Series(rows["level"].to_numpy(dtype=float), index=index, name=spec.name),
+            ma=pd.Series(rows["value"].to_numpy(dtype=float), index=index, name=spec.name),
+            indicator_state=_from_json_safe(indicator_state),
+            input_state=input_state,
+        )
+
+    def _write(self, spec: SignalSpec, stored: _StoredSignal, dates, replace: bool) -> None:
+        if not self.persist:
+            return
+        rows = [
+            {"key": spec.key, "date": d, "level": _sql_float(stored.level[d]), "value": _sql_float(stored.ma[d])}
+            for d in dates
+        ]
+        meta = {
+            "key": spec.key,
+            "name": spec.name,
+            "inputs": json.dumps(list(spec.inputs)),
+            "window_len": int(spec.window),
+            "input_state": json.dumps(stored.input_state),
+            "indicator_state": json.dumps(_to_json_safe(stored.indicator_state)),
+            "last_date": stored.last_date,
+        }
+        try:
+            with get_engine().begin() as conn:
+                if replace:
+                    conn.execute(text("DELETE FROM strategy_signal WHERE signal_key = :key"), {"key": spec.key})
+                if rows:
+                    conn.execute(
+                        text(
+                            "INSERT INTO strategy_signal (signal_key, date, level, value) "
+                            "VALUES (:key, :date, :level, :value) "
+                            "ON CONFLICT (signal_key, date) DO UPDATE "
+                            "SET level = EXCLUDED.level, value = EXCLUDED.value"
+                        ),
+                        rows,
+                    )
+                conn.execute(
+                    text(
+                        """
+                        INSERT INTO strategy_signal_meta
+                            (signal_key, name, inputs, window_len, input_state, indicator_state, last_date, updated_at)
+                        VALUES
+                            (:key, :name, CAST(:inputs AS JSONB), :window_len, CAST(:input_state AS JSONB),
+                             CAST(:indicator_state AS JSONB), :last_date, now())
+                        ON CONFLICT (signal_key) DO UPDATE SET
+                            input_state = EXCLUDED.input_state,
+                            indicator_state = EXCLUDED.indicator_state,
+                            last_date = EXCLUDED.last_date,
+                            updated_at = now()
+                        """
+                    ),
+                    meta,
+                )
+        except Exception as exc:
+            self._disable(exc)
+
+    def _disable(self, exc: Exception) -> None:
+        # No database / schema not applied: keep working from the memo.
+        logger.warning("signal store persistence disabled for this process: %s", exc)
+        self.persist = False
+
+
+_STORE: Optional[SignalStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_signal_store() -> SignalStore:
+    """
+    Process-wide SignalStore, in memory unless SLICE_SIGNAL_STORE=postgres
+    enables persistence, so offline runs never connect to the database.
+    """
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            mode = os.environ.get(SIGNAL_STORE_ENV, "memory")
+            if mode not in ("postgres", "memory"):
+                raise ValueError(f"{SIGNAL_STORE_ENV} must be 'postgres' or 'memory', got '{mode}'.")
+            _STORE = SignalStore(persist=mode == "postgres")
+        return _STORE
+
+
+def _dated(df: pd.DataFrame) -> pd.DataFrame:
+    if df.empty or pd.api.types.is_datetime64_any_dtype(df["date"]):
+        return df
+    df = df.copy()
+    df["date"] = pd.to_datetime(df["date"])
+    return df
+
+
+def _digest(df: pd.DataFrame) -> str:
+    """
+    Content hash of an econ frame (dates and values, in date order).
+    """
+    df = df.sort_values("date")
+    h = hashlib.sha1()
+    h.update(df["date"].to_numpy(dtype="datetime64[D]").astype("int64").tobytes())
+    h.update(df["value"].to_numpy(dtype=float).tobytes())
+    return h.hexdigest()
+
+
+def _input_state(frames: List[pd.DataFrame], last_date) -> List[Dict[str, Any]]:
+    """
+    Per input: digest of the whole frame (unchanged inputs) and of its
+    rows up to the signal's last date (append-only growth).
+    """
+    last = pd.Timestamp(last_date)
+    return [
+        {"digest": _digest(df), "digest_upto": _digest(df[df["date"] <= last])}
+        for df in frames
+    ]
+
+
+def _sql_float(value: float) -> Optional[float]:
+    return None if math.isnan(value) else float(value)
+
+
+def _to_json_safe(value: Any) -> Any:
+    # JSONB has no NaN
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, list):
+        return [_to_json_safe(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _to_json_safe(v) for k, v in value.items()}
+    return value
+
+
+def _from_json_safe(state: Dict[str, Any]) -> Dict[str, Any]:
+    state = dict(state)
+    state["_buf"] = [math.nan if v is None else v for v in state["_buf"]]
+    return state
+
+
+def _json_value(value: Any) -> Any:
+    return json.loads(value) if isinstance(value, str) else value
@@ -0,0 +1,127 @@
+# src/slice/quant_engine/data/synthetic.py
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from slice.quant_engine.data.loader import OHLCV_COLUMNS
+
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+def synthetic_dates(years: float, start: str = "2000-01-03") -> pd.DatetimeIndex:
+    """
+    Business-day index covering `years` years (252 bars per year).
+    """
+    periods = max(1, int(round(years * TRADING_DAYS_PER_YEAR)))
+    return pd.bdate_range(start, periods=periods, name="date")
+
+
+def synthetic_price_panel(
+    tickers: Sequence[str],
+    dates: pd.DatetimeIndex,
+    seed: int = 0,
+    annual_vol: float = 0.20,
+    annual_drift: float = 0.05,
+    start_price: float = 100.0,
+) -> Dict[str, pd.DataFrame]:
+    """
+    {ticker: OHLCV frame} of independent geometric random walks, shaped
+    like load_price_panel() output (datetime index, OHLCV_COLUMNS).
+    All tickers are drawn in one (bars × tickers) matrix.
+    """
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        raise ValueError("synthetic_price_panel() needs at least one ticker.")
+
+    rng = np.random.default_rng(seed)
+    n, k = len(dates), len(tickers)
+    vol = annual_vol / np.sqrt(TRADING_DAYS_PER_YEAR)
+    drift = annual_drift / TRADING_DAYS_PER_YEAR - 0.5 * vol ** 2
+
+    log_ret = rng.normal(drift, vol, size=(n, k))
+    close = start_price * np.exp(np.cumsum(log_ret, axis=0))
+    prev_close = np.vstack([np.full((1, k), start_price), close[:-1]])
+    open_ = prev_close * np.exp(rng.normal(0.0, vol * 0.25, size=(n, k)))
+    wick = np.abs(rng.normal(0.0, vol * 0.5, size=(2, n, k)))
+    high = np.maximum(open_, close) * (1.0 + wick[0])
+    low = np.minimum(open_, close) * (1.0 - wick[1])
+    volume = np.round(rng.lognormal(13.0, 0.5, size=(n, k)))
+
+    index = pd.DatetimeIndex(dates, name="date")
+    return {
+        ticker: pd.DataFrame(
+            {
+                "open": open_[:, j],
+                "high": high[:, j],
+                "low": low[:, j],
+                "close": close[:, j],
+                "volume": volume[:, j],
+            },
+            index=index,
+            columns=OHLCV_COLUMNS,
+        )
+        for j, ticker in enumerate(tickers)
+    }
+
+
+def synthetic_econ_series(
+    dates: pd.DatetimeIndex,
+    seed: int = 0,
+    level: float = 2.0,
+    daily_vol: float = 0.05,
+) -> pd.DataFrame:
+    """
+    Rate-like random walk around `level`, shaped like load_econ_series()
+    output (date | value).
+    """
+    rng = np.random.default_rng(seed)
+    values = level + np.cumsum(rng.normal(0.0, daily_vol, len(dates)))
+    return pd.DataFrame({"date": pd.DatetimeIndex(dates), "value": values})
+
+
+def synthetic_tickers(count: int, include: Iterable[str] = ()) -> List[str]:
+    """
+    `count` ticker names: the `include` symbols first, then SYN0000, SYN0001, ...
+    """
+    names = list(dict.fromkeys(include))[:count]
+    i = 0
+    while len(names) < count:
+        name = f"SYN{i:04d}"
+        if name not in names:
+            names.append(name)
+        i += 1
+    return names
+
+
+class SyntheticPriceSource:
+    """
+    Price source for loader.set_price_source(): answers
+    load_price_panel() from in-memory frames instead of market_data.
+    """
+
+    def __init__(self, frames: Dict[str, pd.DataFrame]) -> None:
+        self.frames = frames
+
+    def __call__(
+        self,
+        tickers: List[str],
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        out: Dict[str, pd.DataFrame] = {}
+        for ticker in tickers:
+            df = self.frames.get(ticker)
+            if df is None:
+                continue
+            if start is not None or end is not None:
+                df = df.loc[
+                    pd.to_datetime(start) if start is not None else None:
+                    pd.to_datetime(end) if end is not None else None
+                ]
+            out[ticker] = df
+        return out
@@ -0,0 +1,30 @@
+# src/slice/quant_engine/data/universe.py
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+import pandas as pd
+
+
+# Twelve Data ETF listing shipped with the repo (symbol;name;currency;exchange;mic_code;country)
+ETF_LISTING = Path(__file__).resolve().parents[4] / "data" / "twelvedata" / "12data_etf.csv"
+
+
+def load_etf_universe(
+    path: Union[str, Path, None] = None,
+    exchanges: Optional[Sequence[str]] = None,
+    countries: Optional[Sequence[str]] = None,
+    currencies: Optional[Sequence[str]] = None,
+) -> List[str]:
+    """
+    ETF symbols from a Twelve Data listing, optionally filtered by
+    exchange (e.g. "NYSE"), country and currency. Symbols are unique and
+    keep file order; pass them as params["tickers"] to run_backtest().
+    """
+    listing = pd.read_csv(path or ETF_LISTING, sep=";", dtype=str, keep_default_na=False)
+    for column, allowed in (("exchange", exchanges), ("country", countries), ("currency", currencies)):
+        if allowed is not None:
+            listing = listing[listing[column].isin(list(allowed))]
+    return listing["symbol"].drop_duplicates().tolist()
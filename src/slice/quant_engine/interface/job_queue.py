@@ -0,0 +1,371 @@
+# src/slice/quant_engine/interface/job_queue.py
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import math
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import pandas as pd
+from sqlalchemy import text
+
+from slice.db import get_engine
+from slice.quant_engine.interface.run_backtest import _expand_grid, run_backtest
+
+
+logger = logging.getLogger("slice.quant_engine.job_queue")
+
+# backtest_job.status values
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+
+# ---------- Submitter API ----------
+
+def submit_backtest(
+    strategy_id: str,
+    params: Dict[str, Any],
+    max_attempts: int = 3,
+    batch_id: Optional[str] = None,
+) -> int:
+    """
+    Queue one run_backtest(strategy_id, params) for the workers; returns
+    the job id to poll with get_job() / wait_for_job().
+    """
+    return _insert_jobs(strategy_id, [(params, None)], max_attempts, batch_id)[0]
+
+
+def submit_sweep(
+    strategy_id: str,
+    base_params: Dict[str, Any],
+    grid: Mapping[str, Sequence[Any]],
+    max_attempts: int = 3,
+) -> str:
+    """
+    Queue one job per grid point, as run_parameter_sweep() would run them
+    locally; returns the batch id for batch_results() / wait_for_batch().
+    """
+    batch_id = uuid.uuid4().hex
+    jobs = [({"analyzers": "none", **base_params, **point}, point) for point in _expand_grid(grid)]
+    _insert_jobs(strategy_id, jobs, max_attempts, batch_id)
+    return batch_id
+
+
+def get_job(job_id: int) -> Dict[str, Any]:
+    """
+    {job_id, strategy_id, status, attempts, worker_id, result, error} of a
+    job. Raises KeyError for unknown ids.
+    """
+    with get_engine().connect() as conn:
+        row = conn.execute(
+            text(
+                "SELECT job_id, strategy_id, status, attempts, worker_id, result, error "
+                "FROM backtest_job WHERE job_id = :job_id"
+            ),
+            {"job_id": job_id},
+        ).mappings().first()
+    if row is None:
+        raise KeyError(f"Unknown backtest job {job_id}")
+    job = dict(row)
+    job["result"] = _json_value(job["result"])
+    return job
+
+
+def wait_for_job(job_id: int, timeout: Optional[float] = None, poll_interval: float = 1.0) -> Dict[str, Any]:
+    """
+    Poll get_job() until the job is done or failed. Raises TimeoutError.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        job = get_job(job_id)
+        if job["status"] in (DONE, FAILED):
+            return job
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError(f"backtest job {job_id} still {job['status']} after {timeout}s")
+        time.sleep(poll_interval)
+
+
+def batch_results(batch_id: str) -> pd.DataFrame:
+    """
+    One row per job of the batch, shaped like run_parameter_sweep():
+    grid keys, metrics, backtest_id, error, plus job_id and status.
+    """
+    with get_engine().connect() as conn:
+        rows = conn.execute(
+            text(
+                "SELECT job_id, status, point, result, error FROM backtest_job "
+                "WHERE batch_id = :batch_id ORDER BY job_id"
+            ),
+            {"batch_id": batch_id},
+        ).mappings().all()
+
+    records: List[Dict[str, Any]] = []
+    for row in rows:
+        result = _json_value(row["result"]) or {}
+        record: Dict[str, Any] = dict(_json_value(row["point"]) or {})
+        record.update(result.get("metrics", {}))
+        record.update({
+            "backtest_id": result.get("backtest_id"),
+            "error": row["error"],
+            "job_id": row["job_id"],
+            "status": row["status"],
+        })
+        records.append(record)
+    return pd.DataFrame(records)
+
+
+def wait_for_batch(batch_id: str, timeout: Optional[float] = None, poll_interval: float = 1.0) -> pd.DataFrame:
+    """
+    Poll until no job of the batch is queued or running, then return
+    batch_results(). Raises TimeoutError.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        with get_engine().connect() as conn:
+            pending = conn.execute(
+                text(
+                    "SELECT count(*) FROM backtest_job "
+                    "WHERE batch_id = :batch_id AND status IN ('queued', 'running')"
+                ),
+                {"batch_id": batch_id},
+            ).scalar_one()
+        if pending == 0:
+            return batch_results(batch_id)
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError(f"batch {batch_id} still has {pending} pending jobs after {timeout}s")
+        time.sleep(poll_interval)
+
+
+def _insert_jobs(
+    strategy_id: str,
+    jobs: Sequence[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]],
+    max_attempts: int,
+    batch_id: Optional[str],
+) -> List[int]:
+    if max_attempts < 1:
+        raise ValueError("max_attempts must be >= 1.")
+    sql = text(
+        "INSERT INTO backtest_job (batch_id, strategy_id, params, point, max_attempts) "
+        "VALUES (:batch_id, :strategy_id, CAST(:params AS JSONB), CAST(:point AS JSONB), :max_attempts) "
+        "RETURNING job_id"
+    )
+    ids: List[int] = []
+    with get_engine().begin() as conn:
+        for params, point in jobs:
+            ids.append(conn.execute(sql, {
+                "batch_id": batch_id,
+                "strategy_id": strategy_id,
+                "params": json.dumps(params, default=str),
+                "point": None if point is None else json.dumps(point, default=str),
+                "max_attempts": int(max_attempts),
+            }).scalar_one())
+    return ids
+
+
+# ---------- Worker ----------
+
+class BacktestWorker:
+    """
+    Claims queued backtest_job rows one at a time and runs them.
+
+    Claiming uses SELECT ... FOR UPDATE SKIP LOCKED, so any number of
+    workers on any number of machines can share one table without two of
+    them taking the same job. While a job runs, a background thread
+    refreshes its heartbeat_at; jobs whose heartbeat is older than
+    stale_after seconds (the worker died) are put back in the queue, or
+    marked failed once max_attempts claims were used. A job whose backtest
+    raises is marked failed right away: the error would repeat.
+    """
+
+    def __init__(
+        self,
+        worker_id: Optional[str] = None,
+        heartbeat_interval: float = 10.0,
+        stale_after: float = 60.0,
+        poll_interval: float = 2.0,
+    ) -> None:
+        if stale_after <= heartbeat_interval:
+            raise ValueError("stale_after must be longer than heartbeat_interval.")
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+
+    def run(self, max_jobs: Optional[int] = None, exit_when_idle: bool = False) -> int:
+        """
+        Process jobs until max_jobs are done or, with exit_when_idle, the
+        queue is empty. Returns the number of jobs processed.
+        """
+        done = 0
+        while max_jobs is None or done < max_jobs:
+            if self.run_one():
+                done += 1
+            elif exit_when_idle:
+                break
+            else:
+                time.sleep(self.poll_interval)
+        return done
+
+    def run_one(self) -> bool:
+        """
+        Claim and run one job; False if the queue was empty.
+        """
+        job = self._claim()
+        if job is None:
+            return False
+
+        job_id = job["job_id"]
+        logger.info("worker %s running job %s (%s)", self.worker_id, job_id, job["strategy_id"])
+        stop = threading.Event()
+        beat = threading.Thread(target=self._heartbeat, args=(job_id, stop), daemon=True)
+        beat.start()
+        try:
+            result = execute_job(job["strategy_id"], _json_value(job["params"]))
+        except Exception as exc:
+            self._finish(job_id, FAILED, error=f"{type(exc).__name__}: {exc}")
+        else:
+            self._finish(job_id, DONE, result=result)
+        finally:
+            stop.set()
+            beat.join()
+        return True
+
+    def _claim(self) -> Optional[Dict[str, Any]]:
+        with get_engine().begin() as conn:
+            self._requeue_stale(conn)
+            row = conn.execute(
+                text(
+                    """
+                    UPDATE backtest_job
+                    SET status = 'running', worker_id = :worker_id, attempts = attempts + 1,
+                        started_at = now(), heartbeat_at = now(), error = NULL
+                    WHERE job_id = (
+                        SELECT job_id FROM backtest_job
+                        WHERE status = 'queued'
+                        ORDER BY job_id
+                        FOR UPDATE SKIP LOCKED
+                        LIMIT 1
+                    )
+                    RETURNING job_id, strategy_id, params
+                    """
+                ),
+                {"worker_id": self.worker_id},
+            ).mappings().first()
+        return dict(row) if row is not None else None
+
+    def _requeue_stale(self, conn) -> None:
+        conn.execute(
+            text(
+                """
+                UPDATE backtest_job
+                SET status = CASE WHEN attempts < max_attempts THEN 'queued' ELSE 'failed' END,
+                    finished_at = CASE WHEN attempts < max_attempts THEN NULL ELSE now() END,
+                    error = 'worker ' || worker_id || ' stopped heartbeating',
+                    worker_id = NULL
+                WHERE status = 'running'
+                  AND heartbeat_at < now() - :stale_after * INTERVAL '1 second'
+                """
+            ),
+            {"stale_after": float(self.stale_after)},
+        )
+
+    def _heartbeat(self, job_id: int, stop: threading.Event) -> None:
+        while not stop.wait(self.heartbeat_interval):
+            try:
+                with get_engine().begin() as conn:
+                    conn.execute(
+                        text(
+                            "UPDATE backtest_job SET heartbeat_at = now() "
+                            "WHERE job_id = :job_id AND worker_id = :worker_id AND status = 'running'"
+                        ),
+                        {"job_id": job_id, "worker_id": self.worker_id},
+                    )
+            except Exception as exc:
+                logger.warning("heartbeat for job %s failed: %s", job_id, exc)
+
+    def _finish(
+        self,
+        job_id: int,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        # Only while we still own the job: a requeued job belongs to its new worker
+        with get_engine().begin() as conn:
+            updated = conn.execute(
+                text(
+                    "UPDATE backtest_job SET status = :status, result = CAST(:result AS JSONB), "
+                    "error = :error, finished_at = now() "
+                    "WHERE job_id = :job_id AND worker_id = :worker_id AND status = 'running'"
+                ),
+                {
+                    "status": status,
+                    "result": None if result is None else json.dumps(result),
+                    "error": error,
+                    "job_id": job_id,
+                    "worker_id": self.worker_id,
+                },
+            ).rowcount
+        if not updated:
+            logger.warning("worker %s lost job %s before finishing it", self.worker_id, job_id)
+
+
+def execute_job(strategy_id: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one job and return the compact result stored in backtest_job.result:
+    {backtest_id, engine, start, end, bars, metrics}.
+    """
+    result = run_backtest(strategy_id, dict(params, result_format="columnar"))
+    return {
+        "backtest_id": result.backtest_id,
+        "engine": result.metadata.get("engine"),
+        "start": str(result.dates[0]) if len(result.dates) else None,
+        "end": str(result.dates[-1]) if len(result.dates) else None,
+        "bars": int(len(result.dates)),
+        "metrics": {k: _json_float(v) for k, v in result.metadata.get("metrics", {}).items()},
+    }
+
+
+def _json_float(value: Any) -> Any:
+    # JSONB has no NaN / Infinity
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _json_value(value: Any) -> Any:
+    return json.loads(value) if isinstance(value, str) else value
+
+
+# ---------- Entry point ----------
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run queued Slice backtest jobs from the backtest_job table.")
+    parser.add_argument("--worker-id", default=None, help="defaults to hostname:pid")
+    parser.add_argument("--max-jobs", type=int, default=None, help="stop after this many jobs")
+    parser.add_argument("--exit-when-idle", action="store_true", help="stop when the queue is empty")
+    parser.add_argument("--heartbeat", type=float, default=10.0, help="heartbeat interval, seconds")
+    parser.add_argument("--stale-after", type=float, default=60.0, help="requeue jobs silent this long, seconds")
+    parser.add_argument("--poll", type=float, default=2.0, help="idle poll interval, seconds")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    worker = BacktestWorker(
+        worker_id=args.worker_id,
+        heartbeat_interval=args.heartbeat,
+        stale_after=args.stale_after,
+        poll_interval=args.poll,
+    )
+    done = worker.run(max_jobs=args.max_jobs, exit_when_idle=args.exit_when_idle)
+    logger.info("worker %s processed %d jobs", worker.worker_id, done)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,347 @@
+# src/slice/quant_engine/interface/paper_trading.py
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+from slice.db import get_engine
+from slice.models.common import TradeType
+from slice.models.trade import Trade
+from slice.quant_engine.core.checkpoint import checkpoint_params_key
+from slice.quant_engine.data.loader import load_price_panel
+from slice.quant_engine.interface.run_backtest import (
+    _require_tickers,
+    _resolve_strategy,
+    _strategy_kwargs,
+)
+from slice.repositories.trade_repo import TradeRepository
+
+
+logger = logging.getLogger("slice.quant_engine.paper_trading")
+
+
+@dataclass
+class PaperPortfolio:
+    """
+    One strategy traded on paper.
+
+    params are run_backtest()-style: "tickers" (required), "cash",
+    "commission", strategy params, and "start" — the first bar to evaluate
+    when the portfolio has no state yet.
+    """
+    portfolio_id: str
+    strategy_id: str
+    params: Dict[str, Any]
+    thesis_ref: Optional[str] = None
+
+
+@dataclass
+class PaperState:
+    """
+    What a portfolio carries from one refresh to the next: the account
+    (cash, {symbol: [size, avg price]}) and strategy state as of the close
+    of last_date, as in a BacktestCheckpoint but without the history, so
+    its size does not grow with the number of bars evaluated.
+    """
+    strategy_id: str
+    params_key: str
+    last_date: str
+    cash: float
+    equity: float
+    positions: Dict[str, List[float]] = field(default_factory=dict)
+    strategy_state: Dict[str, Any] = field(default_factory=dict)
+    targets: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class PaperStep:
+    """
+    Result of evaluating the bars after the previous state: the new state,
+    the simulated fills as Trade rows, and the account value per new bar.
+    """
+    portfolio_id: str
+    state: PaperState
+    trades: List[Trade]
+    dates: np.ndarray
+    equity: np.ndarray
+
+
+# ---------- Evaluation ----------
+
+def advance_portfolio(
+    portfolio: PaperPortfolio,
+    state: Optional[PaperState],
+    price_data: Dict[str, pd.DataFrame],
+) -> Optional[PaperStep]:
+    """
+    Run the strategy over the bars of price_data after state.last_date
+    (or from params["start"] without a state); None if there are none.
+
+    As with a resumed checkpoint, the run restarts on last_date with the
+    saved cash, positions and strategy state, so that bar's orders (never
+    filled by the previous refresh) are re-issued and fill on the next
+    bar. Only the new bars are simulated: a daily refresh costs the same
+    however long the portfolio has been running.
+    """
+    from slice.quant_engine.core.cerebro import run_cerebro
+
+    params = portfolio.params
+    tickers = _require_tickers(params)
+    strategy_cls = _resolve_strategy(portfolio.strategy_id)
+    if strategy_cls.DEFAULT_ENGINE != "backtrader":
+        raise ValueError(
+            f"Strategy '{portfolio.strategy_id}' runs on the {strategy_cls.DEFAULT_ENGINE} engine "
+            "over its whole price history; paper trading resumes bar by bar from saved state."
+        )
+
+    params_key = checkpoint_params_key(params)
+    kwargs = _strategy_kwargs(strategy_cls, params)
+    kwargs["record_targets"] = True
+    cash = float(params.get("cash", 100_000.0))
+    if state is None:
+        if not params.get("start"):
+            raise ValueError(f"Paper portfolio '{portfolio.portfolio_id}' needs params['start'] for its first run.")
+        start = pd.Timestamp(params["start"])
+    else:
+        if state.strategy_id != portfolio.strategy_id or state.params_key != params_key:
+            raise ValueError(
+                f"Saved state of paper portfolio '{portfolio.portfolio_id}' was built with other "
+                "strategy params; reset it to trade the new configuration."
+            )
+        start = pd.Timestamp(state.last_date)
+        cash = state.cash
+        kwargs["initial_positions"] = state.positions
+        kwargs["initial_state"] = state.strategy_state
+
+    selected: Dict[str, pd.DataFrame] = {}
+    for ticker in tickers:
+        df = price_data.get(ticker)
+        if df is None:
+            raise ValueError(f"No price data loaded for ticker '{ticker}'.")
+        df = df[df.index >= start]
+        if not df.empty:
+            selected[ticker] = df
+    if not selected:
+        return None
+    last_bar = max(df.index.max() for df in selected.values())
+    if state is not None and last_bar <= start:
+        return None
+
+    strat, analyzers = run_cerebro(
+        strategy_cls=strategy_cls,
+        price_data=selected,
+        cash=cash,
+        commission=float(params.get("commission", 0.0)),
+        strategy_params=kwargs,
+        analyzers="none",
+    )
+
+    equity = analyzers["equity"].get_analysis()
+    snapshot = strat.snapshot()
+    targets = strat.target_log[-1][1] if strat.target_log else (state.targets if state else {})
+    new_state = PaperState(
+        strategy_id=portfolio.strategy_id,
+        params_key=params_key,
+        last_date=snapshot["last_date"],
+        cash=snapshot["cash"],
+        equity=float(equity["value"][-1]),
+        positions=snapshot["positions"],
+        strategy_state=snapshot["strategy_state"],
+        targets={k: float(v) for k, v in targets.items()},
+    )
+
+    # the restart bar was already evaluated by the previous refresh
+    new_bars = equity["date"] > np.datetime64(start.date(), "D") if state is not None else slice(None)
+    return PaperStep(
+        portfolio_id=portfolio.portfolio_id,
+        state=new_state,
+        trades=_fill_trades(portfolio, strat),
+        dates=equity["date"][new_bars],
+        equity=equity["value"][new_bars],
+    )
+
+
+def _fill_trades(portfolio: PaperPortfolio, strat) -> List[Trade]:
+    """
+    The run's fills as SIMULATED Trade rows. The trade table has no
+    weight column, so the target weight behind each fill (decided at the
+    previous bar's close) and its commission go into the JSON notes.
+
+    trade_id is "paper:<portfolio>:<date>:<symbol>:<n>", stable if a
+    refresh is replayed, so re-running a day upserts the same rows.
+    """
+    fills = strat.fills.array
+    if len(fills) == 0:
+        return []
+
+    target_days = np.array([day for day, _ in strat.target_log], dtype=np.int64)
+    decided = np.searchsorted(target_days, fills["day"], side="left") - 1
+
+    trades: List[Trade] = []
+    seen: Dict[Tuple[int, int], int] = {}
+    for fill, decision in zip(fills, decided):
+        day, code = int(fill["day"]), int(fill["symbol"])
+        symbol = strat.symbol_names[code]
+        n = seen.get((day, code), 0)
+        seen[(day, code)] = n + 1
+        when = np.datetime64(day, "D").astype(datetime)
+        target = strat.target_log[decision][1].get(symbol) if decision >= 0 else None
+        trades.append(Trade(
+            trade_id=f"paper:{portfolio.portfolio_id}:{when.isoformat()}:{symbol}:{n}",
+            timestamp=datetime(when.year, when.month, when.day, tzinfo=timezone.utc),
+            asset=symbol,
+            action="BUY" if fill["size"] > 0 else "SELL",
+            quantity=abs(float(fill["size"])),
+            price=float(fill["price"]),
+            type=TradeType.SIMULATED,
+            thesis_ref=portfolio.thesis_ref,
+            notes=json.dumps({
+                "paper_portfolio": portfolio.portfolio_id,
+                "strategy_id": portfolio.strategy_id,
+                "target_weight": None if target is None else float(target),
+                "commission": float(fill["commission"]),
+            }),
+        ))
+    return trades
+
+
+# ---------- Persistence ----------
+
+def load_paper_state(portfolio_id: str) -> Optional[PaperState]:
+    with get_engine().connect() as conn:
+        row = conn.execute(
+            text(
+                "SELECT strategy_id, params_key, last_date, cash, equity, positions, strategy_state, targets "
+                "FROM paper_portfolio WHERE portfolio_id = :portfolio_id"
+            ),
+            {"portfolio_id": portfolio_id},
+        ).mappings().first()
+    if row is None:
+        return None
+    state = dict(row)
+    for key in ("positions", "strategy_state", "targets"):
+        if isinstance(state[key], str):
+            state[key] = json.loads(state[key])
+    state["last_date"] = pd.Timestamp(state["last_date"]).date().isoformat()
+    return PaperState(**state)
+
+
+def save_paper_step(step: PaperStep, previous: Optional[PaperState]) -> None:
+    """
+    Write the step's trades and new state in one transaction. The state
+    row only moves forward from `previous`: if another refresh already
+    advanced it, nothing is written and RuntimeError is raised.
+    """
+    state = step.state
+    values = {
+        "portfolio_id": step.portfolio_id,
+        "strategy_id": state.strategy_id,
+        "params_key": state.params_key,
+        "last_date": state.last_date,
+        "cash": state.cash,
+        "equity": state.equity,
+        "positions": json.dumps(state.positions),
+        "strategy_state": json.dumps(state.strategy_state, default=str),
+        "targets": json.dumps(state.targets),
+        "previous_date": previous.last_date if previous is not None else None,
+    }
+    sql = text(
+        "INSERT INTO paper_portfolio "
+        "(portfolio_id, strategy_id, params_key, last_date, cash, equity, positions, strategy_state, targets) "
+        "VALUES (:portfolio_id, :strategy_id, :params_key, :last_date, :cash, :equity, "
+        "CAST(:positions AS JSONB), CAST(:strategy_state AS JSONB), CAST(:targets AS JSONB)) "
+        "ON CONFLICT (portfolio_id) DO UPDATE SET "
+        "strategy_id = EXCLUDED.strategy_id, params_key = EXCLUDED.params_key, "
+        "last_date = EXCLUDED.last_date, cash = EXCLUDED.cash, equity = EXCLUDED.equity, "
+        "positions = EXCLUDED.positions, strategy_state = EXCLUDED.strategy_state, "
+        "targets = EXCLUDED.targets, updated_at = now() "
+        "WHERE paper_portfolio.last_date = CAST(:previous_date AS DATE)"
+    )
+    with get_engine().begin() as conn:
+        if conn.execute(sql, values).rowcount != 1:
+            raise RuntimeError(
+                f"Paper portfolio '{step.portfolio_id}' was advanced by another run; nothing written."
+            )
+        TradeRepository.insert_many(step.trades, conn=conn)
+
+
+# ---------- Runner ----------
+
+def run_paper_trading(portfolios: Sequence[PaperPortfolio]) -> List[Dict[str, Any]]:
+    """
+    Advance every portfolio over the market_data bars added since its
+    last refresh and persist the result; meant to run right after
+    update_daily_prices() / update_macro_data(). Only bars from each
+    portfolio's last_date on are loaded.
+
+    Returns one summary per portfolio: portfolio_id, last_date, bars
+    (new bars evaluated), trades, equity and error (a failing portfolio
+    does not stop the others).
+    """
+    summaries: List[Dict[str, Any]] = []
+    for portfolio in portfolios:
+        summary: Dict[str, Any] = {"portfolio_id": portfolio.portfolio_id, "bars": 0, "trades": 0, "error": None}
+        try:
+            state = load_paper_state(portfolio.portfolio_id)
+            start = state.last_date if state is not None else portfolio.params.get("start")
+            price_data = load_price_panel(_require_tickers(portfolio.params), start=start)
+            step = advance_portfolio(portfolio, state, price_data)
+            if step is None:
+                summary.update(last_date=state.last_date if state else None, equity=state.equity if state else None)
+            else:
+                save_paper_step(step, state)
+                summary.update(
+                    last_date=step.state.last_date,
+                    bars=int(len(step.dates)),
+                    trades=len(step.trades),
+                    equity=step.state.equity,
+                )
+        except Exception as exc:  # noqa: BLE001 - reported per portfolio
+            logger.exception("paper portfolio %s failed", portfolio.portfolio_id)
+            summary["error"] = f"{type(exc).__name__}: {exc}"
+        summaries.append(summary)
+    return summaries
+
+
+def load_portfolios(path: Union[str, Path]) -> List[PaperPortfolio]:
+    """
+    Paper portfolios from a JSON file: a list of
+    {"portfolio_id", "strategy_id", "params", "thesis_ref"?} objects.
+    """
+    entries = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(entries, list):
+        raise ValueError(f"{path}: expected a JSON list of paper portfolios.")
+    portfolios = [PaperPortfolio(**entry) for entry in entries]
+    ids = [p.portfolio_id for p in portfolios]
+    duplicated = sorted({i for i in ids if ids.count(i) > 1})
+    if duplicated:
+        raise ValueError(f"{path}: duplicate portfolio ids {duplicated}.")
+    return portfolios
+
+
+# ---------- Entry point ----------
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Advance Slice paper-trading portfolios over new market data.")
+    parser.add_argument("config", help="JSON list of paper portfolios")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    summaries = run_paper_trading(load_portfolios(args.config))
+    for summary in summaries:
+        logger.info("%s", summary)
+    return 1 if any(s["error"] for s in summaries) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,226 @@
+# src/slice/quant_engine/interface/result_cache.py
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Type
+
+import pandas as pd
+
+from slice.quant_engine.core.results import ColumnarBacktestResult
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "slice" / "backtests"
+DEFAULT_MAX_DISK_BYTES = 1 << 30
+
+# Engine modules whose source is part of every cache key: a change to any
+# of them can change results for all strategies.
+_ENGINE_MODULES = (
+    "slice.quant_engine.strategies.strategy_base",
+    "slice.quant_engine.core.cerebro",
+    "slice.quant_engine.core.vectorized",
+    "slice.quant_engine.core.metrics",
+    "slice.quant_engine.core.indicators",
+    "slice.quant_engine.data.calendar",
+    "slice.quant_engine.core.signal_expr",
+    "slice.quant_engine.data.regimes",
+    "slice.quant_engine.core.trade_log",
+)
+
+
+class BacktestResultCache:
+    """
+    Content-addressed store of ColumnarBacktestResult objects.
+
+    An in-process LRU answers repeat requests without deserializing; a
+    directory of <key>.npz files (optional) shares results across
+    processes and restarts. Disk hits refresh a file's mtime, and each
+    put() deletes the oldest files while the directory holds more than
+    max_disk_bytes (None: unbounded).
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        max_memory_items: int = 256,
+        max_disk_bytes: Optional[int] = DEFAULT_MAX_DISK_BYTES,
+    ) -> None:
+        self.directory = Path(directory) if directory is not None else None
+        self.max_memory_items = max_memory_items
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, ColumnarBacktestResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[ColumnarBacktestResult]:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key].copy()
+
+        if self.directory is None:
+            return None
+        path = self.directory / f"{key}.npz"
+        try:
+            with path.open("rb") as fh:
+                result = ColumnarBacktestResult.load_npz(fh)
+            os.utime(path)
+        except FileNotFoundError:
+            # never written, or evicted by another process
+            return None
+        self._remember(key, result)
+        return result.copy()
+
+    def put(self, key: str, result: ColumnarBacktestResult) -> None:
+        self._remember(key, result.copy())
+
+        if self.directory is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.npz"
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp.open("wb") as fh:
+            result.save_npz(fh)
+        os.replace(tmp, path)
+        self._evict_disk()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self.directory is not None and self.directory.exists():
+            for path in self.directory.glob("*.npz"):
+                path.unlink()
+
+    def _evict_disk(self) -> None:
+        if self.max_disk_bytes is None:
+            return
+        files = []
+        for path in self.directory.glob("*.npz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files, key=lambda f: f[0]):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def _remember(self, key: str, result: ColumnarBacktestResult) -> None:
+        with self._lock:
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_items:
+                self._memory.popitem(last=False)
+
+
+_CACHE: Optional[BacktestResultCache] = None
+
+
+def get_result_cache() -> BacktestResultCache:
+    """
+    Process-wide cache. Disk location: $SLICE_BACKTEST_CACHE_DIR, else
+    ~/.cache/slice/backtests; set the variable to "" for memory only. The
+    directory is capped at $SLICE_BACKTEST_CACHE_MAX_MB megabytes (default
+    1024, 0 for no cap), oldest files evicted first.
+    """
+    global _CACHE
+    if _CACHE is None:
+        env_dir = os.getenv("SLICE_BACKTEST_CACHE_DIR")
+        if env_dir is None:
+            directory: Optional[Path] = DEFAULT_CACHE_DIR
+        else:
+            directory = Path(env_dir) if env_dir else None
+        max_mb = os.getenv("SLICE_BACKTEST_CACHE_MAX_MB")
+        if max_mb is None:
+            max_disk_bytes: Optional[int] = DEFAULT_MAX_DISK_BYTES
+        else:
+            max_disk_bytes = int(float(max_mb) * (1 << 20)) or None
+        _CACHE = BacktestResultCache(directory, max_disk_bytes=max_disk_bytes)
+    return _CACHE
+
+
+@lru_cache(maxsize=None)
+def strategy_code_version(strategy_cls: Type) -> str:
+    """
+    Hash of the source of the strategy's module plus the engine modules.
+
+    Source files are located with importlib and read from disk, so the
+    hash covers every listed module whether or not this process has
+    imported it yet (the engines are imported lazily, after the key).
+    """
+    digest = hashlib.sha256()
+    for module_name in (strategy_cls.__module__,) + _ENGINE_MODULES:
+        digest.update(module_name.encode("utf-8"))
+        digest.update(_module_source(module_name))
+    return digest.hexdigest()[:16]
+
+
+def _module_source(module_name: str) -> bytes:
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None or not spec.origin or not spec.has_location:
+        return b""
+    try:
+        return Path(spec.origin).read_bytes()
+    except OSError:
+        return b""
+
+
+def data_fingerprint(
+    price_data: Mapping[str, pd.DataFrame],
+    econ_frames: Mapping[str, pd.DataFrame],
+) -> Dict[str, Any]:
+    """
+    Row count, last date and content hash of every price frame (by ticker)
+    and econ frame (by series_id) a backtest runs on. Taken from the frames
+    themselves rather than from the database, so a result is always stored
+    under the data it was computed from; any changed row changes the hash.
+    """
+    return {
+        "market_data": [_frame_digest(ticker, df, df.index) for ticker, df in sorted(price_data.items())],
+        "econ_data": [
+            _frame_digest(series_id, df, df["date"] if len(df) else df.index)
+            for series_id, df in sorted(econ_frames.items())
+        ],
+    }
+
+
+def _frame_digest(name: str, df: pd.DataFrame, dates) -> List[Any]:
+    digest = hashlib.sha256()
+    digest.update(",".join(map(str, df.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    last = str(pd.Timestamp(max(dates)).date()) if len(df) else None
+    return [name, int(len(df)), last, digest.hexdigest()[:16]]
+
+
+def backtest_cache_key(
+    strategy_id: str,
+    normalized_params: Dict[str, Any],
+    code_version: str,
+    fingerprint: Dict[str, Any],
+) -> str:
+    payload = json.dumps(
+        {
+            "strategy_id": strategy_id,
+            "params": normalized_params,
+            "code_version": code_version,
+            "data": fingerprint,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
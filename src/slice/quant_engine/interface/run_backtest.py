@@ -1,69 +1,94 @@
 # src/slice/quant_engine/interface/run_backtest.py
 
 from __future__ import annotations
-from datetime import datetime
 
+import itertools
 import json
-from typing import Any, Dict, List, Optional, Type
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, Union
 
-import backtrader as bt
+import numpy as np
 import pandas as pd
 
-from slice.quant_engine.core.cerebro import run_cerebro
-from slice.quant_engine.data.loader import load_price_data
-from slice.quant_engine.strategies.gold_real_yields import GoldRealYieldsStrategy
-from slice.quant_engine.strategies.usd_divergence import USDDivergenceStrategy
-from slice.quant_engine.strategies.curve_steepener import CurveSteepenerStrategy
-from slice.quant_engine.strategies.strategy_base import StrategyBase
-from slice.risk.schemas import TimeSeriesPoint, StrategyReturnSeries, BacktestResult
-
-# ---------- 1. Registry + placeholder strategy ----------
-
-class BuyAndHoldFirstSymbol(StrategyBase):
-    """
-    Placeholder strategy for testing:
-    - 100% long the first configured symbol at all times.
-    """
-
-    def compute_target_weights(self) -> Dict[str, float]:
-        symbols = self.p.symbols
-        if not symbols:
-            raise RuntimeError("BuyAndHoldFirstSymbol: no symbols configured")
-        first = symbols[0]
-        return {first: 1.0}
-
-
-_STRATEGY_REGISTRY: Dict[str, Type[StrategyBase]] = {
-    "BUY_AND_HOLD_FIRST": BuyAndHoldFirstSymbol,
-    "GOLD_REAL_YIELDS": GoldRealYieldsStrategy,
-    "USD_DIVERGENCE": USDDivergenceStrategy,
-    "CURVE_STEEPNER": CurveSteepenerStrategy,
-}
-
+from slice.quant_engine.core.checkpoint import (
+    BacktestCheckpoint,
+    checkpoint_params_key,
+    load_checkpoint,
+    save_checkpoint,
+)
+from slice.quant_engine.core.metrics import compute_backtest_metrics, compute_grouped_metrics
+from slice.quant_engine.core.results import (
+    ColumnarBacktestResult,
+    backtest_id_for,
+    positions_from_fills,
+    positions_from_orders,
+)
+from slice.quant_engine.core.trade_log import fill_records, trade_records
+from slice.quant_engine.data.econ_loader import econ_series_snapshot, load_econ_series, seed_econ_series
+from slice.quant_engine.data.loader import get_price_source, load_price_panel
+from slice.quant_engine.data.regimes import RegimeSpec, regime_labels, regime_series_ids, resolve_regimes
+from slice.quant_engine.interface.result_cache import (
+    backtest_cache_key,
+    data_fingerprint,
+    get_result_cache,
+    strategy_code_version,
+)
+from slice.quant_engine.strategies.registry import list_strategies, resolve_strategy
+from slice.risk.schemas import BacktestResult
+
+if TYPE_CHECKING:
+    import backtrader as bt
+
+    from slice.quant_engine.strategies.strategy_base import StrategyBase
+
+# Backtrader, the engines and the strategy modules are imported on first use
+# (see strategies/registry.py), so importing this module stays cheap.
+
+# ---------- 1. Strategy resolution ----------
 
 def _resolve_strategy(strategy_id: str) -> Type[StrategyBase]:
     """
-    Map strategy_id → StrategyBase subclass.
+    Map strategy_id → StrategyBase subclass, importing it on first use.
     """
     try:
-        return _STRATEGY_REGISTRY[strategy_id]
+        return resolve_strategy(strategy_id)
     except KeyError as exc:
         raise ValueError(
             f"Unknown strategy_id '{strategy_id}'. "
-            f"Registered strategies: {sorted(_STRATEGY_REGISTRY.keys())}"
+            f"Registered strategies: {list_strategies()}"
         ) from exc
 
 
+_ENGINES = ("backtrader", "vectorized")
+_RESULT_FORMATS = ("pydantic", "columnar")
+
+
+def _strategy_kwargs(strategy_cls: Type[StrategyBase], params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Pick the keys of `params` that are declared strategy params
+    (e.g. target_long, real_yield_ma_window). `symbols` is always set
+    from the loaded feeds, so it is never taken from params.
+    """
+    declared = set(strategy_cls.params._getkeys()) - {"symbols"}
+    return {k: v for k, v in params.items() if k in declared}
+
+
 # ---------- 2. Stub for run_backtest (we'll fill this next) ----------
 
-def run_backtest(strategy_id: str, params: Optional[Dict[str, Any]] = None) -> BacktestResult:
+def run_backtest(
+    strategy_id: str,
+    params: Optional[Dict[str, Any]] = None,
+) -> Union[BacktestResult, ColumnarBacktestResult]:
     """
     Phase 3 backtest interface.
 
     Parameters
     ----------
     strategy_id : str
-        Identifier for the strategy, resolved via _STRATEGY_REGISTRY.
+        Identifier for the strategy, resolved via strategies.registry.
     params : dict
         Expected keys:
           - "tickers": List[str] (required)
@@ -71,61 +96,211 @@ def run_backtest(strategy_id: str, params: Optional[Dict[str, Any]] = None) -> B
           - "end":    str/date-like, optional
           - "cash": float, optional (default 100_000.0)
           - "commission": float, optional (default 0.0)
+          - "engine": "backtrader" | "vectorized"; default: the strategy's
+            DEFAULT_ENGINE ("vectorized" for cross-sectional strategies,
+            else "backtrader"). The vectorized engine evaluates
+            StrategyBase.compute_weight_matrix() with NumPy instead of
+            running Cerebro bar by bar
+          - "analyzers": "standard" (default) | "none" (backtrader engine);
+            "none" runs without Backtrader analyzers/observers and computes
+            the metrics from the recorded equity curve afterwards
+          - "checkpoint": path, optional (backtrader engine only). If a
+            checkpoint for the same strategy/params exists there, only bars
+            after its last date are simulated and merged into the stored
+            result; the updated end state is written back either way
+          - "cache": bool, optional (default True). Identical requests over
+            identical loaded price / econ frames are answered from the
+            result cache (see result_cache.py) without running the engine;
+            checkpointed, streaming and instrumented runs and runs on an
+            injected price source always bypass it
+          - "streaming": bool, optional (default False, backtrader engine).
+            Read market_data through SliceStreamingData server-side cursor
+            feeds instead of loading DataFrames, and run Cerebro without
+            preloading, so memory is bounded by lookback windows
+          - "exactbars": int, optional; Backtrader exactbars for the run
+            (default 1 when streaming, 0 otherwise)
+          - "result_format": "pydantic" (default) | "columnar"; columnar
+            returns a ColumnarBacktestResult (dates / returns / equity /
+            positions arrays) and skips building per-bar TimeSeriesPoints
+          - "regimes": list, optional. Regime labellings of the bars
+            (see data/regimes.py): built-in names ("curve_sign", "cpi_yoy",
+            "year" for calendar years) or {"name", "expression", "bins",
+            "labels"} dicts. The run's returns are then also scored per
+            regime label, in metadata["regime_metrics"]
+          - "instrument": bool, optional (default False). Time the run and,
+            on the backtrader engine, the strategy's per-bar hot path
+            (compute_target_weights, order submission, notify_order,
+            orders per bar, FIFO trade matching); summary in metadata["profile"]
+            (see core/profiling.py). Instrumented runs bypass the cache
+          - keys matching the strategy's declared params (e.g. "target_long")
+            are passed to the strategy
           - additional keys are preserved in the output but ignored by this layer
 
     Returns
     -------
-    BacktestResultJSON : dict
-        {
-          "strategy_id": str,
-          "params": dict,
-          "tickers": List[str],
-          "period": {"start": str | None, "end": str | None},
-          "metrics": {
-              "total_return": float | None,
-              "sharpe": float | None,
-              "max_drawdown": float | None,
-              "max_drawdown_len": int | None,
-          },
-          "returns": [
-              {"date": "YYYY-MM-DD", "return": float},
-              ...
-          ],
-          "orders": [
-              {
-                  "datetime": str,
-                  "symbol": str,
-                  "size": float,
-                  "price": float,
-                  "value": float,
-                  "commission": float,
-                  "order_ref": int,
-                  "direction": "buy" | "sell",
-                  "status": "completed" | "partial",
-              },
-              ...
-          ],
-          "trades": [
-              {
-                  "symbol": str,
-                  "dt_open": str,
-                  "dt_close": str,
-                  "size": float,
-                  "price_open": float,
-                  "price_close": float,
-                  "pnl": float,
-                  "pnl_commission": float,
-              },
-              ...
-          ],
-        }
+    BacktestResult
+        One StrategyReturnSeries of per-bar returns. metadata holds
+        "engine", "metrics" (total_return, sharpe, max_drawdown,
+        max_drawdown_len) and, when applicable, "resumed_from" / "cache_key"
+        and "regime_metrics" ({regime: {label: metrics + "bars"}}) /
+        "profile" (data_load_s, engine_s and, on the backtrader engine,
+        cerebro_build_s, cerebro_run_s, per-section timings, orders_per_bar).
+    ColumnarBacktestResult (result_format="columnar")
+        The same as arrays, plus per-bar equity and positions and the raw
+        order / trade records:
+          orders: {datetime, symbol, size, price, value, commission,
+                   order_ref, direction, status}
+          trades: {symbol, dt_open, dt_close, size, price_open,
+                   price_close, pnl, pnl_commission}
     """
     params = params or {}
+    tickers = _require_tickers(params)
+
+    result_format = params.get("result_format", "pydantic")
+    if result_format not in _RESULT_FORMATS:
+        raise ValueError(
+            f"Unknown result_format '{result_format}'. Supported formats: {list(_RESULT_FORMATS)}"
+        )
+
+    # The cache fingerprints the loaded frames, so streaming runs (which
+    # load none) bypass it, as do runs on an injected price source
+    # (loader.set_price_source; tests and benchmarks) and instrumented
+    # runs, which are there to be timed.
+    instrument = bool(params.get("instrument", False))
+    use_cache = bool(
+        params.get("cache", True)
+        and not params.get("checkpoint")
+        and not params.get("streaming")
+        and not instrument
+        and get_price_source() is None
+    )
+
+    # --- resume point, if a matching checkpoint exists ---
+    checkpoint = _matching_checkpoint(strategy_id, params)
+    load_start = checkpoint.last_date if checkpoint is not None else params.get("start")
+
+    # --- load price data (or open streaming feeds) ---
+    load_started = time.perf_counter()
+    if params.get("streaming"):
+        from slice.quant_engine.data.feed import streaming_feeds
+
+        price_data = streaming_feeds(tickers, load_start, params.get("end"))
+    else:
+        price_data = _load_price_data_for(tickers, load_start, params.get("end"))
+
+    data_load_s = time.perf_counter() - load_started
+
+    # --- result cache, keyed on the frames the run will read ---
+    cache_key = None
+    econ_frames: Dict[str, pd.DataFrame] = {}
+    if use_cache:
+        econ_frames = _econ_frames_for(strategy_id, params, tickers)
+        cache_key = _result_cache_key(strategy_id, params, tickers, price_data, econ_frames)
+        cached = get_result_cache().get(cache_key)
+        if cached is not None:
+            return cached if result_format == "columnar" else cached.to_backtest_result()
+
+    # The strategy and regime labels read the fingerprinted econ frames
+    with econ_series_snapshot(econ_frames):
+        result = _run_backtest_on_data(strategy_id, params, price_data, checkpoint=checkpoint)
+    if instrument:
+        # streaming feeds read market_data during the run, so this is only
+        # the time to open them
+        result.metadata["profile"]["data_load_s"] = data_load_s
+
+    if cache_key is not None:
+        result.metadata["cache_key"] = cache_key
+        get_result_cache().put(cache_key, result)
+    return result if result_format == "columnar" else result.to_backtest_result()
 
-    # --- required param: tickers ---
+
+# Keys that control how a result is produced or stored, not what it is.
+_CACHE_CONTROL_KEYS = {"cache", "checkpoint", "result_format", "streaming", "exactbars", "instrument"}
+
+
+def _econ_frames_for(strategy_id: str, params: Dict[str, Any], tickers: List[str]) -> Dict[str, pd.DataFrame]:
+    """
+    Every econ series a run_backtest() request reads (the strategy's
+    inputs and its regime series), loaded once.
+    """
+    strategy_cls = _resolve_strategy(strategy_id)
+    p = strategy_cls.resolve_params(dict(_strategy_kwargs(strategy_cls, params), symbols=tickers))
+    series_ids = set(strategy_cls.required_econ_series(p))
+    series_ids.update(regime_series_ids(resolve_regimes(params.get("regimes") or [])))
+    return {series_id: load_econ_series(series_id) for series_id in sorted(series_ids)}
+
+
+def _result_cache_key(
+    strategy_id: str,
+    params: Dict[str, Any],
+    tickers: List[str],
+    price_data: Mapping[str, pd.DataFrame],
+    econ_frames: Mapping[str, pd.DataFrame],
+) -> str:
+    """
+    Content address of a run_backtest() request: strategy, params with
+    strategy defaults filled in, strategy/engine source version and a
+    fingerprint of the price and econ frames the run reads.
+    """
+    strategy_cls = _resolve_strategy(strategy_id)
+    p = strategy_cls.resolve_params(dict(_strategy_kwargs(strategy_cls, params), symbols=tickers))
+
+    normalized = {k: v for k, v in params.items() if k not in _CACHE_CONTROL_KEYS}
+    normalized.update({k: v for k, v in vars(p).items() if k != "symbols"})
+    normalized.setdefault("cash", 100_000.0)
+    normalized.setdefault("commission", 0.0)
+    normalized.setdefault("engine", strategy_cls.DEFAULT_ENGINE)
+
+    fingerprint = data_fingerprint(price_data, econ_frames)
+    return backtest_cache_key(strategy_id, normalized, strategy_code_version(strategy_cls), fingerprint)
+
+
+def _require_tickers(params: Dict[str, Any]) -> List[str]:
     tickers = params.get("tickers")
     if not tickers or not isinstance(tickers, (list, tuple)):
         raise ValueError("params['tickers'] must be a non-empty list of ticker strings.")
+    return list(tickers)
+
+
+def _load_price_data_for(tickers: List[str], start, end) -> Dict[str, pd.DataFrame]:
+    price_data = load_price_panel(tickers, start=start, end=end)
+    for ticker in tickers:
+        if ticker not in price_data:
+            raise ValueError(f"No price data found for ticker '{ticker}'.")
+    return price_data
+
+
+def _matching_checkpoint(strategy_id: str, params: Dict[str, Any]) -> Optional[BacktestCheckpoint]:
+    """
+    Checkpoint at params["checkpoint"] if it was written for the same
+    strategy and path-relevant params; otherwise None (full run).
+    """
+    path = params.get("checkpoint")
+    if not path:
+        return None
+    checkpoint = load_checkpoint(path)
+    if checkpoint is None:
+        return None
+    if checkpoint.strategy_id != strategy_id or checkpoint.params_key != checkpoint_params_key(params):
+        return None
+    return checkpoint
+
+
+def _run_backtest_on_data(
+    strategy_id: str,
+    params: Dict[str, Any],
+    price_data: Dict[str, pd.DataFrame],
+    checkpoint: Optional[BacktestCheckpoint] = None,
+) -> ColumnarBacktestResult:
+    """
+    run_backtest() on already-loaded price frames. `start`/`end` in params
+    slice the frames, so one load can serve many sub-period runs.
+
+    With a checkpoint, the run restarts on its last bar (to re-issue that
+    bar's orders, which the previous run never filled) with its cash,
+    positions and strategy state, and results are appended to it.
+    """
+    tickers = _require_tickers(params)
 
     # --- optional params ---
     start = params.get("start")
@@ -135,68 +310,236 @@ def run_backtest(strategy_id: str, params: Optional[Dict[str, Any]] = None) -> B
 
     # --- resolve strategy ---
     strategy_cls = _resolve_strategy(strategy_id)
-
-    # --- load price data ---
-    price_data: Dict[str, pd.DataFrame] = {}
+    strategy_kwargs = _strategy_kwargs(strategy_cls, params)
+    regimes = resolve_regimes(params.get("regimes") or [])
+
+    engine = params.get("engine", strategy_cls.DEFAULT_ENGINE)
+    if engine not in _ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'. Supported engines: {list(_ENGINES)}")
+    analyzer_set = params.get("analyzers", "standard")
+    streaming = bool(params.get("streaming", False))
+    if streaming and engine != "backtrader":
+        raise ValueError("params['streaming'] is only supported by the backtrader engine.")
+
+    # --- checkpointing (backtrader engine only) ---
+    checkpoint_path = params.get("checkpoint")
+    if checkpoint_path and engine != "backtrader":
+        raise ValueError("params['checkpoint'] is only supported by the backtrader engine.")
+    if checkpoint is not None:
+        start = checkpoint.last_date
+        cash = checkpoint.cash
+        strategy_kwargs["initial_positions"] = checkpoint.positions
+        strategy_kwargs["initial_state"] = checkpoint.strategy_state
+
+    # --- select price data ---
+    missing = [t for t in tickers if t not in price_data]
+    if missing:
+        raise ValueError(f"No price data loaded for tickers {missing}.")
+
+    selected: Dict[str, pd.DataFrame] = {}
     for ticker in tickers:
-        df = load_price_data(ticker, start=start, end=end)
+        df = price_data[ticker]
+        if not isinstance(df, pd.DataFrame):
+            # streaming feed, already windowed when it was opened
+            selected[ticker] = df
+            continue
+        if start is not None:
+            df = df[df.index >= pd.to_datetime(start)]
+        if end is not None:
+            df = df[df.index <= pd.to_datetime(end)]
         if df.empty:
             raise ValueError(f"No price data found for ticker '{ticker}'.")
-        price_data[ticker] = df
+        selected[ticker] = df
+    price_data = selected
 
     # --- run backtest ---
-    strat, analyzers = run_cerebro(
-        strategy_cls=strategy_cls,
-        price_data=price_data,
-        cash=cash,
-        commission=commission,
+    symbols = list(price_data.keys())
+    instrument = bool(params.get("instrument", False))
+    profile: Dict[str, Any] = {}
+    engine_started = time.perf_counter()
+    if engine == "vectorized":
+        from slice.quant_engine.core.vectorized import run_vectorized
+
+        run = run_vectorized(
+            strategy_cls=strategy_cls,
+            price_data=price_data,
+            cash=cash,
+            commission=commission,
+            strategy_params=strategy_kwargs,
+        )
+        engine_s = time.perf_counter() - engine_started
+        dates = run.dates.values.astype("datetime64[D]")
+        returns = run.returns
+        equity = run.equity
+        positions = run.positions
+        symbols = list(run.weights.columns)
+        metrics = compute_backtest_metrics(returns)
+        order_log, trade_log = run.order_log, run.trade_log
+    else:
+        from slice.quant_engine.core.cerebro import run_cerebro
+
+        strat, analyzers = run_cerebro(
+            strategy_cls=strategy_cls,
+            price_data=price_data,
+            cash=cash,
+            commission=commission,
+            strategy_params=strategy_kwargs,
+            analyzers=analyzer_set,
+            preload=not streaming,
+            exactbars=int(params.get("exactbars", 1 if streaming else 0)),
+            instrument=instrument,
+        )
+        engine_s = time.perf_counter() - engine_started
+        if "equity" in analyzers:
+            dates, returns = _returns_from_equity(analyzers["equity"], cash)
+            metrics = compute_backtest_metrics(returns)
+        else:
+            dates, returns = _returns_from_analyzers(analyzers)
+            metrics = _metrics_from_analyzers(analyzers, returns)
+        # Holdings restored from a checkpoint are lots opened on its last bar
+        fills = strat.fills.array
+        opening_day = _epoch_day(checkpoint.last_date) if checkpoint is not None else None
+        if strat.profiler is None:
+            trades = strat.match_trades(opening_day)
+        else:
+            trades = strat.profiler.call("match_trades", strat.match_trades, opening_day)
+            profile = strat.profiler.summary()
+
+        if checkpoint_path:
+            # Checkpointed records keep isoformat datetimes
+            order_log = fill_records(fills, strat.symbol_names, iso=True)
+            trade_log = trade_records(trades, strat.symbol_names, iso=True)
+            dates, returns, order_log, trade_log = _merge_with_checkpoint(
+                checkpoint, dates, returns, order_log, trade_log
+            )
+            metrics = compute_backtest_metrics(returns)
+            save_checkpoint(
+                checkpoint_path,
+                BacktestCheckpoint(
+                    strategy_id=strategy_id,
+                    params_key=checkpoint_params_key(params),
+                    returns=list(zip(dates.astype(str).tolist(), returns.tolist())),
+                    orders=order_log,
+                    trades=trade_log,
+                    **strat.snapshot(),
+                ),
+            )
+            positions = positions_from_orders(dates, symbols, order_log)
+        else:
+            order_log = fill_records(fills, strat.symbol_names)
+            trade_log = trade_records(trades, strat.symbol_names)
+            positions = positions_from_fills(dates, len(symbols), fills)
+
+        # A resumed run's returns start at the original start, so compound
+        # from the original cash rather than the checkpoint's.
+        equity = float(params.get("cash", 100_000.0)) * np.cumprod(1.0 + returns)
+
+    metadata: Dict[str, Any] = {"engine": engine, "metrics": metrics}
+    if instrument:
+        metadata["profile"] = dict(profile, engine_s=engine_s)
+    if checkpoint is not None:
+        metadata["resumed_from"] = checkpoint.last_date
+    if regimes:
+        metadata["regime_metrics"] = _regime_metrics(regimes, dates, returns)
+
+    return ColumnarBacktestResult(
+        backtest_id=backtest_id_for(strategy_id, dates),
+        strategy_id=strategy_id,
+        frequency="D",
+        dates=dates,
+        returns=returns,
+        equity=equity,
+        symbols=symbols,
+        positions=positions,
+        orders=order_log,
+        trades=trade_log,
+        metadata=metadata,
     )
 
-    # ===================== Returns series =====================
+
+def _merge_with_checkpoint(
+    checkpoint: Optional[BacktestCheckpoint],
+    dates: np.ndarray,
+    returns: np.ndarray,
+    order_log: List[dict],
+    trade_log: List[dict],
+):
+    """
+    Prepend the checkpointed history to a resumed run, dropping the
+    overlapping restart bar.
+    """
+    if checkpoint is None:
+        return dates, returns, order_log, trade_log
+
+    last = np.datetime64(pd.Timestamp(checkpoint.last_date).date(), "D")
+    keep = dates > last
+    old_dates = pd.to_datetime([d for d, _ in checkpoint.returns]).values.astype("datetime64[D]")
+    old_returns = np.array([r for _, r in checkpoint.returns], dtype=float)
+    return (
+        np.concatenate([old_dates, dates[keep]]),
+        np.concatenate([old_returns, returns[keep]]),
+        list(checkpoint.orders) + list(order_log),
+        list(checkpoint.trades) + list(trade_log),
+    )
+
+
+def _regime_metrics(
+    regimes: List[RegimeSpec],
+    dates: np.ndarray,
+    returns: np.ndarray,
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    {regime name: {label: metrics}} of one run's returns: each regime
+    labels the bars as of their dates, then all labels are scored in one
+    groupby pass (core/metrics.compute_grouped_metrics).
+    """
+    frames = {series_id: load_econ_series(series_id) for series_id in regime_series_ids(regimes)}
+    return {
+        spec.name: compute_grouped_metrics(returns, regime_labels(spec, dates, frames))
+        for spec in regimes
+    }
+
+
+def _epoch_day(date_like) -> int:
+    return int(np.datetime64(pd.Timestamp(date_like).date(), "D").astype(np.int64))
+
+
+def _returns_from_analyzers(analyzers: Dict[str, bt.Analyzer]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    TimeReturn analyzer as (datetime64[D] dates, float64 returns) arrays.
+    """
+    import backtrader as bt
+
     returns_analysis = analyzers["returns"].get_analysis()  # OrderedDict-like
-    returns_series: List[Dict[str, Any]] = []
 
-    for key, value in returns_analysis.items():
-        # key is usually datetime; fall back if not
-        if hasattr(key, "isoformat"):
-            date_str = key.isoformat()
-        else:
-            # Analyzer keys can be numeric bt dates; handle that
-            try:
-                date_str = bt.num2date(key).isoformat()
-            except Exception:
-                date_str = str(key)
-
-        returns_series.append({"date": date_str, "return": float(value)})
-
-    returns_points: List[TimeSeriesPoint] = [
-        TimeSeriesPoint(
-            date=datetime.fromisoformat(entry["date"]).date(),
-            value=float(entry["return"]),
-        )
-        for entry in returns_series
+    keys = [
+        # Analyzer keys are usually datetimes; numeric bt dates otherwise
+        key if hasattr(key, "isoformat") else bt.num2date(key)
+        for key in returns_analysis.keys()
     ]
+    dates = pd.DatetimeIndex(keys).values.astype("datetime64[D]")
+    returns = np.fromiter(returns_analysis.values(), dtype=float, count=len(keys))
+    return dates, returns
 
-    strategy_series = StrategyReturnSeries(
-        strategy_id=strategy_id,
-        frequency="D",
-        returns=returns_points,
-    )
 
-    if returns_points:
-        start_date = returns_points[0].date
-        end_date = returns_points[-1].date
-        backtest_id = f"{strategy_id}_{start_date}_{end_date}"
-    else:
-        backtest_id = f"{strategy_id}_EMPTY"
+def _returns_from_equity(recorder: bt.Analyzer, cash: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-bar returns from EquityRecorder values, as TimeReturn computes them
+    (value / previous value - 1, the first bar against starting cash).
+    """
+    analysis = recorder.get_analysis()
+    values = analysis["value"]
+    previous = np.concatenate([[cash], values[:-1]])
+    return analysis["date"], values / previous - 1.0
 
-    backtest = BacktestResult(
-        backtest_id=backtest_id,
-        frequency="D",
-        strategies=[strategy_series],
-    )
 
-    # ===================== Metrics =====================
+def _metrics_from_analyzers(
+    analyzers: Dict[str, bt.Analyzer],
+    returns: np.ndarray,
+) -> Dict[str, Any]:
+    """
+    Build the metrics dict from the Sharpe/DrawDown analyzers.
+    """
     sharpe_raw = analyzers["sharpe"].get_analysis().get("sharperatio", None)
 
     dd_analysis = analyzers["drawdown"].get_analysis()
@@ -208,54 +551,405 @@ def run_backtest(strategy_id: str, params: Optional[Dict[str, Any]] = None) -> B
         max_dd_len = None
 
     # total return from daily returns
-    try:
-        series = pd.Series([x["return"] for x in returns_series], dtype=float)
-        total_return = float((1.0 + series).prod() - 1.0)
-    except Exception:
-        total_return = None
+    total_return = float(np.prod(1.0 + returns) - 1.0)
 
-    metrics = {
+    return {
         "total_return": total_return,
         "sharpe": float(sharpe_raw) if sharpe_raw is not None else None,
         "max_drawdown": max_dd,
         "max_drawdown_len": max_dd_len,
     }
 
-    # ===================== Orders & trades =====================
-    orders: List[Dict[str, Any]] = []
-    for o in getattr(strat, "order_log", []):
-        rec = dict(o)
-        dt = rec.get("datetime")
-        if dt is not None and hasattr(dt, "isoformat"):
-            rec["datetime"] = dt.isoformat()
-        orders.append(rec)
-
-    trades: List[Dict[str, Any]] = []
-    for tr in getattr(strat, "trade_log", []):
-        rec = dict(tr)
-        for field in ("dt_open", "dt_close"):
-            dt = rec.get(field)
-            if dt is not None and hasattr(dt, "isoformat"):
-                rec[field] = dt.isoformat()
-        trades.append(rec)
-
-    # ===================== Period summary =====================
-    if returns_series:
-        period_start = returns_series[0]["date"]
-        period_end = returns_series[-1]["date"]
+
+# ---------- 3. Parameter sweeps ----------
+
+# Set in each sweep worker by _init_sweep_worker(); holds the price frames
+# loaded once by the parent process.
+_WORKER_PRICE_DATA: Dict[str, pd.DataFrame] = {}
+
+
+def _expand_grid(grid: Mapping[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    {"a": [1, 2], "b": [x]} -> [{"a": 1, "b": x}, {"a": 2, "b": x}]
+    """
+    if "tickers" in grid:
+        raise ValueError("grid cannot vary 'tickers'; run one sweep per ticker set.")
+    keys = list(grid.keys())
+    for key in keys:
+        if isinstance(grid[key], (str, bytes)) or not isinstance(grid[key], Sequence):
+            raise ValueError(f"grid['{key}'] must be a list of values.")
+    return [dict(zip(keys, combo)) for combo in itertools.product(*(grid[k] for k in keys))]
+
+
+def _init_sweep_worker(
+    price_data: Dict[str, pd.DataFrame],
+    econ_frames: Dict[str, pd.DataFrame],
+) -> None:
+    global _WORKER_PRICE_DATA
+    _WORKER_PRICE_DATA = price_data
+    for series_id, df in econ_frames.items():
+        seed_econ_series(series_id, df)
+
+
+def _sweep_job(
+    strategy_id: str,
+    params: Dict[str, Any],
+    point: Dict[str, Any],
+    score_start: Optional[pd.Timestamp] = None,
+) -> Dict[str, Any]:
+    """
+    One sweep row. With score_start, the run starts earlier to warm up and
+    its metrics are computed from the returns on and after score_start.
+    """
+    row: Dict[str, Any] = dict(point)
+    try:
+        backtest = _run_backtest_on_data(strategy_id, params, _WORKER_PRICE_DATA)
+    except Exception as exc:
+        row.update({"backtest_id": None, "error": f"{type(exc).__name__}: {exc}"})
+        return row
+
+    metrics = backtest.metadata.get("metrics", {})
+    if score_start is not None:
+        scored = backtest.dates >= np.datetime64(pd.Timestamp(score_start).date(), "D")
+        metrics = compute_backtest_metrics(backtest.returns[scored])
+    row.update(metrics)
+    row.update({"backtest_id": backtest.backtest_id, "error": None})
+    return row
+
+
+def iter_parameter_sweep(
+    strategy_id: str,
+    base_params: Dict[str, Any],
+    grid: Mapping[str, Sequence[Any]],
+    max_workers: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run run_backtest() for every combination in `grid` and yield one row per
+    combination as it completes: {grid keys..., metrics..., backtest_id, error}.
+
+    Price data for base_params["tickers"] and every econ series the grid
+    needs are loaded once here and handed to the worker processes, so jobs
+    never query Postgres. max_workers=1 runs in-process. Backtrader jobs run
+    with analyzers="none" unless base_params sets it.
+    """
+    points = _expand_grid(grid)
+    price_data, econ_frames = _sweep_inputs(strategy_id, base_params, points)
+
+    jobs = [
+        (strategy_id, {"analyzers": "none", **base_params, **point}, point)
+        for point in points
+    ]
+    with _sweep_pool(price_data, econ_frames, max_workers) as pool:
+        for _, row in _run_sweep_jobs(pool, jobs):
+            yield row
+
+
+def _sweep_inputs(
+    strategy_id: str,
+    base_params: Dict[str, Any],
+    points: List[Dict[str, Any]],
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, pd.DataFrame]]:
+    """
+    Price frames for base_params["tickers"] and the econ frames every grid
+    point needs, loaded once for all sweep jobs.
+    """
+    tickers = _require_tickers(base_params)
+    strategy_cls = _resolve_strategy(strategy_id)
+    if base_params.get("checkpoint"):
+        raise ValueError("parameter sweeps do not support params['checkpoint'].")
+
+    price_data = _load_price_data_for(tickers, base_params.get("start"), base_params.get("end"))
+
+    econ_ids = set()
+    for point in points:
+        p = strategy_cls.resolve_params({**base_params, **point})
+        econ_ids.update(strategy_cls.required_econ_series(p))
+        econ_ids.update(regime_series_ids(resolve_regimes({**base_params, **point}.get("regimes") or [])))
+    econ_frames = {series_id: load_econ_series(series_id) for series_id in sorted(econ_ids)}
+    return price_data, econ_frames
+
+
+@contextmanager
+def _sweep_pool(
+    price_data: Dict[str, pd.DataFrame],
+    econ_frames: Dict[str, pd.DataFrame],
+    max_workers: Optional[int],
+) -> Iterator[Optional[ProcessPoolExecutor]]:
+    """
+    Worker pool primed with the sweep inputs; None (jobs run in-process)
+    when max_workers == 1.
+    """
+    if max_workers == 1:
+        _init_sweep_worker(price_data, econ_frames)
+        yield None
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_sweep_worker,
+        initargs=(price_data, econ_frames),
+    ) as pool:
+        yield pool
+
+
+def _run_sweep_jobs(
+    pool: Optional[ProcessPoolExecutor],
+    jobs: Sequence[Tuple[Any, ...]],
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    (job index, result row) for each job, in completion order.
+    """
+    if pool is None:
+        for i, job in enumerate(jobs):
+            yield i, _sweep_job(*job)
+        return
+
+    futures = {pool.submit(_sweep_job, *job): i for i, job in enumerate(jobs)}
+    for future in as_completed(futures):
+        yield futures[future], future.result()
+
+
+def run_parameter_sweep(
+    strategy_id: str,
+    base_params: Dict[str, Any],
+    grid: Mapping[str, Sequence[Any]],
+    max_workers: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Collect iter_parameter_sweep() into a tidy DataFrame: one row per grid
+    point, grid keys + metrics as columns, in grid order.
+
+    Example
+    -------
+    run_parameter_sweep(
+        "GOLD_REAL_YIELDS",
+        {"tickers": ["GLD"], "engine": "vectorized"},
+        {"real_yield_ma_window": [20, 60, 120], "target_long": [0.25, 0.5]},
+        max_workers=4,
+    )
+    """
+    keys = list(grid.keys())
+    rows = list(iter_parameter_sweep(strategy_id, base_params, grid, max_workers=max_workers))
+    table = pd.DataFrame(rows)
+    if rows and keys:
+        table = table.sort_values(keys, kind="stable").reset_index(drop=True)
+    return table
+
+
+def run_successive_halving(
+    strategy_id: str,
+    base_params: Dict[str, Any],
+    grid: Mapping[str, Sequence[Any]],
+    metric: str = "sharpe",
+    maximize: bool = True,
+    eta: int = 3,
+    min_period_bars: int = 126,
+    max_workers: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Adaptive alternative to run_parameter_sweep(): successive halving.
+
+    Every grid point is first backtested on a short trailing window of
+    [start, end] (its most recent bars, never fewer than min_period_bars);
+    only the best 1/eta by `metric` go on to the next round, whose window
+    is eta times longer and ends at the same bar, until the survivors are
+    run on the full period. Each window's run starts the strategy's
+    warmup_bars() before the window (as far as [start, end] allows), so
+    price lookbacks are filled, and is scored on the window's returns
+    only. Failed runs and missing metrics rank last.
+
+    Inputs are loaded once and one worker pool serves every round, as in
+    iter_parameter_sweep().
+
+    Returns one row per evaluation: grid keys, "round" (0 = shortest),
+    "period_start", metrics, backtest_id, error. Rows are ordered last round
+    first, best first, so the head of the table is the final ranking.
+    """
+    if eta < 2:
+        raise ValueError("eta must be >= 2.")
+    if min_period_bars < 1:
+        raise ValueError("min_period_bars must be >= 1.")
+
+    keys = list(grid.keys())
+    points = _expand_grid(grid)
+    price_data, econ_frames = _sweep_inputs(strategy_id, base_params, points)
+
+    calendar = pd.DatetimeIndex(
+        sorted(set().union(*(df.index for df in price_data.values())))
+    )
+    start, end = base_params.get("start"), base_params.get("end")
+    if start is not None:
+        calendar = calendar[calendar >= pd.to_datetime(start)]
+    if end is not None:
+        calendar = calendar[calendar <= pd.to_datetime(end)]
+    if calendar.empty:
+        raise ValueError("No price data in the requested period.")
+
+    # Rounds: enough to narrow the grid down to one point, as long as the
+    # first period keeps min_period_bars bars
+    rounds = 1 + int(math.floor(math.log(max(len(points), 1), eta) + 1e-9))
+    while rounds > 1 and len(calendar) / eta ** (rounds - 1) < min_period_bars:
+        rounds -= 1
+
+    def score(row: Dict[str, Any]) -> float:
+        value = row.get(metric) if row.get("error") is None else None
+        if value is None or not math.isfinite(float(value)):
+            return -math.inf
+        return float(value) if maximize else -float(value)
+
+    strategy_cls = _resolve_strategy(strategy_id)
+    warmup = [
+        strategy_cls.warmup_bars(strategy_cls.resolve_params({**base_params, **point}))
+        for point in points
+    ]
+
+    rows: List[Dict[str, Any]] = []
+    survivors = list(range(len(points)))
+    with _sweep_pool(price_data, econ_frames, max_workers) as pool:
+        for round_no in range(rounds):
+            bars = math.ceil(len(calendar) / eta ** (rounds - 1 - round_no))
+            period_start = calendar[-bars]
+            jobs = [
+                (
+                    strategy_id,
+                    {
+                        "analyzers": "none",
+                        **base_params,
+                        **points[i],
+                        "start": calendar[max(len(calendar) - bars - warmup[i], 0)],
+                    },
+                    points[i],
+                    period_start,
+                )
+                for i in survivors
+            ]
+            scores: Dict[int, float] = {}
+            for job_no, row in _run_sweep_jobs(pool, jobs):
+                i = survivors[job_no]
+                scores[i] = score(row)
+                rows.append(dict(row, round=round_no, period_start=period_start.date()))
+
+            if round_no < rounds - 1:
+                keep = max(1, len(survivors) // eta)
+                survivors = sorted(survivors, key=lambda i: (-scores[i], i))[:keep]
+
+    table = pd.DataFrame(rows)
+    table["_score"] = [score(row) for row in rows]
+    table = table.sort_values(
+        ["round", "_score"] + keys, ascending=[False, False] + [True] * len(keys), kind="stable"
+    )
+    return table.drop(columns="_score").reset_index(drop=True)
+
+
+# ---------- 4. Combined multi-strategy runs ----------
+
+# Keys that must agree across the requests of a combined run (one calendar,
+# one broker, one engine).
+_COMBINED_SHARED_KEYS = {"start": None, "end": None, "commission": 0.0, "engine": "backtrader"}
+
+
+def run_backtests_combined(
+    requests: Sequence[Tuple[str, Dict[str, Any]]],
+) -> BacktestResult:
+    """
+    Backtest several strategies over one load of the union of their tickers
+    and return a single BacktestResult with one StrategyReturnSeries each.
+
+    Each request is (strategy_id, params) as for run_backtest(). "start",
+    "end", "commission" and "engine" must be the same in every request;
+    "cash" is the strategy's own sub-account. Series are labelled
+    params["label"] if given, else strategy_id (labels must be unique).
+
+    With the backtrader engine all strategies run in one Cerebro pass, each
+    sizing and booking against its own sub-account (StrategyBase
+    sub_account); the vectorized engine runs each strategy on the shared
+    frames. metadata["metrics"] is {label: metrics}.
+    """
+    if not requests:
+        raise ValueError("run_backtests_combined() needs at least one (strategy_id, params) request.")
+
+    shared: Dict[str, Any] = {}
+    for key, default in _COMBINED_SHARED_KEYS.items():
+        values = {json.dumps(params.get(key, default), default=str) for _, params in requests}
+        if len(values) > 1:
+            raise ValueError(f"params['{key}'] must be the same for every combined strategy.")
+        shared[key] = requests[0][1].get(key, default)
+    if shared["engine"] not in _ENGINES:
+        raise ValueError(f"Unknown engine '{shared['engine']}'. Supported engines: {list(_ENGINES)}")
+
+    labels = [params.get("label", strategy_id) for strategy_id, params in requests]
+    if len(set(labels)) != len(labels):
+        raise ValueError(f"Combined strategies need unique labels, got {labels}.")
+
+    tickers: List[str] = []
+    for _, params in requests:
+        tickers.extend(t for t in _require_tickers(params) if t not in tickers)
+    price_data = _load_price_data_for(tickers, shared["start"], shared["end"])
+
+    if shared["engine"] == "vectorized":
+        runs = [
+            _run_backtest_on_data(strategy_id, params, price_data)
+            for strategy_id, params in requests
+        ]
     else:
-        period_start = None
-        period_end = None
-
-    result: Dict[str, Any] = {
-        "strategy_id": strategy_id,
-        "params": params,
-        "tickers": list(tickers),
-        "period": {"start": period_start, "end": period_end},
-        "metrics": metrics,
-        "returns": returns_series,
-        "orders": orders,
-        "trades": trades,
-    }
+        runs = _run_combined_cerebro(requests, price_data, float(shared["commission"]))
+
+    series = []
+    for label, run in zip(labels, runs):
+        strategy_series = run.to_backtest_result().strategies[0]
+        strategy_series.strategy_id = label
+        series.append(strategy_series)
+
+    all_dates = np.concatenate([run.dates for run in runs])
+    return BacktestResult.model_construct(
+        backtest_id=backtest_id_for("+".join(labels), np.unique(all_dates)),
+        frequency="D",
+        strategies=series,
+        metadata={
+            "engine": shared["engine"],
+            "strategies": {label: strategy_id for label, (strategy_id, _) in zip(labels, requests)},
+            "metrics": {label: run.metadata["metrics"] for label, run in zip(labels, runs)},
+        },
+    )
+
 
-    return backtest
+def _run_combined_cerebro(
+    requests: Sequence[Tuple[str, Dict[str, Any]]],
+    price_data: Dict[str, pd.DataFrame],
+    commission: float,
+) -> List[ColumnarBacktestResult]:
+    strategies = []
+    for strategy_id, params in requests:
+        strategy_cls = _resolve_strategy(strategy_id)
+        strategies.append((
+            strategy_cls,
+            dict(
+                _strategy_kwargs(strategy_cls, params),
+                symbols=_require_tickers(params),
+                sub_account=float(params.get("cash", 100_000.0)),
+            ),
+        ))
+
+    from slice.quant_engine.core.cerebro import run_cerebro_combined
+
+    results = run_cerebro_combined(strategies, price_data, commission=commission)
+
+    runs: List[ColumnarBacktestResult] = []
+    for (strategy_id, params), (strat, analyzers) in zip(requests, results):
+        cash = float(params.get("cash", 100_000.0))
+        dates, returns = _returns_from_equity(analyzers["equity"], cash)
+        symbols = _require_tickers(params)
+        runs.append(ColumnarBacktestResult(
+            backtest_id=backtest_id_for(strategy_id, dates),
+            strategy_id=strategy_id,
+            frequency="D",
+            dates=dates,
+            returns=returns,
+            equity=analyzers["equity"].get_analysis()["value"],
+            symbols=symbols,
+            positions=positions_from_orders(dates, symbols, strat.order_log),
+            orders=strat.order_log,
+            trades=strat.trade_log,
+            metadata={"engine": "backtrader", "metrics": compute_backtest_metrics(returns)},
+        ))
+    return runs
@@ -0,0 +1,33 @@
+# src/slice/quant_engine/strategies/buy_and_hold.py
+
+from __future__ import annotations
+
+from typing import Dict
+
+import pandas as pd
+
+from slice.quant_engine.strategies.strategy_base import StrategyBase
+
+
+class BuyAndHoldFirstSymbol(StrategyBase):
+    """
+    Placeholder strategy for testing:
+    - 100% long the first configured symbol at all times.
+    """
+
+    STRATEGY_ID = "BUY_AND_HOLD_FIRST"
+
+    def compute_target_weights(self) -> Dict[str, float]:
+        symbols = self.p.symbols
+        if not symbols:
+            raise RuntimeError("BuyAndHoldFirstSymbol: no symbols configured")
+        first = symbols[0]
+        return {first: 1.0}
+
+    @classmethod
+    def compute_weight_matrix(cls, closes: pd.DataFrame, p) -> pd.DataFrame:
+        if closes.columns.empty:
+            raise RuntimeError("BuyAndHoldFirstSymbol: no symbols configured")
+        weights = pd.DataFrame(0.0, index=closes.index, columns=closes.columns)
+        weights[closes.columns[0]] = 1.0
+        return weights
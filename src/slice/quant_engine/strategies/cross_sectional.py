@@ -0,0 +1,156 @@
+# src/slice/quant_engine/strategies/cross_sectional.py
+
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from slice.quant_engine.strategies.strategy_base import StrategyBase, bt_dates
+
+
+# ---------- Panel helpers (dates × symbols) ----------
+
+def trailing_return(closes: pd.DataFrame, lookback: int, skip: int = 0) -> pd.DataFrame:
+    """
+    Return from close t - skip - lookback to close t - skip, per symbol.
+    NaN until both closes exist.
+    """
+    if lookback < 1 or skip < 0:
+        raise ValueError(f"lookback must be >= 1 and skip >= 0, got lookback={lookback}, skip={skip}")
+    px = closes.to_numpy(dtype=float)
+    out = np.full(px.shape, np.nan)
+    span = lookback + skip
+    if len(px) > span:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[span:] = px[lookback: len(px) - skip] / px[: len(px) - span] - 1.0
+    return pd.DataFrame(out, index=closes.index, columns=closes.columns)
+
+
+def rolling_volatility(closes: pd.DataFrame, window: int, periods_per_year: int = 252) -> pd.DataFrame:
+    """
+    Annualized standard deviation of daily log returns over `window` bars.
+    """
+    if window < 2:
+        raise ValueError(f"window must be >= 2, got {window}")
+    log_ret = np.log(closes).diff()
+    return log_ret.rolling(window).std() * np.sqrt(periods_per_year)
+
+
+def cross_sectional_rank(scores: pd.DataFrame, ascending: bool = False) -> pd.DataFrame:
+    """
+    Rank of each symbol among the symbols scored on that date: 1 is the
+    highest score (lowest with ascending=True); NaN scores stay unranked.
+    Ties keep column order.
+    """
+    return scores.rank(axis=1, ascending=ascending, method="first")
+
+
+def top_n_mask(scores: pd.DataFrame, n: int, ascending: bool = False) -> pd.DataFrame:
+    """
+    True for the n best-scored symbols on each date.
+    """
+    if n < 1:
+        raise ValueError(f"n must be >= 1, got {n}")
+    return cross_sectional_rank(scores, ascending=ascending) <= n
+
+
+def inverse_volatility_weights(
+    selected: pd.DataFrame,
+    volatility: pd.DataFrame,
+    gross_exposure: float = 1.0,
+    target_volatility: Optional[float] = None,
+) -> pd.DataFrame:
+    """
+    Weights over the selected symbols, proportional to 1 / volatility.
+
+    Without target_volatility each row sums to gross_exposure. With it,
+    each selected symbol gets target_volatility / (volatility × count)
+    (every position contributes the same standalone risk), scaled down
+    where the row would exceed gross_exposure. Symbols without a usable
+    volatility get no weight.
+    """
+    vol = volatility.reindex_like(selected).to_numpy(dtype=float)
+    mask = selected.to_numpy(dtype=bool) & np.isfinite(vol) & (vol > 0.0)
+    inv = np.where(mask, 1.0 / np.where(mask, vol, 1.0), 0.0)
+
+    if target_volatility is None:
+        total = inv.sum(axis=1, keepdims=True)
+        weights = np.divide(inv * gross_exposure, total, out=np.zeros_like(inv), where=total > 0.0)
+    else:
+        count = mask.sum(axis=1, keepdims=True)
+        weights = np.divide(inv * target_volatility, count, out=np.zeros_like(inv), where=count > 0)
+        gross = weights.sum(axis=1, keepdims=True)
+        scale = np.divide(gross_exposure, gross, out=np.ones_like(gross), where=gross > gross_exposure)
+        weights = weights * scale
+    return pd.DataFrame(weights, index=selected.index, columns=selected.columns)
+
+
+# ---------- Base class ----------
+
+class CrossSectionalStrategy(StrategyBase):
+    """
+    Base class for strategies that decide on the whole universe at once.
+
+    Subclasses implement compute_weight_matrix(closes, p) on the full
+    dates × symbols close panel (see the helpers above for ranking, top-N
+    selection and volatility scaling). The vectorized engine, the default
+    for these strategies, uses it directly, so universes of hundreds of
+    symbols run in seconds.
+
+    On the backtrader engine the same matrix is computed once in start()
+    from the preloaded feeds, and compute_target_weights() returns the row
+    of the current bar; both engines therefore trade the same targets.
+    """
+
+    DEFAULT_ENGINE = "vectorized"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._weight_rows: Optional[np.ndarray] = None
+        self._weight_dates: Optional[np.ndarray] = None
+        self._weight_symbols = list(self.symbol_to_data)
+        self._flat_weights: Dict[str, float] = {s: 0.0 for s in self._weight_symbols}
+
+    def start(self) -> None:
+        super().start()
+
+        closes = self._close_panel()
+        p = self.resolve_params(dict(self.p._getkwargs(), symbols=self._weight_symbols))
+        weights = self.compute_weight_matrix(closes, p)
+        if not isinstance(weights, pd.DataFrame):
+            raise TypeError("compute_weight_matrix() must return a pandas DataFrame.")
+        weights = weights.reindex(index=closes.index, columns=self._weight_symbols).fillna(0.0)
+
+        self._weight_rows = weights.to_numpy(dtype=float)
+        self._weight_dates = closes.index.values.astype("datetime64[D]")
+
+    def compute_target_weights(self) -> Dict[str, float]:
+        today = np.datetime64(self.datetime.date(0), "D")
+        row = int(np.searchsorted(self._weight_dates, today, side="right")) - 1
+        if row < 0:
+            return self._flat_weights
+        return dict(zip(self._weight_symbols, self._weight_rows[row].tolist()))
+
+    def _close_panel(self) -> pd.DataFrame:
+        """
+        Preloaded feeds as a dates × symbols close panel, built the way
+        core.vectorized.build_price_panels() does (union calendar, closes
+        forward-filled across gaps).
+        """
+        closes: Dict[str, pd.Series] = {}
+        for symbol, data in self.symbol_to_data.items():
+            if data.buflen() <= 0:
+                raise RuntimeError(
+                    f"{type(self).__name__} needs preloaded feeds; "
+                    "use the vectorized engine or disable streaming."
+                )
+            n = data.buflen()
+            raw = np.asarray(data.datetime.array, dtype=float)[:n]
+            closes[symbol] = pd.Series(
+                np.asarray(data.close.array, dtype=float)[:n],
+                index=pd.DatetimeIndex(bt_dates(raw)),
+            )
+        panel = pd.DataFrame(closes).sort_index().ffill()
+        return panel[~panel.index.duplicated(keep="last")]
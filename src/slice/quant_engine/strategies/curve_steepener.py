@@ -11,7 +11,7 @@ Data inputs:
 Signal:
   - Compute slope = y10 - y2.
   - Compute rolling mean of slope over slope_ma_window.
-  - If slope > slope_MA on the bar date, target_long weight is applied to price_symbol; otherwise flat.
+  - If slope > slope_MA as of the bar date, target_long weight is applied to price_symbol; otherwise flat.
 
 Parameters (params dict):
   - symbols: list[str] | None — tickers supplied by Cerebro; must include price_symbol.
@@ -23,13 +23,14 @@ Parameters (params dict):
 """
 from __future__ import annotations
 
-import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from slice.quant_engine.strategies.strategy_base import StrategyBase
 from slice.quant_engine.data import load_econ_series
+from slice.quant_engine.data.signal_store import SignalSpec, get_signal_store
 
 
 class CurveSteepenerStrategy(StrategyBase):
@@ -48,6 +49,8 @@ class CurveSteepenerStrategy(StrategyBase):
       - If data missing or no overlap, strategy is disabled and remains flat.
     """
 
+    STRATEGY_ID = "CURVE_STEEPNER"
+
     params = dict(
         symbols=None,              # list of tickers provided by Cerebro; must include price_symbol
         price_symbol="TBF",        # steepener proxy price symbol resolved via market_data
@@ -64,6 +67,11 @@ class CurveSteepenerStrategy(StrategyBase):
         self._target_long: float = float(self.p.target_long)
         self._ma_window: int = int(self.p.slope_ma_window)
 
+        # Built once; compute_target_weights() returns one of these per bar.
+        self._flat_weights: Dict[str, float] = {s: 0.0 for s in self.p.symbols or []}
+        self._long_weights: Dict[str, float] = dict(self._flat_weights)
+        self._long_weights[self._price_symbol] = self._target_long
+
         if self.p.symbols is None or self._price_symbol not in self.p.symbols:
             self.log(
                 f"[CurveSteepener] price_symbol '{self._price_symbol}' "
@@ -74,99 +82,118 @@ class CurveSteepenerStrategy(StrategyBase):
             self._slope_ma = None
             return
 
-        y2_id = self.p.y2_series_id
-        y10_id = self.p.y10_series_id
+        signal = self._load_signal(self.p)
+        if signal is None:
+            self._enabled = False
+            self._slope = None
+            self._slope_ma = None
+            return
+
+        self._enabled = True
+        self._slope, self._slope_ma = signal
+
+        price_data = self.symbol_to_data[self._price_symbol]
+        self.register_signal("slope", self._slope, price_data)
+        self.register_signal("slope_ma", self._slope_ma, price_data)
+
+    @classmethod
+    def _load_signal(cls, p) -> Optional[Tuple[pd.Series, pd.Series]]:
+        """
+        Load the 10Y-minus-2Y slope and its rolling mean, indexed by date.
+        Returns None (after logging why) if the econ data is unusable.
+        """
+        y2_id = p.y2_series_id
+        y10_id = p.y10_series_id
+        ma_window = int(p.slope_ma_window)
 
         y2_df = load_econ_series(y2_id)
         y10_df = load_econ_series(y10_id)
 
         if y2_df.empty or y10_df.empty:
-            self.log(
+            cls.log(
                 f"[CurveSteepener] Missing econ data for y2_id='{y2_id}' "
                 f"or y10_id='{y10_id}'. Strategy will remain flat."
             )
-            self._enabled = False
-            self._slope = None
-            self._slope_ma = None
-            return
+            return None
 
         for label, df in (("2Y", y2_df), ("10Y", y10_df)):
             if not {"date", "value"}.issubset(df.columns):
-                self.log(
+                cls.log(
                     f"[CurveSteepener] {label} econ_df has unexpected columns "
                     f"{list(df.columns)}; staying flat."
                 )
-                self._enabled = False
-                self._slope = None
-                self._slope_ma = None
-                return
+                return None
 
-        y2_df = y2_df.copy()
-        y10_df = y10_df.copy()
+        signal = get_signal_store().get(
+            SignalSpec("curve_steepener.slope", (y2_id, y10_id), ma_window),
+            [y2_df, y10_df],
+            cls._slope_level,
+        )
+        if signal is None:
+            cls.log("[CurveSteepener] No overlapping dates between 2Y and 10Y series; staying flat.")
+            return None
+        slope, slope_ma = signal
 
-        if not pd.api.types.is_datetime64_any_dtype(y2_df["date"]):
-            y2_df["date"] = pd.to_datetime(y2_df["date"])
-        if not pd.api.types.is_datetime64_any_dtype(y10_df["date"]):
-            y10_df["date"] = pd.to_datetime(y10_df["date"])
+        cls.log(
+            f"[CurveSteepener] Initialized with y2_id='{y2_id}', y10_id='{y10_id}', "
+            f"{len(slope)} overlapping points, MA window={ma_window}."
+        )
+        return slope, slope_ma
 
-        y2_df = y2_df.sort_values("date")
-        y10_df = y10_df.sort_values("date")
+    @staticmethod
+    def _slope_level(frames: List[pd.DataFrame]) -> pd.Series:
+        """
+        10Y-minus-2Y slope indexed by date (signal store level function).
+        """
+        y2_df, y10_df = (df.sort_values("date") for df in frames)
 
-        y2_df.set_index(y2_df["date"].dt.date, inplace=True)
-        y10_df.set_index(y10_df["date"].dt.date, inplace=True)
+        y2_df = y2_df.set_index(y2_df["date"].dt.date)
+        y10_df = y10_df.set_index(y10_df["date"].dt.date)
 
         joined = pd.DataFrame({
             "y2": y2_df["value"].astype(float),
             "y10": y10_df["value"].astype(float),
         }).dropna()
-
-        if joined.empty:
-            self.log("[CurveSteepener] No overlapping dates between 2Y and 10Y series; staying flat.")
-            self._enabled = False
-            self._slope = None
-            self._slope_ma = None
-            return
-
-        slope = joined["y10"] - joined["y2"]
-        slope_ma = slope.rolling(self._ma_window).mean()
-
-        self._enabled = True
-        self._slope = slope
-        self._slope_ma = slope_ma
-
-        self.log(
-            f"[CurveSteepener] Initialized with y2_id='{y2_id}', y10_id='{y10_id}', "
-            f"{len(slope)} overlapping points, MA window={self._ma_window}."
-        )
+        return joined["y10"] - joined["y2"]
 
     def compute_target_weights(self) -> Dict[str, float]:
-        symbols = self.p.symbols or []
-        weights: Dict[str, float] = {s: 0.0 for s in symbols}
+        if not self._enabled:
+            return self._flat_weights
 
-        if not getattr(self, "_enabled", False):
-            return weights
+        # Econ values as-of this bar, aligned in start(); NaN before the
+        # first available value or while the MA warms up → stay flat
+        sl = self.signal_at("slope")
+        ma = self.signal_at("slope_ma")
 
-        if self._slope is None or self._slope_ma is None:
-            return weights
-
-        price_symbol = self._price_symbol
-        price_data = self.symbol_to_data.get(price_symbol)
-        if price_data is None:
-            return weights
-
-        current_date: datetime.date = price_data.datetime.date(0)
-
-        try:
-            sl = float(self._slope.loc[current_date])
-            ma = float(self._slope_ma.loc[current_date])
-        except KeyError:
+        # Signal: slope above its MA → steepening → long steepener proxy
+        if sl > ma:
+            return self._long_weights
+
+        return self._flat_weights
+
+    @classmethod
+    def compute_weight_matrix(cls, closes: pd.DataFrame, p) -> pd.DataFrame:
+        """
+        Whole-run version of compute_target_weights(): long price_symbol at
+        target_long on every bar where slope > slope_MA.
+        """
+        weights = pd.DataFrame(0.0, index=closes.index, columns=closes.columns)
+
+        if p.price_symbol not in closes.columns:
+            cls.log(
+                f"[CurveSteepener] price_symbol '{p.price_symbol}' "
+                f"not in feeds {list(closes.columns)}; staying flat."
+            )
             return weights
 
-        if pd.isna(ma):
+        signal = cls._load_signal(p)
+        if signal is None:
             return weights
 
-        # Signal: slope above its MA → steepening → long steepener proxy
-        if sl > ma:
-            weights[price_symbol] = self._target_long
+        slope, slope_ma = signal
+        aligned = cls.align_signals({"level": slope, "ma": slope_ma}, closes.index, p)
+        sl, ma = aligned["level"], aligned["ma"]
 
+        # NaN (no econ value available yet, MA warming up) compares False → flat
+        weights[p.price_symbol] = np.where(sl > ma, float(p.target_long), 0.0)
         return weights
@@ -10,7 +10,7 @@ Data inputs:
 
 Signal:
   - Compute rolling mean of the real-yield series over a configurable window.
-  - If real_yield < rolling_mean on the bar date, target_long weight is applied; otherwise flat.
+  - If real_yield < rolling_mean as of the bar date, target_long weight is applied; otherwise flat.
 
 Parameters (params dict):
   - symbols: list[str] | None — tickers passed from Cerebro; must include price_symbol.
@@ -21,13 +21,14 @@ Parameters (params dict):
 """
 from __future__ import annotations
 
-import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from slice.quant_engine.strategies.strategy_base import StrategyBase
 from slice.quant_engine.data import load_econ_series
+from slice.quant_engine.data.signal_store import SignalSpec, get_signal_store
 
 
 class GoldRealYieldsStrategy(StrategyBase):
@@ -41,6 +42,8 @@ class GoldRealYieldsStrategy(StrategyBase):
     - If real_yield < real_yield_MA → long GLD up to target_long.
     """
 
+    STRATEGY_ID = "GOLD_REAL_YIELDS"
+
     params = dict(
         symbols=None,                 # list of tickers provided by Cerebro; must include price_symbol
         price_symbol="GLD",           # ETF proxy for gold, resolved against market_data
@@ -60,6 +63,11 @@ class GoldRealYieldsStrategy(StrategyBase):
         # Backtrader stores params under self.p, not as plain attributes.
         symbols_param: List[str] = list(self.p.symbols or [])
 
+        # Built once; compute_target_weights() returns one of these per bar.
+        self._flat_weights: Dict[str, float] = {s: 0.0 for s in symbols_param}
+        self._long_weights: Dict[str, float] = dict(self._flat_weights)
+        self._long_weights[self._price_symbol] = self._target_long
+
         # Sanity: require that the price_symbol is in the data feeds
         if self._price_symbol not in symbols_param:
             self.log(
@@ -71,57 +79,70 @@ class GoldRealYieldsStrategy(StrategyBase):
             self._real_yield_ma = None
             return
 
-        ry_id = self.p.real_yield_series_id
+        signal = self._load_signal(self.p)
+        if signal is None:
+            self._enabled = False
+            self._real_yield_series = None
+            self._real_yield_ma = None
+            return
+
+        self._enabled = True
+        self._real_yield_series, self._real_yield_ma = signal
+
+        price_data = self.symbol_to_data[self._price_symbol]
+        self.register_signal("real_yield", self._real_yield_series, price_data)
+        self.register_signal("real_yield_ma", self._real_yield_ma, price_data)
+
+    @classmethod
+    def _load_signal(cls, p) -> Optional[Tuple[pd.Series, pd.Series]]:
+        """
+        Load the real-yield proxy and its rolling mean, indexed by date.
+        Returns None (after logging why) if the econ data is unusable.
+        """
+        ry_id = p.real_yield_series_id
+        ma_window = int(p.real_yield_ma_window)
         ry_df = load_econ_series(ry_id)
 
         if ry_df.empty:
-            self.log(
+            cls.log(
                 f"[GoldRealYields] Missing econ data for real_yield_series_id='{ry_id}'. "
                 "Strategy will remain flat."
             )
-            self._enabled = False
-            self._real_yield_series = None
-            self._real_yield_ma = None
-            return
+            return None
 
         if not {"date", "value"}.issubset(ry_df.columns):
-            self.log(
+            cls.log(
                 f"[GoldRealYields] econ_df for '{ry_id}' has unexpected columns "
                 f"{list(ry_df.columns)}; staying flat."
             )
-            self._enabled = False
-            self._real_yield_series = None
-            self._real_yield_ma = None
-            return
-
-        ry_df = ry_df.copy()
-
-        if not pd.api.types.is_datetime64_any_dtype(ry_df["date"]):
-            ry_df["date"] = pd.to_datetime(ry_df["date"])
-
-        ry_df = ry_df.sort_values("date")
-        ry_df.set_index(ry_df["date"].dt.date, inplace=True)
-
-        series = ry_df["value"].astype(float)
-        ma = series.rolling(self._ma_window).mean()
+            return None
 
-        if series.empty:
-            self.log(
+        signal = get_signal_store().get(
+            SignalSpec("gold_real_yields.real_yield", (ry_id,), ma_window),
+            [ry_df],
+            cls._real_yield_level,
+        )
+        if signal is None:
+            cls.log(
                 f"[GoldRealYields] No usable data in series '{ry_id}'; staying flat."
             )
-            self._enabled = False
-            self._real_yield_series = None
-            self._real_yield_ma = None
-            return
-
-        self._enabled = True
-        self._real_yield_series = series
-        self._real_yield_ma = ma
+            return None
+        series, ma = signal
 
-        self.log(
+        cls.log(
             f"[GoldRealYields] Initialized with real_yield_series_id='{ry_id}', "
-            f"{len(series)} points, MA window={self._ma_window}."
+            f"{len(series)} points, MA window={ma_window}."
         )
+        return series, ma
+
+    @staticmethod
+    def _real_yield_level(frames: List[pd.DataFrame]) -> pd.Series:
+        """
+        Real-yield proxy indexed by date (signal store level function).
+        """
+        (ry_df,) = frames
+        ry_df = ry_df.sort_values("date")
+        return pd.Series(ry_df["value"].astype(float).to_numpy(), index=ry_df["date"].dt.date)
 
     def compute_target_weights(self) -> Dict[str, float]:
         """
@@ -129,36 +150,43 @@ class GoldRealYieldsStrategy(StrategyBase):
           - Flat in all symbols except price_symbol.
           - If real_yield < real_yield_MA on this date → long gold to target_long.
         """
-        symbols_param: List[str] = list(self.p.symbols or [])
-        weights: Dict[str, float] = {s: 0.0 for s in symbols_param}
+        if not self._enabled:
+            return self._flat_weights
 
-        if not getattr(self, "_enabled", False):
-            return weights
+        # Econ values aligned to this bar in start(); NaN if no print on the
+        # bar's date or MA not yet defined (early in sample) → stay flat
+        ry = self.signal_at("real_yield")
+        ma = self.signal_at("real_yield_ma")
 
-        if self._real_yield_series is None or self._real_yield_ma is None:
-            return weights
+        # Simple signal: real yields below their own MA → long gold
+        if ry < ma:
+            return self._long_weights
 
-        price_symbol = self._price_symbol
-        price_data = self.symbol_to_data.get(price_symbol)
-        if price_data is None:
-            return weights
+        return self._flat_weights
 
-        # Backtrader data datetime is a float-like; .date(0) returns a datetime.date
-        current_date: datetime.date = price_data.datetime.date(0)
+    @classmethod
+    def compute_weight_matrix(cls, closes: pd.DataFrame, p) -> pd.DataFrame:
+        """
+        Whole-run version of compute_target_weights(): long price_symbol at
+        target_long on every bar where real_yield < real_yield_MA.
+        """
+        weights = pd.DataFrame(0.0, index=closes.index, columns=closes.columns)
 
-        try:
-            ry = float(self._real_yield_series.loc[current_date])
-            ma = float(self._real_yield_ma.loc[current_date])
-        except KeyError:
-            # No econ datapoint for this calendar date → stay flat
+        if p.price_symbol not in closes.columns:
+            cls.log(
+                f"[GoldRealYields] price_symbol '{p.price_symbol}' "
+                f"not in p.symbols={list(closes.columns)}; staying flat."
+            )
             return weights
 
-        if pd.isna(ma):
-            # MA not yet defined (early in sample) → stay flat
+        signal = cls._load_signal(p)
+        if signal is None:
             return weights
 
-        # Simple signal: real yields below their own MA → long gold
-        if ry < ma:
-            weights[price_symbol] = self._target_long
+        series, ma = signal
+        aligned = cls.align_signals({"level": series, "ma": ma}, closes.index, p)
+        ry, ry_ma = aligned["level"], aligned["ma"]
 
+        # NaN (no econ value available yet, MA warming up) compares False → flat
+        weights[p.price_symbol] = np.where(ry < ry_ma, float(p.target_long), 0.0)
         return weights
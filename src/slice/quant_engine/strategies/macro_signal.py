@@ -0,0 +1,166 @@
+"""
+MacroSignalStrategy
+
+Purpose:
+  Generic "econ condition → long one ETF" strategy driven by a declarative
+  signal expression instead of a hand-written class.
+
+Data inputs:
+  - Price: price_symbol from market_data.
+  - Econ: every series id named in the expression, via load_econ_series.
+
+Signal:
+  - `signal` is compiled by core/signal_expr.py, e.g. "DGS10 - DGS2 > ma(60)",
+    and evaluated once over the econ observation dates.
+  - While the condition holds as of the bar date, target_long weight is
+    applied to price_symbol; otherwise flat.
+
+Parameters (params dict):
+  - symbols: list[str] | None — tickers supplied by Cerebro; must include price_symbol.
+  - signal: str — signal expression (see core/signal_expr.py for the grammar).
+  - price_symbol: str — ETF to trade.
+  - target_long: float — portfolio weight while the condition holds.
+
+register_macro_signal() registers a preset (strategy id → expression,
+price_symbol, target_long) so run_backtest() can use it like any other
+strategy id.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from slice.quant_engine.core.signal_expr import compile_signal
+from slice.quant_engine.data import load_econ_series
+from slice.quant_engine.strategies.registry import register_strategy
+from slice.quant_engine.strategies.strategy_base import StrategyBase
+
+
+class MacroSignalStrategy(StrategyBase):
+    """
+    Long price_symbol at target_long while a signal expression holds.
+    """
+
+    STRATEGY_ID = "MACRO_SIGNAL"
+
+    params = dict(
+        symbols=None,                 # list of tickers provided by Cerebro; must include price_symbol
+        signal=None,                  # signal expression, e.g. "DGS10 - DGS2 > ma(60)"
+        price_symbol=None,            # ETF traded while the signal holds
+        target_long=0.25,             # target portfolio weight when long
+    )
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._price_symbol = self.p.price_symbol
+        self._flat_weights: Dict[str, float] = {s: 0.0 for s in self.p.symbols or []}
+        self._long_weights: Dict[str, float] = dict(self._flat_weights)
+        self._long_weights[self._price_symbol] = float(self.p.target_long)
+
+        if self.p.symbols is None or self._price_symbol not in self.p.symbols:
+            self.log(
+                f"[MacroSignal] price_symbol '{self._price_symbol}' "
+                f"not in p.symbols={self.p.symbols}; staying flat."
+            )
+            self._enabled = False
+            return
+
+        active = self._load_signal(self.p)
+        self._enabled = active is not None
+        if self._enabled:
+            self.register_signal("active", active, self.symbol_to_data[self._price_symbol])
+
+    @classmethod
+    def required_econ_series(cls, p) -> List[str]:
+        if not p.signal:
+            return []
+        return sorted(compile_signal(p.signal).series_ids)
+
+    @classmethod
+    def _load_signal(cls, p) -> Optional[pd.Series]:
+        """
+        The compiled condition (1.0 / 0.0, NaN while warming up) indexed by
+        econ date. Returns None (after logging why) if it cannot be evaluated.
+        """
+        if not p.signal:
+            raise ValueError("MacroSignalStrategy needs params['signal'].")
+        expression = compile_signal(p.signal)
+        if not expression.is_condition:
+            raise ValueError(f"Signal '{p.signal}' is not a condition (e.g. 'X > ma(60)').")
+
+        frames = {series_id: load_econ_series(series_id) for series_id in expression.series_ids}
+        empty = [s for s, df in frames.items() if df.empty]
+        if empty:
+            cls.log(f"[MacroSignal] Missing econ data for {empty}; staying flat.")
+            return None
+
+        active = expression.evaluate(frames)
+        if active is None:
+            cls.log(f"[MacroSignal] Series {list(frames)} share no dates; staying flat.")
+            return None
+
+        cls.log(f"[MacroSignal] '{expression.text}' over {len(active)} econ dates.")
+        return active
+
+    def compute_target_weights(self) -> Dict[str, float]:
+        if not self._enabled:
+            return self._flat_weights
+
+        # Condition as of this bar, aligned in start(); NaN before the first
+        # value → flat
+        if self.signal_at("active") == 1.0:
+            return self._long_weights
+        return self._flat_weights
+
+    @classmethod
+    def compute_weight_matrix(cls, closes: pd.DataFrame, p) -> pd.DataFrame:
+        weights = pd.DataFrame(0.0, index=closes.index, columns=closes.columns)
+
+        if p.price_symbol not in closes.columns:
+            cls.log(
+                f"[MacroSignal] price_symbol '{p.price_symbol}' "
+                f"not in p.symbols={list(closes.columns)}; staying flat."
+            )
+            return weights
+
+        active = cls._load_signal(p)
+        if active is None:
+            return weights
+
+        aligned = cls.align_signals({"active": active}, closes.index, p)["active"]
+        weights[p.price_symbol] = np.where(aligned == 1.0, float(p.target_long), 0.0)
+        return weights
+
+
+def register_macro_signal(
+    strategy_id: str,
+    signal: str,
+    price_symbol: str,
+    target_long: float = 0.25,
+    description: Optional[str] = None,
+) -> type:
+    """
+    Register a MacroSignalStrategy preset under strategy_id, without
+    writing a class: run_backtest(strategy_id, {"tickers": [...]}) then
+    trades price_symbol on `signal`. Params passed to run_backtest() still
+    override the preset (e.g. a different target_long in a sweep).
+
+    The expression is validated now. Presets live in the registering
+    process: register them at import time of a module the workers also
+    import (or on each worker) for process-pool or queue runs.
+    """
+    if not compile_signal(signal).is_condition:
+        raise ValueError(f"Signal '{signal}' is not a condition (e.g. 'X > ma(60)').")
+
+    name = "MacroSignal_" + "".join(ch if ch.isalnum() else "_" for ch in strategy_id)
+    preset = type(name, (MacroSignalStrategy,), {
+        "__doc__": description or f"Long {price_symbol} while {signal}.",
+        "__module__": __name__,
+        "STRATEGY_ID": strategy_id,
+        "params": dict(signal=signal, price_symbol=price_symbol, target_long=float(target_long)),
+    })
+    register_strategy(strategy_id, preset)
+    return preset
@@ -0,0 +1,74 @@
+"""
+CrossSectionalMomentumStrategy
+
+Purpose:
+  Hold the recent winners of a large universe (e.g. hundreds of ETFs),
+  sized by inverse volatility.
+
+Data inputs:
+  - Price: every ticker in params["tickers"] from market_data.
+
+Signal:
+  - Momentum = return over momentum_lookback bars, skipping the most recent
+    momentum_skip bars (short-term reversal).
+  - On each rebalance bar, go long the top_n symbols by momentum.
+  - Weights proportional to 1 / volatility_window realized volatility,
+    summing to gross_exposure (or targeting target_volatility per position,
+    capped at gross_exposure).
+
+Parameters (params dict):
+  - momentum_lookback: int — bars in the momentum window.
+  - momentum_skip: int — most recent bars excluded from the window.
+  - top_n: int — number of symbols held.
+  - volatility_window: int — bars in the realized volatility window.
+  - target_volatility: float | None — annualized volatility per position.
+  - gross_exposure: float — maximum sum of weights.
+"""
+from __future__ import annotations
+
+import pandas as pd
+
+from slice.quant_engine.strategies.cross_sectional import (
+    CrossSectionalStrategy,
+    inverse_volatility_weights,
+    rolling_volatility,
+    top_n_mask,
+    trailing_return,
+)
+
+
+class CrossSectionalMomentumStrategy(CrossSectionalStrategy):
+    """
+    Long the top_n symbols by skip-adjusted momentum, inverse-volatility weighted.
+    """
+
+    STRATEGY_ID = "XS_MOMENTUM"
+
+    params = dict(
+        momentum_lookback=252,        # bars in the momentum window (~12 months)
+        momentum_skip=21,             # most recent bars skipped (~1 month)
+        top_n=10,                     # number of symbols held
+        volatility_window=63,         # bars in the realized volatility window
+        target_volatility=None,       # Optional[float]; annualized vol per position
+        gross_exposure=1.0,           # maximum sum of weights
+        rebalance_frequency="MONTHLY",
+    )
+
+    @classmethod
+    def warmup_bars(cls, p) -> int:
+        return max(int(p.momentum_lookback) + int(p.momentum_skip), int(p.volatility_window))
+
+    @classmethod
+    def compute_weight_matrix(cls, closes: pd.DataFrame, p) -> pd.DataFrame:
+        if float(p.gross_exposure) <= 0.0:
+            raise ValueError("gross_exposure must be > 0.")
+
+        momentum = trailing_return(closes, int(p.momentum_lookback), int(p.momentum_skip))
+        selected = top_n_mask(momentum, int(p.top_n))
+        volatility = rolling_volatility(closes, int(p.volatility_window))
+        return inverse_volatility_weights(
+            selected,
+            volatility,
+            gross_exposure=float(p.gross_exposure),
+            target_volatility=None if p.target_volatility is None else float(p.target_volatility),
+        )
@@ -0,0 +1,249 @@
+# src/slice/quant_engine/strategies/registry.py
+
+from __future__ import annotations
+
+import ast
+import importlib
+import importlib.util
+import threading
+from dataclasses import dataclass, field
+from importlib.metadata import entry_points
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type
+
+
+# Entry-point group other packages use to contribute strategies:
+#   [project.entry-points."slice.strategies"]
+#   MY_STRATEGY = "my_pkg.strategies:MyStrategy"
+ENTRY_POINT_GROUP = "slice.strategies"
+
+# Package scanned (without importing) for classes declaring STRATEGY_ID.
+BUILTIN_PACKAGE = "slice.quant_engine.strategies"
+
+
+@dataclass
+class StrategyMetadata:
+    """
+    What is known about a registered strategy without importing it.
+
+    params holds literal defaults read from the class source (including
+    those inherited from StrategyBase); non-literal defaults are None.
+    """
+    strategy_id: str
+    import_path: str                    # "package.module:ClassName"
+    description: Optional[str] = None
+    params: Dict[str, Any] = field(default_factory=dict)
+    required_econ_series: List[str] = field(default_factory=list)
+
+
+_LOCK = threading.Lock()
+_PATHS: Dict[str, str] = {}             # strategy_id -> import path
+_CLASSES: Dict[str, Type] = {}          # strategy_id -> imported class
+_DISCOVERED = False
+
+
+def register_strategy(strategy_id: str, target: Any) -> None:
+    """
+    Register `target` ("module:ClassName" or a StrategyBase subclass) under
+    strategy_id. Import paths are only imported on first resolve.
+    """
+    with _LOCK:
+        if isinstance(target, str):
+            if ":" not in target:
+                raise ValueError(f"Strategy import path must look like 'module:ClassName', got '{target}'.")
+            _PATHS[strategy_id] = target
+            _CLASSES.pop(strategy_id, None)
+        else:
+            _PATHS[strategy_id] = f"{target.__module__}:{target.__qualname__}"
+            _CLASSES[strategy_id] = target
+
+
+def list_strategies() -> List[str]:
+    _discover()
+    return sorted(_PATHS)
+
+
+def resolve_strategy(strategy_id: str) -> Type:
+    """
+    Strategy class for strategy_id, importing its module on first use.
+    Raises KeyError for unknown ids.
+    """
+    cls = _CLASSES.get(strategy_id)
+    if cls is not None:
+        return cls
+
+    _discover()
+    path = _PATHS[strategy_id]
+    module_name, _, class_name = path.partition(":")
+    cls = getattr(importlib.import_module(module_name), class_name)
+    with _LOCK:
+        _CLASSES[strategy_id] = cls
+    return cls
+
+
+def strategy_metadata(strategy_id: str) -> StrategyMetadata:
+    """
+    Params and required econ series of a strategy, read from its source
+    with `ast` (the module is not imported). Raises KeyError for unknown ids.
+    """
+    _discover()
+    path = _PATHS[strategy_id]
+    module_name, _, class_name = path.partition(":")
+    info = _scan_class(module_name, class_name)
+    cls = _CLASSES.get(strategy_id)
+    if info.get("found") is False and cls is not None:
+        # Built at runtime (e.g. register_macro_signal()): no source to scan
+        doc = (cls.__doc__ or "").strip()
+        info = {
+            "params": dict(cls.params._getpairs()),
+            "description": doc.splitlines()[0] if doc else None,
+        }
+    params = info["params"]
+    return StrategyMetadata(
+        strategy_id=strategy_id,
+        import_path=path,
+        description=info["description"],
+        params=params,
+        required_econ_series=sorted({
+            value for name, value in params.items()
+            if name.endswith("_series_id") and isinstance(value, str) and value
+        }),
+    )
+
+
+# ---------- Discovery ----------
+
+def _discover() -> None:
+    """
+    Fill the registry once from the built-in package scan and entry points.
+    Explicit register_strategy() calls take precedence.
+    """
+    global _DISCOVERED
+    if _DISCOVERED:
+        return
+
+    found: Dict[str, str] = {}
+    for module_name, path in _package_modules(BUILTIN_PACKAGE):
+        for class_name, strategy_id in _declared_strategy_ids(path).items():
+            found[strategy_id] = f"{module_name}:{class_name}"
+
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        found[ep.name] = ep.value
+
+    with _LOCK:
+        for strategy_id, path in found.items():
+            _PATHS.setdefault(strategy_id, path)
+        _DISCOVERED = True
+
+
+def _package_modules(package: str):
+    spec = importlib.util.find_spec(package)
+    if spec is None or not spec.submodule_search_locations:
+        return
+    for location in spec.submodule_search_locations:
+        for path in sorted(Path(location).glob("*.py")):
+            if path.stem != "__init__":
+                yield f"{package}.{path.stem}", path
+
+
+def _declared_strategy_ids(path: Path) -> Dict[str, str]:
+    """
+    {class name: STRATEGY_ID} for classes in `path` that assign a string
+    STRATEGY_ID in their body.
+    """
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    ids: Dict[str, str] = {}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            value = _class_assignments(node).get("STRATEGY_ID")
+            if value is not None:
+                strategy_id = ast.literal_eval(value)
+                if isinstance(strategy_id, str):
+                    ids[node.name] = strategy_id
+    return ids
+
+
+# ---------- Source scanning ----------
+
+def _module_path(module_name: str) -> Optional[Path]:
+    spec = importlib.util.find_spec(module_name)
+    if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+        return None
+    return Path(spec.origin)
+
+
+def _class_assignments(node: ast.ClassDef) -> Dict[str, ast.expr]:
+    values: Dict[str, ast.expr] = {}
+    for stmt in node.body:
+        if isinstance(stmt, ast.Assign):
+            for target in stmt.targets:
+                if isinstance(target, ast.Name):
+                    values[target.id] = stmt.value
+    return values
+
+
+def _literal_params(node: Optional[ast.expr]) -> Dict[str, Any]:
+    """
+    Backtrader params declared as dict(a=1, ...), {"a": 1, ...} or
+    (("a", 1), ...); defaults that are not literals become None.
+    """
+    def literal(value: ast.expr) -> Any:
+        try:
+            return ast.literal_eval(value)
+        except ValueError:
+            return None
+
+    if node is None:
+        return {}
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "dict":
+        return {kw.arg: literal(kw.value) for kw in node.keywords if kw.arg}
+    if isinstance(node, ast.Dict):
+        return {
+            k.value: literal(v)
+            for k, v in zip(node.keys, node.values)
+            if isinstance(k, ast.Constant) and isinstance(k.value, str)
+        }
+    if isinstance(node, (ast.Tuple, ast.List)):
+        params: Dict[str, Any] = {}
+        for item in node.elts:
+            if isinstance(item, (ast.Tuple, ast.List)) and len(item.elts) == 2:
+                key = item.elts[0]
+                if isinstance(key, ast.Constant) and isinstance(key.value, str):
+                    params[key.value] = literal(item.elts[1])
+        return params
+    return {}
+
+
+def _scan_class(module_name: str, class_name: str, depth: int = 0) -> Dict[str, Any]:
+    """
+    Params (merged over base classes found via `from x import Base`) and the
+    docstring summary of module_name.class_name, read from source.
+    """
+    path = _module_path(module_name)
+    if path is None or depth > 5:
+        return {"params": {}, "description": None, "found": False}
+
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    imported = {
+        alias.asname or alias.name: node.module
+        for node in tree.body
+        if isinstance(node, ast.ImportFrom) and node.module
+        for alias in node.names
+    }
+
+    for node in tree.body:
+        if not (isinstance(node, ast.ClassDef) and node.name == class_name):
+            continue
+
+        params: Dict[str, Any] = {}
+        for base in node.bases:
+            if isinstance(base, ast.Name):
+                base_module = imported.get(base.id, module_name)
+                params.update(_scan_class(base_module, base.id, depth + 1)["params"])
+        params.update(_literal_params(_class_assignments(node).get("params")))
+
+        doc = ast.get_docstring(node)
+        summary = doc.strip().splitlines()[0] if doc else None
+        return {"params": params, "description": summary}
+
+    return {"params": {}, "description": None, "found": False}
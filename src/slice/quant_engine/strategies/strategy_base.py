@@ -2,8 +2,58 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
 import backtrader as bt
-from typing import Dict, List
+import numpy as np
+import pandas as pd
+
+from slice.quant_engine.core.profiling import BarProfiler
+from slice.quant_engine.core.trade_log import (
+    FILL_DTYPE,
+    RecordLog,
+    fill_records,
+    match_fifo_lots,
+    opening_lots,
+    trade_records,
+)
+from slice.quant_engine.data.calendar import (
+    align_prepared,
+    align_to_calendar,
+    check_alignment,
+    prepare_series,
+    trading_calendar,
+)
+
+
+# datetime.date(1970, 1, 1).toordinal(); Backtrader datetimes are ordinal-based floats
+_EPOCH_ORDINAL = 719163
+
+REBALANCE_FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY")
+
+
+def bt_dates(raw: np.ndarray) -> np.ndarray:
+    """
+    Backtrader float datetimes → datetime64[D] dates.
+    """
+    days = np.floor(np.asarray(raw, dtype=float)).astype(np.int64) - _EPOCH_ORDINAL
+    return days.astype("datetime64[D]")
+
+
+def rebalance_period_keys(days: np.ndarray, frequency: str) -> np.ndarray:
+    """
+    Integer rebalance-period id for each date, given as days since 1970-01-01.
+    DAILY: the day itself; WEEKLY: Monday-based week; MONTHLY: calendar month.
+    """
+    days = np.asarray(days, dtype=np.int64)
+    if frequency == "DAILY":
+        return days
+    if frequency == "WEEKLY":
+        # 1970-01-01 was a Thursday; shift so weeks start on Monday
+        return (days + 3) // 7
+    months = days.astype("datetime64[D]").astype("datetime64[M]")
+    return months.astype(np.int64)
 
 
 class StrategyBase(bt.Strategy):
@@ -13,13 +63,37 @@ class StrategyBase(bt.Strategy):
     Responsibilities:
     - Provide a uniform API: compute_target_weights() -> {symbol: weight}
     - Map symbols to Backtrader data feeds (multi-asset support)
-    - Route entry/exit via order_target_percent()
-    - Maintain a deterministic in-memory trade log for later extraction
+    - Route entry/exit via order_target_percent(), subject to the rebalance
+      policy: calendar schedule, drift band and minimum trade value
+    - Log executed orders into a compact structured array (self.fills);
+      round-trip trades are FIFO-matched from it on demand
+    - Optionally expose the whole run as a dates × symbols weight matrix
+      (compute_weight_matrix) for the vectorized engine
+    - As-of align date-indexed signals to the bar calendar once, with
+      optional release lags (register_signal), so compute_target_weights()
+      reads them by bar position (signal_at)
+    - Snapshot / restore positions and subclass state for checkpointed runs
+    - Optionally keep its own sub-account (cash + positions) so several
+      strategies can share one broker in a single Cerebro pass
+    - Optionally time its per-bar hot path (instrument=True, see
+      core/profiling.py)
     """
 
+    # Engine run_backtest() uses when params["engine"] is not given
+    DEFAULT_ENGINE = "backtrader"
+
     params = dict(
         symbols=None,               # Optional[List[str]]; if None, infer from data._name
-        rebalance_on_every_bar=True,
+        rebalance_frequency="DAILY",  # "DAILY" | "WEEKLY" | "MONTHLY": first bar of each period
+        rebalance_band=0.0,         # skip symbols whose |target - current weight| <= band
+        min_trade_value=0.0,        # skip orders with estimated notional below this
+        initial_positions=None,     # Optional[{symbol: (size, price)}]; resume from a checkpoint
+        initial_state=None,         # Optional[dict]; passed to set_state() when resuming
+        sub_account=None,           # Optional[float]; starting cash of this strategy's own ledger
+        econ_alignment="asof",      # "asof": latest available signal value | "exact": same-date only
+        econ_release_lag_days=0,    # calendar days before a signal value dated d is usable
+        instrument=False,           # record per-bar wall times in self.profiler
+        record_targets=False,       # keep (epoch day, targets) of every rebalance bar in self.target_log
     )
 
     def __init__(self) -> None:
@@ -37,9 +111,37 @@ class StrategyBase(bt.Strategy):
             if missing:
                 raise ValueError(f"Missing data feeds for symbols: {missing}")
 
-        # Order / trade logging for BacktestResultJSON
-        self.order_log: List[dict] = []
-        self.trade_log: List[dict] = []
+        self.check_rebalance_params(self.p)
+        check_alignment(self.p.econ_alignment)
+        self._frequency = str(self.p.rebalance_frequency).upper()
+        # Rebalance period of the current and of the previous bar
+        self._period: Optional[int] = None
+        self._prev_period: Optional[int] = None
+
+        # Executed orders, one FILL_DTYPE row each; symbol codes index
+        # symbol_names (feed order)
+        self.symbol_names: List[str] = list(self.symbol_to_data)
+        self._symbol_codes = {data: code for code, data in enumerate(self.symbol_to_data.values())}
+        self.fills = RecordLog(FILL_DTYPE)
+
+        # Sub-account ledger (sub_account mode): cash, data -> size, and the
+        # cumulative (size, cash cost) already booked per order ref
+        self._sub_cash = float(self.p.sub_account) if self.p.sub_account is not None else None
+        self._sub_positions: Dict[bt.LineSeries, float] = {}
+        self._sub_fills: Dict[int, Tuple[float, float]] = {}
+        self._sub_pending_cash = self._sub_cash
+
+        # name -> (date-indexed series, feed, release lag); aligned to arrays in start()
+        self._signal_sources: Dict[str, Tuple[pd.Series, bt.LineSeries, int]] = {}
+        self._signal_arrays: Dict[str, np.ndarray] = {}
+        # name -> prepare_series() output, for feeds that are not preloaded
+        self._signal_prepared: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+        # Targets decided on each rebalance bar; None unless p.record_targets
+        self.target_log: Optional[List[Tuple[int, Dict[str, float]]]] = [] if self.p.record_targets else None
+
+        # Hot-path timings; None (nothing recorded) unless p.instrument
+        self.profiler: Optional[BarProfiler] = BarProfiler() if self.p.instrument else None
 
     # ---------- Child API ----------
 
@@ -57,21 +159,272 @@ class StrategyBase(bt.Strategy):
         """
         raise NotImplementedError
 
+    @classmethod
+    def compute_weight_matrix(cls, closes: pd.DataFrame, p: SimpleNamespace) -> pd.DataFrame:
+        """
+        Vectorized counterpart of compute_target_weights(), used by the
+        vectorized engine (core/vectorized.py) instead of a Cerebro run.
+
+        Parameters
+        ----------
+        closes : dates × symbols close panel (DatetimeIndex, one column per feed)
+        p      : resolved params namespace, see resolve_params()
+
+        Returns
+        -------
+        pd.DataFrame of target weights aligned to `closes`; the row for bar t
+        must equal what compute_target_weights() would return on bar t.
+        """
+        raise NotImplementedError(
+            f"{cls.__name__} does not implement compute_weight_matrix(); "
+            "use the backtrader engine."
+        )
+
+    @classmethod
+    def resolve_params(cls, overrides: Mapping[str, Any]) -> SimpleNamespace:
+        """
+        Merge `overrides` onto the class params defaults, ignoring keys the
+        strategy does not declare. Gives classmethods a `self.p` look-alike.
+        """
+        values = dict(cls.params._getpairs())
+        values.update({k: v for k, v in overrides.items() if k in values})
+        return SimpleNamespace(**values)
+
+    @staticmethod
+    def check_rebalance_params(p: Any) -> None:
+        """
+        Validate the rebalance policy params on a params object / namespace.
+        """
+        frequency = str(p.rebalance_frequency).upper()
+        if frequency not in REBALANCE_FREQUENCIES:
+            raise ValueError(
+                f"Unknown rebalance_frequency '{p.rebalance_frequency}'. "
+                f"Supported: {list(REBALANCE_FREQUENCIES)}"
+            )
+        if p.rebalance_band < 0.0:
+            raise ValueError("rebalance_band must be >= 0.")
+        if p.min_trade_value < 0.0:
+            raise ValueError("min_trade_value must be >= 0.")
+
+    @classmethod
+    def rebalance_mask(cls, dates: pd.DatetimeIndex, p: SimpleNamespace) -> np.ndarray:
+        """
+        Boolean array, True on bars where the schedule allows rebalancing
+        (the first bar of each rebalance period), for the vectorized engine.
+        """
+        cls.check_rebalance_params(p)
+        days = dates.values.astype("datetime64[D]").astype(np.int64)
+        keys = rebalance_period_keys(days, str(p.rebalance_frequency).upper())
+        mask = np.ones(len(keys), dtype=bool)
+        mask[1:] = keys[1:] != keys[:-1]
+        return mask
+
+    @classmethod
+    def required_econ_series(cls, p: SimpleNamespace) -> List[str]:
+        """
+        econ_data series ids the strategy will load for params `p`.
+
+        Default: every param named *_series_id. Used to preload econ data
+        once (e.g. for parameter sweeps) instead of per strategy instance.
+        """
+        return sorted({
+            value
+            for name, value in vars(p).items()
+            if name.endswith("_series_id") and value
+        })
+
+    @classmethod
+    def warmup_bars(cls, p: SimpleNamespace) -> int:
+        """
+        Price bars the strategy needs before its first target for params
+        `p`. A run that is only scored from some date on starts this many
+        bars earlier (e.g. successive-halving sub-periods).
+
+        Default 0: econ signals are built from their full history, so they
+        are warmed up at any start date.
+        """
+        return 0
+
+    # ---------- Precomputed signals ----------
+
+    def register_signal(
+        self,
+        name: str,
+        series: pd.Series,
+        data: bt.LineSeries,
+        release_lag_days: Optional[int] = None,
+    ) -> None:
+        """
+        Register a date-indexed signal to be read per bar via signal_at(name).
+
+        With preloaded feeds every registered series is as-of joined onto
+        the union bar calendar of all feeds once in start(), so each per-bar
+        read is an array index. A value dated d becomes usable
+        release_lag_days (default: the econ_release_lag_days param) after d;
+        bars before the first usable value read as NaN. With
+        econ_alignment="exact" only bars dated on a print get a value.
+        """
+        lag = self.p.econ_release_lag_days if release_lag_days is None else release_lag_days
+        self._signal_sources[name] = (series, data, int(lag))
+
+    def start(self) -> None:
+        self._align_signals()
+
+        # Resuming from a checkpoint: reinstate holdings and subclass state
+        for symbol, (size, price) in (self.p.initial_positions or {}).items():
+            data = self.symbol_to_data.get(symbol)
+            if data is None:
+                raise ValueError(f"initial_positions references unknown symbol: {symbol}")
+            self.broker.getposition(data).set(float(size), float(price))
+
+        state = dict(self.p.initial_state or {})
+        self._period = state.pop("_rebalance_period", None)
+        if state:
+            self.set_state(state)
+
+    def signal_at(self, name: str) -> float:
+        """
+        Value of a registered signal on the current bar of its feed (NaN if none).
+        """
+        values = self._signal_arrays.get(name)
+        data = self._signal_sources[name][1]
+        if values is not None:
+            return values[len(data) - 1]
+
+        # Feed not preloaded (streaming): binary search on the bar date
+        bar = np.array([data.datetime.date(0)], dtype="datetime64[D]")
+        return float(align_prepared(self._signal_prepared[name], bar, self.p.econ_alignment)[0])
+
+    @classmethod
+    def align_signals(
+        cls,
+        signals: Mapping[str, pd.Series],
+        index: pd.Index,
+        p: SimpleNamespace,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized counterpart of register_signal() / signal_at(): every
+        signal as a float array aligned to `index` (e.g. closes.index),
+        with the econ_alignment / econ_release_lag_days params of `p`.
+        """
+        return align_to_calendar(
+            signals,
+            index,
+            how=check_alignment(p.econ_alignment),
+            release_lag_days=int(p.econ_release_lag_days),
+        )
+
+    def _align_signals(self) -> None:
+        """
+        Align every registered signal to its feed in one pass: build the
+        union calendar of the preloaded feeds once, as-of join all signals
+        onto it, then take each feed's bars out of the dense arrays.
+        """
+        calendars = {}
+        for data in self.datas:
+            calendar = self._bar_calendar(data)
+            if calendar is not None:
+                calendars[data] = calendar
+
+        preloaded = {n: src for n, src in self._signal_sources.items() if src[1] in calendars}
+        for name, (series, _, lag) in self._signal_sources.items():
+            if name not in preloaded:
+                self._signal_prepared[name] = prepare_series(series, lag)
+        if not preloaded:
+            return
+
+        union = trading_calendar(calendars.values())
+        aligned = align_to_calendar(
+            {name: src[0] for name, src in preloaded.items()},
+            union,
+            how=self.p.econ_alignment,
+            release_lag_days={name: src[2] for name, src in preloaded.items()},
+        )
+        positions = {data: union.get_indexer(calendar) for data, calendar in calendars.items()}
+        for name, (_, data, _) in preloaded.items():
+            self._signal_arrays[name] = aligned[name][positions[data]]
+
+    @staticmethod
+    def _bar_calendar(data: bt.LineSeries) -> Optional[pd.DatetimeIndex]:
+        """
+        All bar dates of a preloaded feed, or None if the feed is not preloaded.
+        """
+        if data.buflen() <= 0:
+            return None
+        raw = np.asarray(data.datetime.array, dtype=float)[: data.buflen()]
+        return pd.DatetimeIndex(bt_dates(raw))
+
+    # ---------- Checkpoint state ----------
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        JSON-serializable state a subclass needs to continue a run from the
+        last bar (rolling windows, counters, ...). Signals rebuilt from econ
+        data in __init__ do not need to be included.
+        """
+        return {}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Restore what get_state() returned; called from start() on resume.
+        """
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        End-of-run account and strategy state for a checkpoint.
+        """
+        positions: Dict[str, List[float]] = {}
+        for symbol, data in self.symbol_to_data.items():
+            pos = self.broker.getposition(data)
+            if pos.size:
+                positions[symbol] = [float(pos.size), float(pos.price)]
+
+        last_date = max(data.datetime.date(0) for data in self.datas)
+
+        return {
+            "last_date": last_date.isoformat(),
+            "cash": float(self.broker.getcash()),
+            "positions": positions,
+            # Period before the last bar: a resumed run replays that bar
+            "strategy_state": dict(self.get_state(), _rebalance_period=self._prev_period),
+        }
+
     # ---------- Core Backtrader Hook ----------
 
     def next(self) -> None:
         """
-        Called every bar. Computes target weights and routes to broker.
+        Called every bar. On rebalance bars, computes target weights and
+        routes the ones that differ enough from current exposure to the broker.
         """
-        if not self.p.rebalance_on_every_bar:
-            # Placeholder for more complex rules later
-            pass
+        profiler = self.profiler
+        if not self._is_rebalance_bar():
+            if profiler is not None:
+                profiler.count_orders(0)
+            return
+
+        if profiler is None:
+            self._submit_orders(self._checked_target_weights())
+            return
+        targets = profiler.call("compute_target_weights", self._checked_target_weights)
+        profiler.count_orders(profiler.call("submit_orders", self._submit_orders, targets))
 
+    def _checked_target_weights(self) -> Dict[str, float]:
         targets = self.compute_target_weights()
         if not isinstance(targets, dict):
             raise TypeError("compute_target_weights() must return dict[symbol, weight].")
+        if self.target_log is not None:
+            self.target_log.append((int(self.datetime[0]) - _EPOCH_ORDINAL, dict(targets)))
+        return targets
 
-        # Enforce deterministic order of execution
+    def _submit_orders(self, targets: Dict[str, float]) -> int:
+        """
+        Route the targets that need a trade to the broker; returns how many
+        were routed.
+        """
+        value = self.account_value()
+        self._sub_pending_cash = self._sub_cash
+
+        orders = []
         for symbol in sorted(targets.keys()):
             target = float(targets[symbol])
 
@@ -79,70 +432,183 @@ class StrategyBase(bt.Strategy):
             if data is None:
                 raise ValueError(f"compute_target_weights() returned unknown symbol: {symbol}")
 
-            # Use Backtrader's built-in sizing by percent of equity
-            self.order_target_percent(data=data, target=target)
+            if self._needs_trade(data, target, value):
+                buying = target * value > self.position_size(data) * data.close[0]
+                orders.append((buying, symbol, data, target))
+
+        # Deterministic order of execution: sells first, so a rotation's
+        # buys are funded by the cash they free, then by symbol
+        for _, _, data, target in sorted(orders, key=lambda o: o[:2]):
+            if self._sub_cash is None:
+                # Use Backtrader's built-in sizing by percent of equity
+                self.order_target_percent(data=data, target=target)
+            else:
+                self._order_target_sub_account(data, target * value)
+        return len(orders)
+
+    # ---------- Account ----------
+
+    def position_size(self, data: bt.LineSeries) -> float:
+        """
+        Size held in `data`: the sub-account's in sub_account mode,
+        otherwise the broker's.
+        """
+        if self._sub_cash is None:
+            return self.broker.getposition(data).size
+        return self._sub_positions.get(data, 0.0)
+
+    def account_value(self) -> float:
+        """
+        Value of this strategy's account at current closes: the broker value,
+        or sub-account cash plus positions in sub_account mode.
+        """
+        if self._sub_cash is None:
+            return self.broker.getvalue()
+        return self._sub_cash + sum(
+            size * data.close[0] for data, size in self._sub_positions.items() if size
+        )
+
+    def _order_target_sub_account(self, data: bt.LineSeries, target_value: float) -> None:
+        """
+        order_target_value() against the sub-account: whole units, sized
+        from the current close like Backtrader's stock-like sizing.
+
+        Like the broker's submission check, a buy whose cost plus commission
+        at the current close exceeds the sub-account's remaining cash for
+        this bar is dropped (the broker would reject it for margin).
+        """
+        size = self.position_size(data)
+        price = data.close[0]
+        current_value = size * price
+
+        if target_value == 0.0:
+            units = -size
+        elif target_value > current_value:
+            units = int((target_value - current_value) // price)
+        else:
+            units = -int((current_value - target_value) // price)
+        if not units:
+            return
+
+        comm = self.broker.getcommissioninfo(data).getcommission(units, price)
+        cash_after = self._sub_pending_cash - units * price - comm
+        if units > 0 and cash_after < 0.0:
+            return
+        self._sub_pending_cash = cash_after
+
+        if target_value == 0.0:
+            self.close(data=data, size=size)
+        elif units > 0:
+            self.buy(data=data, size=units)
+        else:
+            self.sell(data=data, size=-units)
+
+    def _book_sub_account_fill(self, order: bt.Order) -> None:
+        """
+        Apply the not-yet-booked part of an order's (cumulative) execution
+        to the sub-account ledger.
+        """
+        size = float(order.executed.size)
+        cost = size * float(order.executed.price) + float(order.executed.comm)
+        booked_size, booked_cost = self._sub_fills.get(order.ref, (0.0, 0.0))
+        self._sub_fills[order.ref] = (size, cost)
+
+        self._sub_positions[order.data] = self._sub_positions.get(order.data, 0.0) + size - booked_size
+        self._sub_cash -= cost - booked_cost
+
+    def _is_rebalance_bar(self) -> bool:
+        """
+        Advance the period tracker; True on the first bar of a new period.
+        """
+        if self._frequency == "DAILY":
+            return True
+
+        today = max(data.datetime.date(0) for data in self.datas)
+        key = int(rebalance_period_keys(
+            np.array([today.toordinal() - _EPOCH_ORDINAL]), self._frequency
+        )[0])
+        self._prev_period, self._period = self._period, key
+        return key != self._prev_period
+
+    def _needs_trade(self, data: bt.LineSeries, target: float, value: float) -> bool:
+        """
+        Rebalance-band and minimum-notional filter for one symbol. Closing a
+        position (target 0) is never filtered.
+        """
+        if value <= 0.0:
+            return False
+        size = self.position_size(data)
+        current = size * data.close[0] / value
+        if target == 0.0:
+            return size != 0
+        diff = abs(target - current)
+        if diff == 0.0 or diff <= self.p.rebalance_band:
+            return False
+        return diff * value >= self.p.min_trade_value
 
     # ---------- Logging ----------
 
-    def log(self, msg: str) -> None:
+    @classmethod
+    def log(cls, msg: str) -> None:
         """
         Minimal logger used by strategies; can be replaced later.
         """
         print(msg)
 
-    def notify_order(self, order: bt.Order) -> None:
+    @property
+    def order_log(self) -> List[dict]:
         """
-        Capture executed orders into order_log.
+        The fill log as dicts (datetime, symbol, size, price, value,
+        commission, order_ref, direction, status).
         """
-        if order.status not in [order.Completed, order.Partial]:
-            return
+        return fill_records(self.fills.array, self.symbol_names)
 
-        dt = bt.num2date(order.executed.dt)
-
-        record = {
-            "datetime": dt,
-            "symbol": order.data._name or order.data._dataname,
-            "size": order.executed.size,
-            "price": order.executed.price,
-            "value": order.executed.value,
-            "commission": order.executed.comm,
-            "order_ref": order.ref,
-            "direction": "buy" if order.isbuy() else "sell",
-            "status": "partial" if order.status == order.Partial else "completed",
-        }
-        self.order_log.append(record)
+    @property
+    def trade_log(self) -> List[dict]:
+        """
+        FIFO round trips of the fill log as dicts (symbol, dt_open,
+        dt_close, size, price_open, price_close, pnl, pnl_commission).
+        """
+        return trade_records(self.match_trades(), self.symbol_names)
+
+    def match_trades(self, opening_day: Optional[int] = None) -> np.ndarray:
+        """
+        TRADE_DTYPE round trips of the fill log (core/trade_log.py). Holdings
+        from initial_positions are opening lots dated `opening_day` (days
+        since 1970-01-01; default: the first fill's day).
+        """
+        fills = self.fills.array
+        opening = None
+        if self.p.initial_positions:
+            if opening_day is None:
+                opening_day = int(fills["day"][0]) if len(fills) else 0
+            opening = opening_lots(self.p.initial_positions, self.symbol_names, opening_day)
+        return match_fifo_lots(fills, opening)
 
-    def notify_trade(self, trade: bt.Trade) -> None:
+    def notify_order(self, order: bt.Order) -> None:
+        if self.profiler is None:
+            self._record_order(order)
+        else:
+            self.profiler.call("notify_order", self._record_order, order)
+
+    def _record_order(self, order: bt.Order) -> None:
         """
-        Capture closed trades into trade_log.
+        Append executed orders to the fill log.
         """
-        if not trade.isclosed:
+        if order.status not in [order.Completed, order.Partial]:
             return
 
-        # Backtrader stores datetimes as float-like numbers
-        dt_open = bt.num2date(trade.dtopen) if trade.dtopen is not None else None
-        dt_close = bt.num2date(trade.dtclose) if trade.dtclose is not None else None
-
-        # Symbol name: prefer `_name`, fall back to `_dataname`
-        data = trade.data
-        symbol = getattr(data, "_name", None) or getattr(data, "_dataname", None)
-
-        # There is no `trade.priceclose` in Backtrader.
-        # Approximate exit price from the data feed at the close bar.
-        try:
-            price_close = float(data.close[0])
-        except Exception:
-            price_close = None
-
-        record = {
-            "symbol": symbol,
-            "dt_open": dt_open,
-            "dt_close": dt_close,
-            "size": trade.size,
-            "price_open": trade.price,        # average entry price
-            "price_close": price_close,       # exit close from data
-            "pnl": trade.pnl,
-            "pnl_commission": trade.pnlcomm,
-        }
+        if self._sub_cash is not None:
+            self._book_sub_account_fill(order)
 
-        self.trade_log.append(record)
\ No newline at end of file
+        executed = order.executed
+        self.fills.append((
+            int(executed.dt) - _EPOCH_ORDINAL,
+            self._symbol_codes[order.data],
+            executed.size,
+            executed.price,
+            executed.value,
+            executed.comm,
+            order.ref,
+            order.status == order.Partial,
+        ))
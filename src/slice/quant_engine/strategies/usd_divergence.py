@@ -12,7 +12,7 @@ Data inputs:
 Signal:
   - Compute spread = us_rate - eu_rate.
   - Compute rolling mean over spread_ma_window.
-  - If spread > spread_MA on the bar date, target_long weight is applied to price_symbol; else flat.
+  - If spread > spread_MA as of the bar date, target_long weight is applied to price_symbol; else flat.
 
 Parameters (params dict):
   - symbols: list[str] | None — tickers supplied by Cerebro; must include price_symbol.
@@ -24,13 +24,14 @@ Parameters (params dict):
 """
 from __future__ import annotations
 
-import datetime
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from slice.quant_engine.strategies.strategy_base import StrategyBase
 from slice.quant_engine.data import load_econ_series
+from slice.quant_engine.data.signal_store import SignalSpec, get_signal_store
 
 
 class USDDivergenceStrategy(StrategyBase):
@@ -48,6 +49,8 @@ class USDDivergenceStrategy(StrategyBase):
     This is deliberately simple and sandbox-y, just like GoldRealYieldsStrategy.
     """
 
+    STRATEGY_ID = "USD_DIVERGENCE"
+
     params = dict(
         symbols=None,                 # list of tickers provided by Cerebro; must include price_symbol
         price_symbol="UUP",           # USD price proxy resolved via market_data
@@ -64,6 +67,11 @@ class USDDivergenceStrategy(StrategyBase):
         self._target_long: float = float(self.p.target_long)
         self._ma_window: int = int(self.p.spread_ma_window)
 
+        # Built once; compute_target_weights() returns one of these per bar.
+        self._flat_weights: Dict[str, float] = {s: 0.0 for s in self.p.symbols or []}
+        self._long_weights: Dict[str, float] = dict(self._flat_weights)
+        self._long_weights[self._price_symbol] = self._target_long
+
         # Sanity: make sure price_symbol is in the symbols list passed in
         if self.p.symbols is None or self._price_symbol not in self.p.symbols:
             self.log(
@@ -75,48 +83,78 @@ class USDDivergenceStrategy(StrategyBase):
             self._spread_ma = None
             return
 
-        us_id = self.p.us_rate_series_id
-        eu_id = self.p.eu_rate_series_id
+        signal = self._load_signal(self.p)
+        if signal is None:
+            self._enabled = False
+            self._spread = None
+            self._spread_ma = None
+            return
+
+        self._enabled = True
+        self._spread, self._spread_ma = signal
+
+        price_data = self.symbol_to_data[self._price_symbol]
+        self.register_signal("spread", self._spread, price_data)
+        self.register_signal("spread_ma", self._spread_ma, price_data)
+
+    @classmethod
+    def _load_signal(cls, p) -> Optional[Tuple[pd.Series, pd.Series]]:
+        """
+        Load the US-minus-EU rate spread and its rolling mean, indexed by date.
+        Returns None (after logging why) if the econ data is unusable.
+        """
+        us_id = p.us_rate_series_id
+        eu_id = p.eu_rate_series_id
+        ma_window = int(p.spread_ma_window)
 
         us_df = load_econ_series(us_id)
         eu_df = load_econ_series(eu_id)
 
         if us_df.empty or eu_df.empty:
-            self.log(
+            cls.log(
                 f"[USDDivergence] Missing econ data for us_id='{us_id}' "
                 f"or eu_id='{eu_id}'. Strategy will remain flat."
             )
-            self._enabled = False
-            self._spread = None
-            self._spread_ma = None
-            return
+            return None
 
         # Expect columns ['date', 'value'] from load_econ_series
         for label, df in (("US", us_df), ("EU", eu_df)):
             if not {"date", "value"}.issubset(df.columns):
-                self.log(
+                cls.log(
                     f"[USDDivergence] {label} econ_df has unexpected columns "
                     f"{list(df.columns)}; staying flat."
                 )
-                self._enabled = False
-                self._spread = None
-                self._spread_ma = None
-                return
+                return None
 
-        us_df = us_df.copy()
-        eu_df = eu_df.copy()
+        signal = get_signal_store().get(
+            SignalSpec("usd_divergence.spread", (us_id, eu_id), ma_window),
+            [us_df, eu_df],
+            cls._spread_level,
+        )
+        if signal is None:
+            cls.log(
+                "[USDDivergence] No overlapping dates between US and EU series; "
+                "staying flat."
+            )
+            return None
+        spread, spread_ma = signal
 
-        if not pd.api.types.is_datetime64_any_dtype(us_df["date"]):
-            us_df["date"] = pd.to_datetime(us_df["date"])
-        if not pd.api.types.is_datetime64_any_dtype(eu_df["date"]):
-            eu_df["date"] = pd.to_datetime(eu_df["date"])
+        cls.log(
+            f"[USDDivergence] Initialized with us_id='{us_id}', eu_id='{eu_id}', "
+            f"{len(spread)} overlapping points, MA window={ma_window}."
+        )
+        return spread, spread_ma
 
-        us_df = us_df.sort_values("date")
-        eu_df = eu_df.sort_values("date")
+    @staticmethod
+    def _spread_level(frames: List[pd.DataFrame]) -> pd.Series:
+        """
+        US-minus-EU rate spread indexed by date (signal store level function).
+        """
+        us_df, eu_df = (df.sort_values("date") for df in frames)
 
         # Index by date (date-only) to align with daily price series
-        us_df.set_index(us_df["date"].dt.date, inplace=True)
-        eu_df.set_index(eu_df["date"].dt.date, inplace=True)
+        us_df = us_df.set_index(us_df["date"].dt.date)
+        eu_df = eu_df.set_index(eu_df["date"].dt.date)
 
         joined = pd.DataFrame(
             {
@@ -124,28 +162,7 @@ class USDDivergenceStrategy(StrategyBase):
                 "eu": eu_df["value"].astype(float),
             }
         ).dropna()
-
-        if joined.empty:
-            self.log(
-                "[USDDivergence] No overlapping dates between US and EU series; "
-                "staying flat."
-            )
-            self._enabled = False
-            self._spread = None
-            self._spread_ma = None
-            return
-
-        spread = joined["us"] - joined["eu"]
-        spread_ma = spread.rolling(self._ma_window).mean()
-
-        self._enabled = True
-        self._spread = spread
-        self._spread_ma = spread_ma
-
-        self.log(
-            f"[USDDivergence] Initialized with us_id='{us_id}', eu_id='{eu_id}', "
-            f"{len(spread)} overlapping points, MA window={self._ma_window}."
-        )
+        return joined["us"] - joined["eu"]
 
     def compute_target_weights(self) -> Dict[str, float]:
         """
@@ -155,32 +172,42 @@ class USDDivergenceStrategy(StrategyBase):
         - If signal is on and econ series aligned for the current date, allocate
           target_long to the price_symbol, 0 to others.
         """
-        symbols = self.p.symbols or []
-        weights: Dict[str, float] = {s: 0.0 for s in symbols}
+        if not self._enabled:
+            return self._flat_weights
 
-        if not getattr(self, "_enabled", False):
-            return weights
+        # Econ values as-of this bar, aligned in start(); NaN before the
+        # first available value or while the MA warms up → stay flat
+        sp = self.signal_at("spread")
+        ma = self.signal_at("spread_ma")
 
-        if self._spread is None or self._spread_ma is None:
-            return weights
+        if sp > ma:
+            return self._long_weights
 
-        price_data = self.symbol_to_data.get(self._price_symbol)
-        if price_data is None:
-            return weights
+        return self._flat_weights
 
-        current_date: datetime.date = price_data.datetime.date(0)
+    @classmethod
+    def compute_weight_matrix(cls, closes: pd.DataFrame, p) -> pd.DataFrame:
+        """
+        Whole-run version of compute_target_weights(): long price_symbol at
+        target_long on every bar where spread > spread_MA.
+        """
+        weights = pd.DataFrame(0.0, index=closes.index, columns=closes.columns)
 
-        try:
-            sp = float(self._spread.loc[current_date])
-            ma = float(self._spread_ma.loc[current_date])
-        except KeyError:
-            # No econ data for this exact date → stay flat
+        if p.price_symbol not in closes.columns:
+            cls.log(
+                f"[USDDivergence] price_symbol '{p.price_symbol}' "
+                f"not in p.symbols={list(closes.columns)}; staying flat."
+            )
             return weights
 
-        if pd.isna(ma):
+        signal = cls._load_signal(p)
+        if signal is None:
             return weights
 
-        if sp > ma:
-            weights[self._price_symbol] = self._target_long
+        spread, spread_ma = signal
+        aligned = cls.align_signals({"level": spread, "ma": spread_ma}, closes.index, p)
+        sp, ma = aligned["level"], aligned["ma"]
 
+        # NaN (no econ value available yet, MA warming up) compares False → flat
+        weights[p.price_symbol] = np.where(sp > ma, float(p.target_long), 0.0)
         return weights
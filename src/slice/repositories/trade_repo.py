@@ -1,37 +1,54 @@
 from typing import Optional, List
 from sqlalchemy import text
+from sqlalchemy.engine import Connection
 
 from slice.db import get_engine
 from slice.models.trade import Trade
 
 
+_UPSERT_SQL = text("""
+    INSERT INTO trade (
+        trade_id, timestamp, asset, action, quantity,
+        price, type, thesis_ref, notes
+    )
+    VALUES (
+        :trade_id, :timestamp, :asset, :action, :quantity,
+        :price, :type, :thesis_ref, :notes
+    )
+    ON CONFLICT (trade_id) DO UPDATE SET
+        timestamp = EXCLUDED.timestamp,
+        asset = EXCLUDED.asset,
+        action = EXCLUDED.action,
+        quantity = EXCLUDED.quantity,
+        price = EXCLUDED.price,
+        type = EXCLUDED.type,
+        thesis_ref = EXCLUDED.thesis_ref,
+        notes = EXCLUDED.notes;
+""")
+
+
 class TradeRepository:
 
     @staticmethod
     def insert(trade: Trade) -> None:
         engine = get_engine()
-        sql = text("""
-            INSERT INTO trade (
-                trade_id, timestamp, asset, action, quantity,
-                price, type, thesis_ref, notes
-            )
-            VALUES (
-                :trade_id, :timestamp, :asset, :action, :quantity,
-                :price, :type, :thesis_ref, :notes
-            )
-            ON CONFLICT (trade_id) DO UPDATE SET
-                timestamp = EXCLUDED.timestamp,
-                asset = EXCLUDED.asset,
-                action = EXCLUDED.action,
-                quantity = EXCLUDED.quantity,
-                price = EXCLUDED.price,
-                type = EXCLUDED.type,
-                thesis_ref = EXCLUDED.thesis_ref,
-                notes = EXCLUDED.notes;
-        """)
-
         with engine.begin() as conn:
-            conn.execute(sql, trade.dict())
+            conn.execute(_UPSERT_SQL, trade.dict())
+
+    @staticmethod
+    def insert_many(trades: List[Trade], conn: Optional[Connection] = None) -> None:
+        """
+        Upsert several trades in one executemany; inside `conn`'s
+        transaction if given, else in a transaction of its own.
+        """
+        if not trades:
+            return
+        rows = [t.dict() for t in trades]
+        if conn is not None:
+            conn.execute(_UPSERT_SQL, rows)
+            return
+        with get_engine().begin() as own:
+            own.execute(_UPSERT_SQL, rows)
 
     @staticmethod
     def list_for_thesis(thesis_id: str) -> List[Trade]:
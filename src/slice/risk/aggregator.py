@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Mapping
 
 import pandas as pd
 
@@ -38,6 +38,18 @@ def aggregate_portfolio(
         if name in weights
     }
 
+    return _aggregate_frames(frames, weights, portfolio_id, frequency)
+
+
+def _aggregate_frames(
+    frames: Mapping[str, pd.Series],
+    weights: Dict[str, float],
+    portfolio_id: str,
+    frequency: str,
+) -> PortfolioReturnSeries:
+    """
+    Weighted sum of date-indexed component return series.
+    """
     if not frames:
         return PortfolioReturnSeries(
             portfolio_id=portfolio_id,
@@ -45,15 +57,18 @@ def aggregate_portfolio(
             returns=[],
         )
 
-    returns_df = pd.DataFrame(frames).sort_index().fillna(0.0)
+    returns_df = pd.DataFrame(dict(frames)).sort_index().fillna(0.0)
     w = pd.Series(weights)
     # align weights with available columns
     w = w.reindex(returns_df.columns).fillna(0.0)
 
     weighted = (returns_df * w).sum(axis=1)
+    dates = weighted.index
+    if isinstance(dates, pd.DatetimeIndex):
+        dates = dates.date
     points = [
-        TimeSeriesPoint(date=idx, value=float(val))
-        for idx, val in weighted.items()
+        TimeSeriesPoint.model_construct(date=d, value=v)
+        for d, v in zip(dates, weighted.to_numpy(dtype=float).tolist())
     ]
 
     return PortfolioReturnSeries(
@@ -73,7 +88,19 @@ def aggregate_from_backtest(
 
     backtest.strategies: list of StrategyReturnSeries
     weights: mapping from strategy_id -> portfolio weight
+
+    Columnar results (anything with strategy_returns() -> {strategy_id:
+    date-indexed pd.Series}, e.g. ColumnarBacktestResult) are aggregated
+    from their arrays without building TimeSeriesPoints first.
     """
+    if hasattr(backtest, "strategy_returns"):
+        frames = {
+            name: series
+            for name, series in backtest.strategy_returns().items()
+            if name in weights
+        }
+        return _aggregate_frames(frames, weights, portfolio_id, backtest.frequency)
+
     components: Dict[str, List[TimeSeriesPoint]] = {}
     for strat in backtest.strategies:
         if strat.strategy_id not in weights:
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from math import sqrt
-from typing import Iterable
+from typing import Any, Dict, Iterable
 
+import numpy as np
 import pandas as pd
 
 from .schemas import PortfolioReturnSeries, RiskMetrics
@@ -78,9 +79,13 @@ def _compute_sharpe(
     returns: pd.Series,
     freq: str,
     risk_free_rate_annual: float = 0.0,
+    annualize: bool = True,
+    ddof: int = 1,
 ) -> float | None:
     """
     Compute annualized Sharpe ratio given a return series and an annual risk-free rate.
+    With annualize=False the per-period ratio is returned; ddof=0 uses the
+    population std (Backtrader's SharpeRatio convention).
     """
     if returns.empty:
         return None
@@ -96,9 +101,11 @@ def _compute_sharpe(
 
     excess = returns - rf_period
     mean_excess = float(excess.mean())
-    vol = float(excess.std(ddof=1))
+    vol = float(excess.std(ddof=ddof))
     if vol == 0.0:
         return None
+    if not annualize:
+        return float(mean_excess / vol)
 
     if freq == "D":
         factor = sqrt(TRADING_DAYS_PER_YEAR)
@@ -113,19 +120,42 @@ def _compute_sharpe(
     return float(sharpe)
 
 
-def _compute_max_drawdown(returns: pd.Series) -> float:
+def _drawdown_curve(returns: pd.Series, from_initial: bool) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (equity, running peak) of the compounded returns. With from_initial the
+    starting value 1.0 counts as a peak, as for a broker account.
+    """
+    equity = np.cumprod(1.0 + returns.to_numpy(dtype=float))
+    peak = np.maximum.accumulate(np.maximum(equity, 1.0) if from_initial else equity)
+    return equity, peak
+
+
+def _compute_max_drawdown(returns: pd.Series, from_initial: bool = False) -> float:
     """
     Compute max drawdown from a series of returns.
     """
     if returns.empty:
         return 0.0
 
-    equity = (1.0 + returns).cumprod()
-    rolling_max = equity.cummax()
-    drawdowns = (equity / rolling_max) - 1.0
+    equity, peak = _drawdown_curve(returns, from_initial)
+    drawdowns = (equity / peak) - 1.0
     return float(drawdowns.min())
 
 
+def _compute_max_drawdown_length(returns: pd.Series, from_initial: bool = False) -> int:
+    """
+    Longest run of periods spent below a prior peak.
+    """
+    if returns.empty:
+        return 0
+
+    equity, peak = _drawdown_curve(returns, from_initial)
+    in_dd = equity < peak
+    idx = np.arange(len(equity))
+    last_peak = np.maximum.accumulate(np.where(in_dd, -1, idx))
+    return int(np.where(in_dd, idx - last_peak, 0).max())
+
+
 def _compute_rolling_stats(
     returns: pd.Series,
     freq: str,
@@ -150,6 +180,30 @@ def _compute_rolling_stats(
     return rolling_vol, rolling_sharpe
 
 
+def compute_return_stats(
+    returns: pd.Series | np.ndarray,
+    freq: str = "D",
+    risk_free_rate_annual: float = 0.0,
+    annualize: bool = True,
+    ddof: int = 1,
+    drawdown_from_initial: bool = False,
+) -> Dict[str, Any]:
+    """
+    total_return, sharpe, max_drawdown (negative fraction) and
+    max_drawdown_len of a per-period return series, computed with the
+    same helpers as compute_risk_metrics().
+    """
+    if not isinstance(returns, pd.Series):
+        returns = pd.Series(np.asarray(returns, dtype=float))
+
+    return {
+        "total_return": _compute_cumulative_return(returns),
+        "sharpe": _compute_sharpe(returns, freq, risk_free_rate_annual, annualize=annualize, ddof=ddof),
+        "max_drawdown": _compute_max_drawdown(returns, from_initial=drawdown_from_initial),
+        "max_drawdown_len": _compute_max_drawdown_length(returns, from_initial=drawdown_from_initial),
+    }
+
+
 def compute_risk_metrics(
     portfolio: PortfolioReturnSeries,
     risk_free_rate_annual: float = 0.0,
@@ -110,6 +110,8 @@ class BacktestResult(BaseModel):
     backtest_id: str
     frequency: str
     strategies: List[StrategyReturnSeries] = Field(default_factory=list)
+    # run details from Dev A (engine, period, metrics, ...)
+    metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
 # ---------- Top-level risk report ----------
@@ -10,6 +10,7 @@ from sqlalchemy import text
 
 from .config import load_settings
 from .db import get_engine, get_last_market_date, get_last_macro_date
+from .quant_engine.data.econ_loader import invalidate_econ_cache
 
 
 # ----------------------------
@@ -148,6 +149,7 @@ def update_macro_data() -> None:
       - Fetch full series via FRED.
       - Filter to rows > last_date.
       - Insert with ON CONFLICT DO NOTHING.
+      - Invalidate this process's econ cache for the series.
     """
     settings = load_settings()
     if not settings.fred_api_key:
@@ -214,4 +216,7 @@ def update_macro_data() -> None:
                 rows,
             )
 
+        # Cached frames for this series are now stale
+        invalidate_econ_cache(series_id)
+
         print(f"  Inserted {len(rows)} new row(s).")
@@ -0,0 +1,72 @@
+from typing import Dict, List, Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from slice.quant_engine.interface import run_backtest as rb
+
+
+class OfflinePrices:
+    """
+    Stand-in for market_data in tests: builds random-walk OHLCV frames and,
+    once installed as run_backtest's load_price_panel(), serves the frames
+    given to serve(), sliced to start / end like the real loader. Every
+    load's tickers are recorded in `loads`.
+    """
+
+    def __init__(self) -> None:
+        self.frames: Dict[str, pd.DataFrame] = {}
+        self.default: Optional[pd.DataFrame] = None
+        self.loads: List[List[str]] = []
+
+    @staticmethod
+    def frame(
+        index: pd.DatetimeIndex,
+        seed: int = 0,
+        level: float = 100.0,
+        vol: float = 0.01,
+        drift: float = 0.0,
+    ) -> pd.DataFrame:
+        """
+        Daily bars on `index`: a log-normal random walk from `level` (log
+        returns ~ N(drift, vol)), with open = high = low = close and unit
+        volume.
+        """
+        rng = np.random.default_rng(seed)
+        close = level * np.exp(np.cumsum(rng.normal(drift, vol, len(index))))
+        return pd.DataFrame(
+            {"open": close, "high": close, "low": close, "close": close, "volume": 1.0},
+            index=index,
+        )
+
+    def serve(self, frames: Union[pd.DataFrame, Mapping[str, pd.DataFrame]]) -> None:
+        """
+        Serve one frame for every ticker, or {ticker: frame} (other tickers
+        have no data).
+        """
+        if isinstance(frames, pd.DataFrame):
+            self.frames, self.default = {}, frames
+        else:
+            self.frames, self.default = dict(frames), None
+
+    def load_price_panel(self, tickers, start=None, end=None) -> Dict[str, pd.DataFrame]:
+        self.loads.append(list(tickers))
+        panel = {}
+        for ticker in tickers:
+            df = self.frames.get(ticker, self.default)
+            if df is None:
+                continue
+            if start is not None:
+                df = df[df.index >= pd.to_datetime(start)]
+            if end is not None:
+                df = df[df.index <= pd.to_datetime(end)]
+            panel[ticker] = df
+        return panel
+
+
+@pytest.fixture
+def offline_prices(monkeypatch) -> OfflinePrices:
+    prices = OfflinePrices()
+    monkeypatch.setattr(rb, "load_price_panel", prices.load_price_panel)
+    return prices
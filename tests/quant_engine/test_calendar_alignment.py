@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from slice.quant_engine.core.cerebro import run_cerebro
+from slice.quant_engine.data.calendar import align_to_calendar, trading_calendar
+from slice.quant_engine.strategies.gold_real_yields import GoldRealYieldsStrategy
+
+
+def test_trading_calendar_is_sorted_union():
+    a = pd.DatetimeIndex(["2024-01-03", "2024-01-02 16:00"])
+    b = pd.DatetimeIndex(["2024-01-02", "2024-01-05"])
+
+    calendar = trading_calendar([a, b])
+
+    assert list(calendar) == list(pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-05"]))
+
+
+def test_asof_forward_fills_and_respects_release_lag():
+    calendar = pd.bdate_range("2024-01-01", "2024-03-29")
+    monthly = pd.Series([1.0, np.nan, 3.0], index=pd.to_datetime(["2024-01-01", "2024-02-01", "2024-03-01"]))
+
+    aligned = align_to_calendar({"m": monthly, "lagged": monthly}, calendar, release_lag_days={"lagged": 14})
+    m = pd.Series(aligned["m"], index=calendar)
+    lagged = pd.Series(aligned["lagged"], index=calendar)
+
+    # the NaN February print is skipped: January's value carries on
+    assert m["2024-02-15"] == 1.0
+    assert m["2024-03-01"] == 3.0
+    assert np.isnan(lagged["2024-01-12"])
+    assert lagged["2024-01-15"] == 1.0
+    assert lagged["2024-03-14"] == 1.0
+    assert lagged["2024-03-15"] == 3.0
+
+    exact = align_to_calendar({"m": monthly}, calendar, how="exact")["m"]
+    assert np.count_nonzero(~np.isnan(exact)) == 2
+    with pytest.raises(ValueError):
+        align_to_calendar({"m": monthly}, calendar, how="nearest")
+
+
+@pytest.mark.parametrize("alignment,lag", [("asof", 0), ("asof", 5), ("exact", 0)])
+def test_backtrader_signals_match_vectorized_alignment(monkeypatch, offline_prices, alignment, lag):
+    # two feeds with different holidays; weekly econ prints
+    gld = offline_prices.frame(pd.bdate_range("2021-01-01", periods=300).delete([10, 50]))
+    spy = offline_prices.frame(pd.bdate_range("2021-01-01", periods=300).delete([20]), seed=1)
+    weekly = pd.date_range("2020-10-02", periods=70, freq="W-FRI")
+    econ = pd.DataFrame({"date": weekly, "value": np.linspace(1.0, -1.0, len(weekly))})
+    monkeypatch.setattr(
+        "slice.quant_engine.strategies.gold_real_yields.load_econ_series",
+        lambda series_id, start=None, end=None: econ,
+    )
+    params = {
+        "real_yield_ma_window": 4,
+        "econ_alignment": alignment,
+        "econ_release_lag_days": lag,
+    }
+
+    strat, _ = run_cerebro(GoldRealYieldsStrategy, {"GLD": gld, "SPY": spy}, strategy_params=params)
+
+    p = GoldRealYieldsStrategy.resolve_params(params)
+    level, ma = GoldRealYieldsStrategy._load_signal(p)
+    expected = GoldRealYieldsStrategy.align_signals({"level": level, "ma": ma}, gld.index, p)
+    np.testing.assert_array_equal(strat._signal_arrays["real_yield"], expected["level"])
+    np.testing.assert_array_equal(strat._signal_arrays["real_yield_ma"], expected["ma"])
+    if alignment == "asof":
+        # every bar after warm-up has a signal, not just Fridays
+        assert np.isnan(expected["ma"][20:]).sum() == 0
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from slice.quant_engine.interface import run_backtest as rb
+
+
+@pytest.fixture
+def prices(offline_prices):
+    idx = pd.bdate_range("2022-01-03", periods=120)
+    offline_prices.serve(offline_prices.frame(idx, seed=11, level=50.0))
+    return idx
+
+
+def _values(result):
+    return [(p.date, p.value) for p in result.strategies[0].returns]
+
+
+def test_resumed_run_matches_full_run(prices, tmp_path):
+    params = {"tickers": ["SPY"], "commission": 0.001, "cache": False}
+    full = rb.run_backtest("BUY_AND_HOLD_FIRST", params)
+
+    ckpt = str(tmp_path / "bh.json")
+    first = rb.run_backtest(
+        "BUY_AND_HOLD_FIRST", {**params, "end": prices[79], "checkpoint": ckpt}
+    )
+    resumed = rb.run_backtest("BUY_AND_HOLD_FIRST", {**params, "checkpoint": ckpt})
+
+    assert len(_values(first)) == 80
+    assert resumed.metadata["resumed_from"] == prices[79].date().isoformat()
+    assert [d for d, _ in _values(resumed)] == [d for d, _ in _values(full)]
+    np.testing.assert_allclose(
+        [v for _, v in _values(resumed)], [v for _, v in _values(full)], atol=1e-9
+    )
+
+
+def test_changed_params_ignore_checkpoint(prices, tmp_path):
+    ckpt = str(tmp_path / "bh.json")
+    rb.run_backtest("BUY_AND_HOLD_FIRST", {"tickers": ["SPY"], "end": prices[50], "checkpoint": ckpt})
+
+    other = rb.run_backtest(
+        "BUY_AND_HOLD_FIRST", {"tickers": ["SPY"], "commission": 0.002, "checkpoint": ckpt}
+    )
+    assert "resumed_from" not in other.metadata
+    assert len(_values(other)) == 120
@@ -0,0 +1,52 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from slice.quant_engine.core.results import ColumnarBacktestResult
+from slice.quant_engine.interface import run_backtest as rb
+from slice.risk.aggregator import aggregate_from_backtest
+
+
+@pytest.fixture
+def prices(offline_prices):
+    frame = offline_prices.frame(pd.bdate_range("2023-01-02", periods=40), seed=2, level=10.0)
+    offline_prices.serve(frame)
+    return frame
+
+
+@pytest.mark.parametrize("engine", ["backtrader", "vectorized"])
+def test_columnar_matches_pydantic_result(prices, engine):
+    params = {"tickers": ["SPY"], "engine": engine, "cache": False}
+
+    columnar = rb.run_backtest("BUY_AND_HOLD_FIRST", dict(params, result_format="columnar"))
+    pydantic = rb.run_backtest("BUY_AND_HOLD_FIRST", params)
+
+    assert isinstance(columnar, ColumnarBacktestResult)
+    assert columnar.to_backtest_result().model_dump() == pydantic.model_dump()
+    assert columnar.dates.dtype == np.dtype("datetime64[D]")
+    np.testing.assert_allclose(columnar.equity, 100_000.0 * np.cumprod(1.0 + columnar.returns))
+
+    # bought on the second bar's open, then only small drift rebalances
+    held = columnar.positions[:, 0]
+    assert held[0] == 0.0
+    np.testing.assert_allclose(held[1:], held[-1], rtol=0.01)
+
+
+def test_npz_round_trip_and_aggregation(prices):
+    columnar = rb.run_backtest(
+        "BUY_AND_HOLD_FIRST", {"tickers": ["SPY"], "cache": False, "result_format": "columnar"}
+    )
+
+    buf = io.BytesIO()
+    columnar.save_npz(buf)
+    buf.seek(0)
+    loaded = ColumnarBacktestResult.load_npz(buf)
+    np.testing.assert_array_equal(loaded.returns, columnar.returns)
+    assert loaded.to_backtest_result().model_dump() == columnar.to_backtest_result().model_dump()
+
+    weights = {"BUY_AND_HOLD_FIRST": 0.5}
+    from_arrays = aggregate_from_backtest(columnar, weights, "P")
+    from_points = aggregate_from_backtest(columnar.to_backtest_result(), weights, "P")
+    assert from_arrays.model_dump() == from_points.model_dump()
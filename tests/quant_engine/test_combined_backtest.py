@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from slice.quant_engine.interface import run_backtest as rb
+from slice.risk.aggregator import aggregate_from_backtest
+
+
+@pytest.fixture
+def offline(monkeypatch, offline_prices):
+    idx = pd.bdate_range("2021-01-04", periods=150)
+    offline_prices.serve({
+        "GLD": offline_prices.frame(idx, seed=8, level=40.0),
+        "SPY": offline_prices.frame(idx, seed=9, level=40.0),
+    })
+    rng = np.random.default_rng(10)
+    econ = pd.DataFrame({"date": idx, "value": 1.0 + np.cumsum(rng.normal(0.0, 0.05, len(idx)))})
+    monkeypatch.setattr(
+        "slice.quant_engine.strategies.gold_real_yields.load_econ_series",
+        lambda series_id, start=None, end=None: econ,
+    )
+    return offline_prices.loads
+
+
+REQUESTS = [
+    ("GOLD_REAL_YIELDS", {"tickers": ["GLD"], "real_yield_ma_window": 10, "target_long": 0.5}),
+    ("BUY_AND_HOLD_FIRST", {"tickers": ["SPY"], "cash": 50_000.0}),
+]
+
+
+@pytest.mark.parametrize("engine", ["backtrader", "vectorized"])
+def test_combined_run_matches_separate_runs(offline, engine):
+    requests = [(sid, dict(params, engine=engine, commission=0.001)) for sid, params in REQUESTS]
+
+    combined = rb.run_backtests_combined(requests)
+
+    assert offline == [["GLD", "SPY"]]
+    assert [s.strategy_id for s in combined.strategies] == ["GOLD_REAL_YIELDS", "BUY_AND_HOLD_FIRST"]
+    for (strategy_id, params), series in zip(requests, combined.strategies):
+        alone = rb.run_backtest(strategy_id, dict(params, cache=False))
+        np.testing.assert_allclose(
+            [p.value for p in series.returns],
+            [p.value for p in alone.strategies[0].returns],
+            atol=1e-12,
+        )
+
+    portfolio = aggregate_from_backtest(
+        combined, {"GOLD_REAL_YIELDS": 0.5, "BUY_AND_HOLD_FIRST": 0.5}, "P"
+    )
+    assert len(portfolio.returns) == 150
+
+
+def test_combined_rejects_mismatched_shared_params(offline):
+    with pytest.raises(ValueError, match="commission"):
+        rb.run_backtests_combined([
+            ("BUY_AND_HOLD_FIRST", {"tickers": ["SPY"], "commission": 0.001}),
+            ("GOLD_REAL_YIELDS", {"tickers": ["GLD"]}),
+        ])
+
+    with pytest.raises(ValueError, match="unique labels"):
+        rb.run_backtests_combined([
+            ("BUY_AND_HOLD_FIRST", {"tickers": ["SPY"]}),
+            ("BUY_AND_HOLD_FIRST", {"tickers": ["GLD"]}),
+        ])
@@ -0,0 +1,116 @@
+import pandas as pd
+import pytest
+
+from slice.quant_engine.data import econ_loader
+
+
+@pytest.fixture
+def db_calls(monkeypatch):
+    calls = []
+
+    def fake_query(series_id):
+        calls.append(series_id)
+        dates = pd.date_range("2020-01-01", periods=10, freq="D")
+        return pd.DataFrame({"date": dates, "value": [float(i) for i in range(10)]})
+
+    monkeypatch.setattr(econ_loader, "_query_econ_series", fake_query)
+    monkeypatch.setattr(econ_loader, "_probe_econ_series", lambda series_id: (10, "2020-01-10", 45.0))
+    monkeypatch.setattr(econ_loader, "_CACHE", econ_loader.EconSeriesCache(maxsize=2))
+    return calls
+
+
+def test_repeated_loads_hit_cache(db_calls):
+    first = econ_loader.load_econ_series("DGS10")
+    window = econ_loader.load_econ_series("DGS10", start="2020-01-03", end="2020-01-05")
+    econ_loader.load_econ_series("DGS10")
+
+    assert db_calls == ["DGS10"]
+    assert len(first) == 10
+    assert list(window["value"]) == [2.0, 3.0, 4.0]
+
+    info = econ_loader.econ_cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+
+
+def test_cached_frames_are_not_shared(db_calls):
+    df = econ_loader.load_econ_series("DGS2")
+    df["value"] = -1.0
+    assert econ_loader.load_econ_series("DGS2")["value"].iloc[0] == 0.0
+
+
+def test_lru_eviction_and_invalidation(db_calls):
+    for series_id in ("A", "B", "A", "C"):
+        econ_loader.load_econ_series(series_id)
+    # B was least recently used when C arrived
+    econ_loader.load_econ_series("A")
+    econ_loader.load_econ_series("B")
+    assert db_calls == ["A", "B", "C", "B"]
+
+    econ_loader.invalidate_econ_cache("B")
+    econ_loader.load_econ_series("B")
+    assert db_calls[-1] == "B" and len(db_calls) == 5
+
+
+def test_seeded_series_are_not_evicted(db_calls):
+    seeded = pd.DataFrame({"date": pd.to_datetime(["2020-01-01"]), "value": [7.0]})
+    econ_loader.seed_econ_series("SEED", seeded)
+    for series_id in ("A", "B", "C"):
+        econ_loader.load_econ_series(series_id)
+
+    assert econ_loader.load_econ_series("SEED")["value"].tolist() == [7.0]
+    assert "SEED" not in db_calls
+
+
+def test_warm_hits_never_touch_the_database(db_calls, monkeypatch):
+    econ_loader.load_econ_series("DGS10")
+
+    def no_db(*args, **kwargs):
+        raise AssertionError("database touched on a warm cache hit")
+
+    monkeypatch.setattr(econ_loader, "get_engine", no_db)
+    monkeypatch.setattr(econ_loader, "_query_econ_series", no_db)
+    monkeypatch.setattr(econ_loader, "_probe_econ_series", no_db)
+
+    assert len(econ_loader.load_econ_series("DGS10")) == 10
+    assert len(econ_loader.load_econ_series("DGS10", start="2020-01-05")) == 6
+    assert econ_loader.econ_cache_info().hits == 2
+
+
+def test_probe_interval_reloads_series_changed_in_the_db(db_calls, monkeypatch):
+    versions = {"DGS10": (10, "2020-01-10", 45.0)}
+    probes = []
+
+    def fake_probe(series_id):
+        probes.append(series_id)
+        return versions[series_id]
+
+    monkeypatch.setattr(econ_loader, "_probe_econ_series", fake_probe)
+    econ_loader.configure_econ_cache(probe_interval=0)
+
+    econ_loader.load_econ_series("DGS10")
+    econ_loader.load_econ_series("DGS10", start="2020-01-05")
+    assert db_calls == ["DGS10"] and probes == ["DGS10", "DGS10"]
+
+    # another process appended a row: the next load re-reads the series
+    versions["DGS10"] = (11, "2020-01-11", 55.0)
+    econ_loader.load_econ_series("DGS10")
+    assert db_calls == ["DGS10", "DGS10"]
+    econ_loader.load_econ_series("DGS10")
+    assert db_calls == ["DGS10", "DGS10"]
+
+    # within the interval hits are not probed
+    probes.clear()
+    econ_loader.configure_econ_cache(probe_interval=3600)
+    econ_loader.load_econ_series("DGS10")
+    econ_loader.load_econ_series("DGS10")
+    assert probes == ["DGS10"]
+
+    # seeded frames are authoritative and never probed
+    probes.clear()
+    seeded = pd.DataFrame({"date": pd.to_datetime(["2020-01-01"]), "value": [7.0]})
+    econ_loader.seed_econ_series("SEED", seeded)
+    assert econ_loader.load_econ_series("SEED")["value"].tolist() == [7.0]
+    assert probes == []
+
+    with pytest.raises(ValueError):
+        econ_loader.configure_econ_cache(probe_interval=-1)
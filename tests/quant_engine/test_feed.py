@@ -0,0 +1,94 @@
+import pandas as pd
+
+from slice.quant_engine.data import feed
+from slice.quant_engine.interface import run_backtest as rb
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def partitions(self, size):
+        for i in range(0, len(self.rows), size):
+            yield self.rows[i:i + size]
+
+
+class _FakeConnection:
+    def __init__(self, engine):
+        self.engine = engine
+
+    def execution_options(self, **options):
+        assert options["stream_results"]
+        return self
+
+    def execute(self, sql, params):
+        self.engine.queries.append(params)
+        rows = [r for r in self.engine.rows if r[0] in params["tickers"]]
+        return _FakeResult(sorted(rows, key=lambda r: (r[1], r[0])))
+
+    def close(self):
+        self.engine.open -= 1
+
+
+class _PooledEngine:
+    """
+    market_data behind a pool of `pool_size` connections, like the default
+    QueuePool (5 + 10 overflow): one more connect() raises TimeoutError.
+    """
+
+    def __init__(self, frames, pool_size=15):
+        self.rows = [
+            (ticker, date, *values)
+            for ticker, df in frames.items()
+            for date, *values in df[["open", "high", "low", "close", "volume"]].itertuples(name=None)
+        ]
+        self.pool_size = pool_size
+        self.open = 0
+        self.queries = []
+
+    def connect(self):
+        if self.open >= self.pool_size:
+            raise TimeoutError("QueuePool limit reached")
+        self.open += 1
+        return _FakeConnection(self)
+
+
+def test_streaming_more_feeds_than_the_pool_holds(offline_prices, monkeypatch):
+    index = pd.bdate_range("2021-01-04", periods=60)
+    tickers = [f"T{i:02d}" for i in range(20)]
+    frames = {t: offline_prices.frame(index, seed=i) for i, t in enumerate(tickers)}
+    offline_prices.serve(frames)
+    engine = _PooledEngine(frames)
+    monkeypatch.setattr(feed, "get_engine", lambda: engine)
+
+    params = {"tickers": tickers, "cache": False}
+    loaded = rb.run_backtest("BUY_AND_HOLD_FIRST", params)
+    streamed = rb.run_backtest("BUY_AND_HOLD_FIRST", dict(params, streaming=True))
+
+    assert loaded.model_dump() == streamed.model_dump()
+    # one cursor for the whole universe, returned to the pool afterwards
+    assert [q["tickers"] for q in engine.queries] == [tickers]
+    assert engine.open == 0
+
+
+def test_price_stream_hands_out_rows_per_ticker(monkeypatch):
+    index = pd.bdate_range("2021-01-04", periods=5)
+    columns = ["open", "high", "low", "close", "volume"]
+    frames = {
+        "A": pd.DataFrame({c: range(5) for c in columns}, index=index, dtype=float),
+        "B": pd.DataFrame({c: range(10, 13) for c in columns}, index=index[2:], dtype=float),
+    }
+    engine = _PooledEngine(frames, pool_size=1)
+    monkeypatch.setattr(feed, "get_engine", lambda: engine)
+
+    stream = feed.PriceStream(["A", "B"], chunk_size=2)
+    stream.acquire("A")
+    stream.acquire("B")
+    assert stream.next_row("B")[1:] == (10.0, 10.0, 10.0, 10.0, 10.0)
+    assert [stream.next_row("A")[1] for _ in range(5)] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert stream.next_row("A") is None and engine.open == 0
+    assert [stream.next_row("B")[1] for _ in range(2)] == [11.0, 12.0]
+
+    stream.release("A")
+    stream.release("B")
+    assert engine.open == 0
@@ -0,0 +1,68 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from slice.quant_engine.core.indicators import (
+    EWMA,
+    RollingMax,
+    RollingMean,
+    RollingMin,
+    RollingStd,
+    RollingZScore,
+)
+
+
+WINDOW = 20
+
+EXPECTED = {
+    RollingMean: lambda s: s.rolling(WINDOW).mean(),
+    RollingStd: lambda s: s.rolling(WINDOW).std(),
+    RollingMin: lambda s: s.rolling(WINDOW).min(),
+    RollingMax: lambda s: s.rolling(WINDOW).max(),
+    RollingZScore: lambda s: (s - s.rolling(WINDOW).mean()) / s.rolling(WINDOW).std(),
+}
+
+
+@pytest.fixture
+def values():
+    x = np.random.default_rng(0).normal(3.0, 1.0, 500)
+    x[[50, 51, 300]] = np.nan
+    return x
+
+
+@pytest.mark.parametrize("cls", list(EXPECTED))
+def test_rolling_matches_pandas_incremental_batch_and_restored(cls, values):
+    expected = EXPECTED[cls](pd.Series(values)).to_numpy()
+
+    incremental = cls(WINDOW)
+    np.testing.assert_allclose([incremental.update(v) for v in values], expected, atol=1e-10)
+
+    # batch the first 400, checkpoint through JSON, continue bar by bar
+    batched = cls(WINDOW)
+    np.testing.assert_allclose(batched.batch(values[:400]), expected[:400], atol=1e-10)
+    restored = cls.from_state(json.loads(json.dumps(batched.get_state())))
+    np.testing.assert_allclose([restored.update(v) for v in values[400:]], expected[400:], atol=1e-10)
+
+
+@pytest.mark.parametrize("adjust", [True, False])
+def test_ewma_matches_pandas(values, adjust):
+    expected = pd.Series(values).ewm(span=10, adjust=adjust, ignore_na=True).mean().to_numpy()
+
+    ewma = EWMA(span=10, adjust=adjust)
+    np.testing.assert_allclose(ewma.batch(values[:250]), expected[:250])
+    restored = EWMA.from_state(ewma.get_state())
+    np.testing.assert_allclose([restored.update(v) for v in values[250:]], expected[250:])
+
+
+def test_state_is_slots_only():
+    ind = RollingMean(5)
+    with pytest.raises(AttributeError):
+        ind.extra = 1
+    assert set(ind.get_state()) == {"window", "_buf", "_pos", "_count", "_nans"}
+
+    with pytest.raises(ValueError):
+        RollingStd(1)
+    with pytest.raises(ValueError):
+        EWMA()
@@ -0,0 +1,108 @@
+import json
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from slice.quant_engine.data import seed_econ_series
+from slice.quant_engine.data.loader import set_price_source
+from slice.quant_engine.data.synthetic import (
+    SyntheticPriceSource,
+    synthetic_dates,
+    synthetic_econ_series,
+    synthetic_price_panel,
+    synthetic_tickers,
+)
+from slice.quant_engine.interface import job_queue
+
+
+needs_db = pytest.mark.skipif(
+    not os.environ.get("SLICE_DB_URL"), reason="needs a Postgres database (SLICE_DB_URL)"
+)
+
+
+@pytest.fixture
+def synthetic_prices():
+    tickers = synthetic_tickers(2)
+    set_price_source(SyntheticPriceSource(synthetic_price_panel(tickers, synthetic_dates(1), seed=2)))
+    yield tickers
+    set_price_source(None)
+
+
+def test_execute_job_returns_compact_json_result(synthetic_prices):
+    result = job_queue.execute_job("BUY_AND_HOLD_FIRST", {"tickers": synthetic_prices})
+
+    assert result["bars"] == 252
+    assert result["engine"] == "backtrader"
+    assert set(result["metrics"]) >= {"total_return", "sharpe", "max_drawdown"}
+    assert json.loads(json.dumps(result, allow_nan=False)) == result
+
+
+def test_worker_rejects_heartbeat_longer_than_stale_window():
+    with pytest.raises(ValueError):
+        job_queue.BacktestWorker(heartbeat_interval=30.0, stale_after=10.0)
+
+
+def _run_worker(worker_id, tickers, claimed=None):
+    """
+    Worker process: its own synthetic price and econ sources, then
+    BacktestWorker.run(). With `claimed`, the worker sets it on its first
+    job and hangs there, heartbeating, until it is killed.
+    """
+    dates = synthetic_dates(1)
+    set_price_source(SyntheticPriceSource(synthetic_price_panel(tickers, dates, seed=2)))
+    seed_econ_series("DGS10", synthetic_econ_series(dates, seed=4))
+    if claimed is not None:
+        def hang(strategy_id, params):
+            claimed.set()
+            time.sleep(3600)
+
+        job_queue.execute_job = hang
+    job_queue.BacktestWorker(
+        worker_id=worker_id, heartbeat_interval=0.2, stale_after=2.0, poll_interval=0.2
+    ).run()
+
+
+@needs_db
+def test_worker_processes_share_queue_and_requeue_killed_workers_job():
+    from sqlalchemy import text
+
+    from slice.db import apply_schema, get_engine
+
+    apply_schema()
+    tickers = synthetic_tickers(2)
+    batch_id = job_queue.submit_sweep(
+        "BUY_AND_HOLD_FIRST", {"tickers": tickers}, {"commission": [0.0, 0.001, 0.002, 0.003]}
+    )
+
+    ctx = multiprocessing.get_context("spawn")
+    claimed = ctx.Event()
+    victim = ctx.Process(target=_run_worker, args=("victim", tickers, claimed), daemon=True)
+    victim.start()
+    assert claimed.wait(60.0)
+    victim.kill()
+    victim.join()
+
+    workers = [ctx.Process(target=_run_worker, args=(f"w{i}", tickers), daemon=True) for i in range(2)]
+    for w in workers:
+        w.start()
+    try:
+        table = job_queue.wait_for_batch(batch_id, timeout=120.0, poll_interval=0.5)
+    finally:
+        for w in workers:
+            w.terminate()
+            w.join()
+
+    assert len(table) == 4
+    assert (table["status"] == "done").all()
+    assert table["total_return"].is_monotonic_decreasing
+
+    with get_engine().connect() as conn:
+        claims = conn.execute(
+            text("SELECT worker_id, attempts FROM backtest_job WHERE batch_id = :b ORDER BY job_id"),
+            {"b": batch_id},
+        ).all()
+    # the killed worker's job went stale, was requeued and finished by a live worker
+    assert sorted(attempts for _, attempts in claims) == [1, 1, 1, 2]
+    assert {worker_id for worker_id, _ in claims} <= {"w0", "w1"}
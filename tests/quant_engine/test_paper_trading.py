@@ -0,0 +1,122 @@
+import json
+import os
+
+import pytest
+
+from slice.models.common import TradeType
+from slice.quant_engine.data import invalidate_econ_cache, seed_econ_series
+from slice.quant_engine.data.loader import set_price_source
+from slice.quant_engine.data.synthetic import (
+    SyntheticPriceSource,
+    synthetic_dates,
+    synthetic_econ_series,
+    synthetic_price_panel,
+)
+from slice.quant_engine.interface.paper_trading import (
+    PaperPortfolio,
+    advance_portfolio,
+    load_paper_state,
+    load_portfolios,
+    run_paper_trading,
+)
+
+
+needs_db = pytest.mark.skipif(
+    not os.environ.get("SLICE_DB_URL"), reason="needs a Postgres database (SLICE_DB_URL)"
+)
+
+
+@pytest.fixture
+def market():
+    dates = synthetic_dates(1)
+    frames = synthetic_price_panel(["GLD", "SPY"], dates, seed=21)
+    seed_econ_series("DGS10", synthetic_econ_series(dates, seed=22))
+    yield dates, frames
+    invalidate_econ_cache()
+
+
+def _portfolio(**params):
+    return PaperPortfolio(
+        portfolio_id="gold",
+        strategy_id="GOLD_REAL_YIELDS",
+        params={"tickers": ["GLD", "SPY"], "commission": 0.001, "start": "2000-01-03", **params},
+        thesis_ref="thesis-1",
+    )
+
+
+def test_daily_refreshes_match_one_run(market):
+    dates, frames = market
+    portfolio = _portfolio(real_yield_ma_window=10)
+    upto = lambda end: {t: df[df.index <= end] for t, df in frames.items()}  # noqa: E731
+
+    whole = advance_portfolio(portfolio, None, frames)
+
+    state, trades, bars = None, [], 0
+    for end in [dates[100], dates[101], dates[150], dates[-1]]:
+        step = advance_portfolio(portfolio, state, upto(end))
+        state, bars = step.state, bars + len(step.dates)
+        trades += step.trades
+    assert advance_portfolio(portfolio, state, frames) is None
+
+    assert bars == len(dates)
+    assert state.last_date == whole.state.last_date
+    assert state.cash == pytest.approx(whole.state.cash)
+    assert state.positions == whole.state.positions
+    assert state.targets == whole.state.targets
+    assert [(t.trade_id, t.quantity) for t in trades] == [(t.trade_id, t.quantity) for t in whole.trades]
+
+    trade = whole.trades[0]
+    assert trade.type == TradeType.SIMULATED and trade.thesis_ref == "thesis-1"
+    assert trade.action in ("BUY", "SELL")
+    assert json.loads(trade.notes)["target_weight"] is not None
+
+
+def test_changed_params_reject_saved_state(market):
+    _, frames = market
+    step = advance_portfolio(_portfolio(), None, frames)
+    with pytest.raises(ValueError):
+        advance_portfolio(_portfolio(commission=0.002), step.state, frames)
+
+
+def test_load_portfolios_rejects_duplicates(tmp_path):
+    entry = {"portfolio_id": "a", "strategy_id": "GOLD_REAL_YIELDS", "params": {"tickers": ["GLD"]}}
+    path = tmp_path / "paper.json"
+    path.write_text(json.dumps([entry]))
+    assert load_portfolios(path)[0].portfolio_id == "a"
+    path.write_text(json.dumps([entry, entry]))
+    with pytest.raises(ValueError):
+        load_portfolios(path)
+
+
+@needs_db
+def test_runner_persists_state_and_simulated_trades(market):
+    from sqlalchemy import text
+
+    from slice.db import apply_phase4_schema, apply_schema, get_engine
+
+    dates, frames = market
+    apply_schema()
+    apply_phase4_schema()
+    portfolio = _portfolio()
+    with get_engine().begin() as conn:
+        conn.execute(text("DELETE FROM paper_portfolio WHERE portfolio_id = 'gold'"))
+        conn.execute(text("DELETE FROM trade WHERE trade_id LIKE 'paper:gold:%'"))
+
+    set_price_source(SyntheticPriceSource({t: df[df.index <= dates[100]] for t, df in frames.items()}))
+    try:
+        [first] = run_paper_trading([portfolio])
+        set_price_source(SyntheticPriceSource(frames))
+        [second] = run_paper_trading([portfolio])
+        [idle] = run_paper_trading([portfolio])
+    finally:
+        set_price_source(None)
+
+    assert first["error"] is None and first["bars"] == 101
+    assert second["bars"] == len(dates) - 101
+    assert idle["bars"] == 0 and idle["error"] is None
+    assert load_paper_state("gold").last_date == dates[-1].date().isoformat()
+    with get_engine().connect() as conn:
+        count = conn.execute(
+            text("SELECT COUNT(*) FROM trade WHERE trade_id LIKE 'paper:gold:%' AND type = 'SIMULATED'")
+        ).scalar_one()
+    assert count == first["trades"] + second["trades"]
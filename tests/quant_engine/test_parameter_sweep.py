@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from slice.quant_engine.data import econ_loader
+from slice.quant_engine.interface import run_backtest as rb
+
+
+@pytest.fixture
+def offline_data(monkeypatch, offline_prices):
+    idx = pd.bdate_range("2021-01-01", periods=250)
+    offline_prices.serve(offline_prices.frame(idx, seed=3))
+    rng = np.random.default_rng(4)
+    econ = pd.DataFrame({"date": idx, "value": 1.5 + np.cumsum(rng.normal(0.0, 0.05, len(idx)))})
+
+    loaded = []
+
+    def fake_econ(series_id, start=None, end=None):
+        loaded.append(series_id)
+        return econ
+
+    monkeypatch.setattr(rb, "load_econ_series", fake_econ)
+    monkeypatch.setattr(econ_loader, "_CACHE", econ_loader.EconSeriesCache())
+    return loaded
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_sweep_returns_one_row_per_grid_point(offline_data, max_workers):
+    grid = {"real_yield_ma_window": [10, 30], "target_long": [0.25, 0.5]}
+
+    table = rb.run_parameter_sweep(
+        "GOLD_REAL_YIELDS",
+        {"tickers": ["GLD"], "engine": "vectorized"},
+        grid,
+        max_workers=max_workers,
+    )
+
+    assert len(table) == 4
+    assert table["error"].isna().all()
+    assert {"real_yield_ma_window", "target_long", "total_return", "sharpe"} <= set(table.columns)
+    # econ data loaded once in the parent, not per job
+    assert offline_data == ["DGS10"]
+
+
+def test_sweep_rejects_ticker_grid(offline_data):
+    with pytest.raises(ValueError):
+        rb.run_parameter_sweep("GOLD_REAL_YIELDS", {"tickers": ["GLD"]}, {"tickers": [["GLD"]]})
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_successive_halving_narrows_grid_to_full_period_ranking(offline_data, max_workers):
+    grid = {"real_yield_ma_window": [5, 10, 20, 40, 60], "target_long": [0.25, 0.5]}
+    base = {"tickers": ["GLD"], "engine": "vectorized"}
+
+    table = rb.run_successive_halving(
+        "GOLD_REAL_YIELDS", base, grid, eta=3, min_period_bars=20, max_workers=max_workers
+    )
+    full = rb.run_parameter_sweep("GOLD_REAL_YIELDS", base, grid, max_workers=1)
+
+    # 10 points on the last 28 bars, 3 on the last 84, 1 on all 250
+    assert list(table.groupby("round").size()) == [10, 3, 1]
+    assert table["error"].isna().all()
+    assert table["period_start"].nunique() == 3
+
+    # the survivor is scored on the full period exactly as in the grid, and
+    # is the grid's best (sharpe ignores target_long, so compare windows)
+    final = table.iloc[0]
+    match = full[
+        (full["real_yield_ma_window"] == final["real_yield_ma_window"])
+        & (full["target_long"] == final["target_long"])
+    ]
+    assert final["sharpe"] == pytest.approx(match["sharpe"].iloc[0])
+    best = full.sort_values("sharpe", ascending=False).iloc[0]
+    assert final["real_yield_ma_window"] == best["real_yield_ma_window"]
+
+
+def test_successive_halving_warms_up_early_rounds(offline_prices):
+    # A trends up, C down: holding only the top symbol is the best grid point
+    idx = pd.bdate_range("2021-01-01", periods=300)
+    offline_prices.serve({
+        "A": offline_prices.frame(idx, seed=1, drift=0.003),
+        "B": offline_prices.frame(idx, seed=2),
+        "C": offline_prices.frame(idx, seed=3, drift=-0.003),
+    })
+    base = {"tickers": ["A", "B", "C"], "momentum_lookback": 120, "momentum_skip": 5, "volatility_window": 20}
+
+    table = rb.run_successive_halving(
+        "XS_MOMENTUM", base, {"top_n": [3, 2, 1]}, eta=3, min_period_bars=50, max_workers=1
+    )
+
+    # round 0 covers the last 100 bars, shorter than the 125-bar lookback:
+    # only runs started before it hold positions and can be told apart
+    first = table[table["round"] == 0]
+    assert first["sharpe"].notna().all() and first["sharpe"].nunique() == 3
+    assert list(table.groupby("round").size()) == [3, 1]
+    assert table.iloc[0]["top_n"] == 1
@@ -0,0 +1,106 @@
+import datetime as dt
+from contextlib import contextmanager
+
+import pandas as pd
+import pytest
+
+from slice.quant_engine.data import loader
+from slice.quant_engine.data.loader import OHLCV_COLUMNS, _price_query, load_price_data, load_price_panel
+
+
+class _FakeEngine:
+    @contextmanager
+    def connect(self):
+        yield "conn"
+
+
+@pytest.fixture
+def market_data(monkeypatch):
+    """
+    market_data rows served through a mocked pd.read_sql; each query's
+    SQL text, params and dtype are recorded in `queries`.
+    """
+    state = {"rows": [], "queries": []}
+
+    def fake_read_sql(sql, conn, params=None, dtype=None):
+        state["queries"].append({"sql": str(sql), "params": params, "dtype": dtype})
+        rows = [r for r in state["rows"] if r["ticker"] in params["tickers"]]
+        return pd.DataFrame(rows, columns=["ticker", "date"] + OHLCV_COLUMNS).astype(dtype)
+
+    monkeypatch.setattr(loader, "get_engine", lambda: _FakeEngine())
+    monkeypatch.setattr(loader.pd, "read_sql", fake_read_sql)
+    return state
+
+
+def _rows(ticker, dates, base):
+    return [
+        {"ticker": ticker, "date": d, "open": base + i, "high": base + i + 1, "low": base + i - 1,
+         "close": base + i + 0.5, "volume": 10 * i}
+        for i, d in enumerate(dates)
+    ]
+
+
+@pytest.mark.parametrize(
+    "start,end,clause,bound",
+    [
+        (None, None, None, {}),
+        ("2024-01-02", None, "date >= :start", {"start": dt.date(2024, 1, 2)}),
+        (None, pd.Timestamp("2024-03-28 16:00"), "date <= :end", {"end": dt.date(2024, 3, 28)}),
+        (
+            dt.date(2024, 1, 2),
+            "2024-03-28",
+            "date BETWEEN :start AND :end",
+            {"start": dt.date(2024, 1, 2), "end": dt.date(2024, 3, 28)},
+        ),
+    ],
+)
+def test_price_query_clauses_and_bound_params(start, end, clause, bound):
+    sql, params = _price_query(["SPY", "GLD"], start, end)
+
+    where = " ".join(sql.split("WHERE")[1].split("ORDER BY")[0].split())
+    assert where == " AND ".join(["ticker = ANY(:tickers)"] + ([clause] if clause else []))
+    assert params == {"tickers": ["SPY", "GLD"], **bound}
+    assert "ORDER BY ticker ASC, date ASC" in sql
+
+
+def test_panel_splits_long_frame_into_ticker_frames(market_data):
+    market_data["rows"] = _rows("GLD", ["2024-01-02", "2024-01-03"], 180.0) + _rows(
+        "SPY", ["2024-01-02", "2024-01-03", "2024-01-04"], 470.0
+    )
+
+    frames = load_price_panel(["SPY", "UNKNOWN", "GLD", "SPY"], start="2024-01-02", end="2024-01-31")
+
+    [query] = market_data["queries"]
+    assert query["params"] == {
+        "tickers": ["SPY", "UNKNOWN", "GLD"],
+        "start": dt.date(2024, 1, 2),
+        "end": dt.date(2024, 1, 31),
+    }
+    assert query["dtype"] == {col: "float64" for col in OHLCV_COLUMNS}
+
+    # requested order, duplicates dropped, tickers without rows omitted
+    assert list(frames) == ["SPY", "GLD"]
+    spy = frames["SPY"]
+    assert list(spy.columns) == OHLCV_COLUMNS
+    assert isinstance(spy.index, pd.DatetimeIndex) and spy.index.name == "date"
+    assert list(spy.index) == list(pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04"]))
+    assert spy["close"].tolist() == [470.5, 471.5, 472.5]
+    assert (spy.dtypes == "float64").all()
+    assert frames["GLD"]["open"].tolist() == [180.0, 181.0]
+
+    wide = load_price_panel(["GLD", "SPY", "UNKNOWN"], as_panel=True)
+    assert list(wide.columns) == ["GLD", "SPY"]
+    assert wide.loc["2024-01-04", "SPY"] == 472.5 and pd.isna(wide.loc["2024-01-04", "GLD"])
+
+
+def test_empty_and_unknown_tickers(market_data):
+    with pytest.raises(ValueError):
+        load_price_panel([])
+    with pytest.raises(ValueError):
+        load_price_panel(["SPY"], as_panel=True, field="adj_close")
+    assert market_data["queries"] == []
+
+    assert load_price_panel(["UNKNOWN"]) == {}
+    empty = load_price_data("UNKNOWN")
+    assert empty.empty and list(empty.columns) == OHLCV_COLUMNS
+    assert isinstance(empty.index, pd.DatetimeIndex)
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from slice.quant_engine.core.profiling import BarProfiler, duration_summary
+from slice.quant_engine.data import invalidate_econ_cache, seed_econ_series
+from slice.quant_engine.data.loader import set_price_source
+from slice.quant_engine.data.synthetic import (
+    SyntheticPriceSource,
+    synthetic_dates,
+    synthetic_econ_series,
+    synthetic_price_panel,
+)
+from slice.quant_engine.interface import run_backtest as rb
+
+
+@pytest.fixture
+def synthetic_source():
+    dates = synthetic_dates(1)
+    frames = synthetic_price_panel(["GLD", "SPY"], dates, seed=7)
+    seed_econ_series("DGS10", synthetic_econ_series(dates, seed=8))
+    set_price_source(SyntheticPriceSource(frames))
+    yield frames
+    set_price_source(None)
+    invalidate_econ_cache()
+
+
+def test_profiler_summary():
+    profiler = BarProfiler()
+    assert profiler.call("section", lambda a, b: a + b, 1, 2) == 3
+    for n in (0, 2, 2, 1):
+        profiler.count_orders(n)
+    profiler.add_phase("load", 0.5)
+
+    summary = profiler.summary()
+    assert summary["load_s"] == 0.5
+    assert summary["sections"]["section"]["calls"] == 1
+    assert summary["orders_per_bar"] == {
+        "bars": 4, "total": 5, "mean": 1.25, "max": 2, "histogram": {"0": 1, "1": 1, "2": 2},
+    }
+
+    stats = duration_summary([1_000, 2_000, 3_000])
+    assert stats["total_s"] == pytest.approx(6e-6)
+    assert stats["p50_us"] == pytest.approx(2.0)
+    assert stats["max_us"] == pytest.approx(3.0)
+
+
+def test_instrumented_run_reports_hot_path(synthetic_source):
+    params = {"tickers": ["GLD", "SPY"], "engine": "backtrader", "commission": 0.001}
+
+    plain = rb.run_backtest("GOLD_REAL_YIELDS", dict(params, result_format="columnar"))
+    timed = rb.run_backtest("GOLD_REAL_YIELDS", dict(params, result_format="columnar", instrument=True))
+
+    assert "profile" not in plain.metadata
+    np.testing.assert_allclose(timed.returns, plain.returns)
+
+    profile = timed.metadata["profile"]
+    assert {"data_load_s", "engine_s", "cerebro_build_s", "cerebro_run_s"} <= set(profile)
+    sections = profile["sections"]
+    assert sections["compute_target_weights"]["calls"] == len(timed.dates)
+    assert sections["notify_order"]["calls"] >= len(timed.orders)
+    assert profile["orders_per_bar"]["bars"] == len(timed.dates)
+    assert profile["orders_per_bar"]["total"] >= len({o["order_ref"] for o in timed.orders})
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from slice.quant_engine.core.cerebro import run_cerebro
+from slice.quant_engine.core.metrics import compute_backtest_metrics
+from slice.quant_engine.core.vectorized import run_vectorized
+from slice.quant_engine.strategies.gold_real_yields import GoldRealYieldsStrategy
+from slice.quant_engine.strategies.strategy_base import StrategyBase
+
+
+@pytest.fixture
+def gold_inputs(monkeypatch, offline_prices):
+    idx = pd.bdate_range("2020-01-01", periods=400)
+    gld = offline_prices.frame(idx, seed=4)
+    rng = np.random.default_rng(5)
+    econ = pd.DataFrame({"date": idx, "value": 2.0 + np.cumsum(rng.normal(0.0, 0.05, len(idx)))})
+    monkeypatch.setattr(
+        "slice.quant_engine.strategies.gold_real_yields.load_econ_series",
+        lambda series_id, start=None, end=None: econ,
+    )
+    return {"GLD": gld}
+
+
+def test_band_removes_drift_orders(gold_inputs):
+    base = {"real_yield_ma_window": 20, "target_long": 0.5}
+
+    every_bar, _ = run_cerebro(GoldRealYieldsStrategy, gold_inputs, strategy_params=base)
+    banded, _ = run_cerebro(
+        GoldRealYieldsStrategy, gold_inputs, strategy_params=dict(base, rebalance_band=0.05)
+    )
+
+    assert 0 < len(banded.order_log) < len(every_bar.order_log) / 2
+
+
+@pytest.mark.parametrize(
+    "policy",
+    [
+        {"rebalance_frequency": "WEEKLY"},
+        {"rebalance_frequency": "MONTHLY", "rebalance_band": 0.02},
+        {"min_trade_value": 5_000.0},
+    ],
+)
+def test_vectorized_policy_matches_backtrader(gold_inputs, policy):
+    params = dict({"real_yield_ma_window": 20, "target_long": 0.5}, **policy)
+
+    run = run_vectorized(GoldRealYieldsStrategy, gold_inputs, commission=0.001, strategy_params=params)
+    strat, analyzers = run_cerebro(
+        GoldRealYieldsStrategy, gold_inputs, commission=0.001, strategy_params=params
+    )
+
+    bt_returns = np.array(list(analyzers["returns"].get_analysis().values()))
+    bt_total = float(np.prod(1.0 + bt_returns) - 1.0)
+    assert compute_backtest_metrics(run.returns)["total_return"] == pytest.approx(bt_total, abs=0.005)
+    # whole-share sizing drops some sub-share drift trades the vectorized engine keeps
+    assert {o["datetime"] for o in strat.order_log} <= {o["datetime"] for o in run.order_log}
+
+
+def test_rebalance_mask_marks_first_bar_of_each_period():
+    dates = pd.DatetimeIndex(["2024-01-30", "2024-01-31", "2024-02-01", "2024-02-05", "2024-03-01"])
+    p = StrategyBase.resolve_params({"rebalance_frequency": "monthly"})
+    assert StrategyBase.rebalance_mask(dates, p).tolist() == [True, False, True, False, True]
+
+    p = StrategyBase.resolve_params({"rebalance_frequency": "WEEKLY"})
+    assert StrategyBase.rebalance_mask(dates, p).tolist() == [True, False, False, True, True]
+
+    with pytest.raises(ValueError):
+        StrategyBase.rebalance_mask(dates, StrategyBase.resolve_params({"rebalance_frequency": "hourly"}))
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from slice.quant_engine.core.metrics import compute_backtest_metrics, compute_grouped_metrics
+from slice.quant_engine.data import econ_loader
+from slice.quant_engine.data.regimes import BUILTIN_REGIMES, regime_labels, resolve_regime
+from slice.quant_engine.interface import run_backtest as rb
+
+
+def test_grouped_metrics_match_per_group_metrics():
+    rng = np.random.default_rng(5)
+    returns = rng.normal(0.0, 0.01, 400)
+    labels = np.array(["a", "b", None], dtype=object)[rng.integers(0, 3, 400)]
+
+    grouped = compute_grouped_metrics(returns, labels)
+
+    assert list(grouped) == ["a", "b"]
+    for label, metrics in grouped.items():
+        subset = returns[labels == label]
+        expected = compute_backtest_metrics(subset)
+        assert metrics["bars"] == len(subset)
+        assert metrics["max_drawdown_len"] == expected["max_drawdown_len"]
+        for key in ("total_return", "sharpe", "max_drawdown"):
+            assert metrics[key] == pytest.approx(expected[key])
+
+
+def test_regime_labels_respect_release_lag():
+    months = pd.date_range("2020-01-01", periods=30, freq="MS")
+    cpi = pd.DataFrame({"date": months, "value": 100.0 * 1.03 ** (np.arange(30) / 12)})
+    bars = pd.bdate_range("2021-01-04", "2021-03-31").values.astype("datetime64[D]")
+
+    labels = regime_labels(BUILTIN_REGIMES["cpi_yoy"], bars, {"CPIAUCSL": cpi})
+
+    # the first YoY value is dated 2021-01-01 and published 45 days later
+    first = pd.Timestamp(bars[np.flatnonzero(labels != None)[0]])  # noqa: E711
+    assert first == pd.Timestamp("2021-02-15")
+    assert set(labels[labels != None]) == {"2_to_4pct"}  # noqa: E711
+
+
+def test_resolve_regime_validates_specs():
+    assert resolve_regime({"name": "inv", "expression": "DGS10 < DGS2"}).labels == ("off", "on")
+    with pytest.raises(ValueError):
+        resolve_regime("unknown_regime")
+    with pytest.raises(ValueError):
+        resolve_regime({"name": "bands", "expression": "DGS10", "bins": [1, 2], "labels": ["lo", "hi"]})
+
+
+def test_run_backtest_scores_regimes_from_one_run(monkeypatch, offline_prices):
+    idx = pd.bdate_range("2020-06-01", "2022-06-30")
+    offline_prices.serve(offline_prices.frame(idx, seed=11))
+    # curve inverted from 2021-07-01 on
+    econ = {
+        "DGS10": pd.DataFrame({"date": idx, "value": np.where(idx < "2021-07-01", 2.0, 1.0)}),
+        "DGS2": pd.DataFrame({"date": idx, "value": 1.5}),
+    }
+    monkeypatch.setattr(econ_loader, "_CACHE", econ_loader.EconSeriesCache())
+    for series_id, df in econ.items():
+        econ_loader.seed_econ_series(series_id, df)
+
+    result = rb.run_backtest(
+        "GOLD_REAL_YIELDS",
+        {
+            "tickers": ["GLD"],
+            "engine": "vectorized",
+            "cache": False,
+            "result_format": "columnar",
+            "regimes": ["year", "curve_sign"],
+        },
+    )
+    regime_metrics = result.metadata["regime_metrics"]
+
+    years = regime_metrics["year"]
+    assert list(years) == ["2020", "2021", "2022"]
+    assert sum(m["bars"] for m in years.values()) == len(result.returns)
+    in_2021 = result.returns[pd.DatetimeIndex(result.dates).year == 2021]
+    assert years["2021"]["total_return"] == pytest.approx(np.prod(1.0 + in_2021) - 1.0)
+
+    curve = regime_metrics["curve_sign"]
+    inverted = pd.DatetimeIndex(result.dates) >= "2021-07-01"
+    assert curve["inverted"]["bars"] == inverted.sum()
+    assert curve["normal"]["total_return"] == pytest.approx(np.prod(1.0 + result.returns[~inverted]) - 1.0)
@@ -0,0 +1,137 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from slice.quant_engine.data import econ_loader
+from slice.quant_engine.interface import result_cache
+from slice.quant_engine.interface import run_backtest as rb
+from slice.quant_engine.strategies.gold_real_yields import GoldRealYieldsStrategy
+
+
+@pytest.fixture
+def offline(monkeypatch, tmp_path, offline_prices):
+    frame = offline_prices.frame(pd.bdate_range("2022-01-03", periods=60), seed=5, level=20.0)
+    offline_prices.serve(frame)
+    state = {"frame": frame, "runs": 0}
+    run_on_data = rb._run_backtest_on_data
+
+    def counting_run(*args, **kwargs):
+        state["runs"] += 1
+        return run_on_data(*args, **kwargs)
+
+    monkeypatch.setattr(rb, "_run_backtest_on_data", counting_run)
+    cache = result_cache.BacktestResultCache(tmp_path / "cache")
+    monkeypatch.setattr(rb, "get_result_cache", lambda: cache)
+    return state, cache
+
+
+def test_identical_request_is_served_from_cache(offline):
+    state, _ = offline
+    params = {"tickers": ["SPY"], "commission": 0.001}
+
+    first = rb.run_backtest("BUY_AND_HOLD_FIRST", params)
+    second = rb.run_backtest("BUY_AND_HOLD_FIRST", dict(params))
+
+    assert state["runs"] == 1
+    assert second.metadata["cache_key"] == first.metadata["cache_key"]
+    assert second.model_dump() == first.model_dump()
+
+
+def test_disk_store_survives_new_process_cache(offline):
+    _, cache = offline
+    params = {"tickers": ["SPY"]}
+    first = rb.run_backtest("BUY_AND_HOLD_FIRST", params)
+
+    fresh = result_cache.BacktestResultCache(cache.directory)
+    assert fresh.get(first.metadata["cache_key"]).to_backtest_result().model_dump() == first.model_dump()
+
+
+def test_disk_store_evicts_oldest_files_over_size_cap(offline, tmp_path):
+    _, cache = offline
+    first = rb.run_backtest("BUY_AND_HOLD_FIRST", {"tickers": ["SPY"]})
+    result = cache.get(first.metadata["cache_key"])
+    size = (cache.directory / f"{first.metadata['cache_key']}.npz").stat().st_size
+
+    capped = result_cache.BacktestResultCache(tmp_path / "capped", max_disk_bytes=2 * size)
+    for i, key in enumerate(["a", "b"]):
+        capped.put(key, result)
+        os.utime(capped.directory / f"{key}.npz", (1000 + i, 1000 + i))
+    # a disk hit counts as a use: "a" becomes the newest file
+    assert result_cache.BacktestResultCache(capped.directory).get("a") is not None
+    capped.put("c", result)
+
+    assert sorted(p.stem for p in capped.directory.glob("*.npz")) == ["a", "c"]
+    assert result_cache.BacktestResultCache(capped.directory).get("b") is None
+
+
+def test_data_change_params_change_and_opt_out_miss(offline, offline_prices):
+    state, _ = offline
+    rb.run_backtest("BUY_AND_HOLD_FIRST", {"tickers": ["SPY"]})
+
+    rb.run_backtest("BUY_AND_HOLD_FIRST", {"tickers": ["SPY"], "commission": 0.002})
+    assert state["runs"] == 2
+
+    revised = state["frame"].copy()
+    revised.iloc[10, revised.columns.get_loc("close")] *= 1.01
+    offline_prices.serve(revised)
+    rb.run_backtest("BUY_AND_HOLD_FIRST", {"tickers": ["SPY"]})
+    assert state["runs"] == 3
+
+    rb.run_backtest("BUY_AND_HOLD_FIRST", {"tickers": ["SPY"], "cache": False})
+    assert state["runs"] == 4
+
+
+def test_result_is_keyed_on_the_econ_frames_it_ran_on(offline, monkeypatch):
+    state, _ = offline
+    idx = state["frame"].index
+    params = {"tickers": ["GLD"], "real_yield_ma_window": 5}
+
+    # a process whose econ cache predates an update ...
+    monkeypatch.setattr(econ_loader, "_CACHE", econ_loader.EconSeriesCache())
+    econ_loader.seed_econ_series("DGS10", pd.DataFrame({"date": idx, "value": 1.0}))
+    stale = rb.run_backtest("GOLD_REAL_YIELDS", params)
+
+    # ... must not answer for one that sees the new rows
+    monkeypatch.setattr(econ_loader, "_CACHE", econ_loader.EconSeriesCache())
+    econ_loader.seed_econ_series("DGS10", pd.DataFrame({"date": idx, "value": np.linspace(3.0, 0.0, len(idx))}))
+    fresh = rb.run_backtest("GOLD_REAL_YIELDS", params)
+
+    assert state["runs"] == 2
+    assert fresh.metadata["cache_key"] != stale.metadata["cache_key"]
+    assert fresh.strategies[0].returns != stale.strategies[0].returns
+
+
+def test_strategy_defaults_normalize_into_same_key(offline):
+    target_long = dict(GoldRealYieldsStrategy.params._getpairs())["target_long"]
+    frames = {"GLD": offline[0]["frame"]}
+
+    key_a = rb._result_cache_key("GOLD_REAL_YIELDS", {"tickers": ["GLD"]}, ["GLD"], frames, {})
+    key_b = rb._result_cache_key(
+        "GOLD_REAL_YIELDS", {"tickers": ["GLD"], "target_long": target_long, "cache": True}, ["GLD"], frames, {}
+    )
+    assert key_a == key_b
+
+
+def test_code_version_covers_engines_not_yet_imported():
+    # A fresh interpreter has not imported the (lazily loaded) engines when
+    # the key is computed; its code version must still match this one's.
+    import slice.quant_engine.core.cerebro  # noqa: F401
+    import slice.quant_engine.core.vectorized  # noqa: F401
+
+    script = (
+        "import sys\n"
+        "from slice.quant_engine.interface.result_cache import strategy_code_version\n"
+        "from slice.quant_engine.strategies.gold_real_yields import GoldRealYieldsStrategy\n"
+        "assert 'slice.quant_engine.core.vectorized' not in sys.modules\n"
+        "print(strategy_code_version(GoldRealYieldsStrategy))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    fresh = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True, env=env
+    ).stdout.strip()
+
+    assert fresh == result_cache.strategy_code_version(GoldRealYieldsStrategy)
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from slice.quant_engine.core.cerebro import run_cerebro
+from slice.quant_engine.core.signal_expr import compile_signal
+from slice.quant_engine.data import signal_store
+from slice.quant_engine.data.signal_store import SignalStore
+from slice.quant_engine.interface import run_backtest as rb
+from slice.quant_engine.strategies import registry
+from slice.quant_engine.strategies.macro_signal import register_macro_signal
+from slice.quant_engine.strategies.usd_divergence import USDDivergenceStrategy
+
+
+def _econ(dates, seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({"date": dates, "value": 2.0 + np.cumsum(rng.normal(0.0, 0.05, len(dates)))})
+
+
+@pytest.fixture
+def econ(monkeypatch):
+    days = pd.bdate_range("2020-01-01", periods=400)
+    frames = {"US": _econ(days, 1), "EU": _econ(days.delete(slice(100, 110)), 2)}
+    load = lambda series_id, start=None, end=None: frames[series_id]
+    monkeypatch.setattr("slice.quant_engine.strategies.macro_signal.load_econ_series", load)
+    monkeypatch.setattr("slice.quant_engine.strategies.usd_divergence.load_econ_series", load)
+    monkeypatch.setattr(signal_store, "_STORE", SignalStore(persist=False))
+    return frames
+
+
+@pytest.mark.parametrize("text", [
+    "US > 1 > 0",
+    "ma(20) > ma(10)",
+    "ma(US, 0) > 1",
+    "ma(ma(US, 5), 5) > US",
+    "US ** 2 > 1",
+    "(US > 1) + 1",
+    "log(US) > 1",
+    "ma(5)",
+    "1 > 0",
+])
+def test_compile_rejects_expressions_outside_grammar(text):
+    with pytest.raises(ValueError):
+        compile_signal(text)
+
+
+def test_expression_matches_hand_written_computation(econ):
+    expr = compile_signal("US - EU > ma(20) and not US < 1.5")
+    assert expr.series_ids == ("US", "EU") and expr.is_condition
+
+    active = expr.evaluate(econ)
+
+    us = econ["US"].set_index(econ["US"]["date"].dt.date)["value"]
+    eu = econ["EU"].set_index(econ["EU"]["date"].dt.date)["value"]
+    spread = (us - eu).dropna()
+    ma = spread.rolling(20).mean()
+    expected = ((spread > ma) & (us.reindex(spread.index) >= 1.5)).astype(float).where(ma.notna())
+    np.testing.assert_allclose(active.to_numpy(), expected.to_numpy(), atol=0.0)
+
+
+def test_registered_preset_trades_like_hand_written_strategy(econ, monkeypatch, offline_prices):
+    monkeypatch.setattr(registry, "_PATHS", dict(registry._PATHS))
+    monkeypatch.setattr(registry, "_CLASSES", dict(registry._CLASSES))
+    register_macro_signal("TEST_USD_SPREAD", "US - EU > ma(20)", price_symbol="UUP", target_long=0.3)
+    assert registry.strategy_metadata("TEST_USD_SPREAD").params["signal"] == "US - EU > ma(20)"
+
+    idx = pd.bdate_range("2020-03-02", periods=250)
+    uup = offline_prices.frame(idx, seed=4, level=25.0, vol=0.005)
+    prices = {"UUP": uup}
+    closes = uup[["close"]].rename(columns={"close": "UUP"})
+
+    preset = rb._resolve_strategy("TEST_USD_SPREAD")
+    hand = USDDivergenceStrategy.resolve_params(
+        {"us_rate_series_id": "US", "eu_rate_series_id": "EU", "spread_ma_window": 20, "target_long": 0.3}
+    )
+    expected = USDDivergenceStrategy.compute_weight_matrix(closes, hand)
+    weights = preset.compute_weight_matrix(closes, preset.resolve_params({"symbols": ["UUP"]}))
+    pd.testing.assert_frame_equal(weights, expected)
+    assert weights["UUP"].nunique() == 2
+
+    strat, _ = run_cerebro(preset, prices)
+    on_bars = strat._signal_arrays["active"] == 1.0
+    np.testing.assert_array_equal(on_bars, expected["UUP"].to_numpy() > 0.0)
@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from slice.quant_engine.data import signal_store
+from slice.quant_engine.data.signal_store import SignalSpec, SignalStore
+from slice.quant_engine.interface import run_backtest as rb
+from slice.quant_engine.strategies.usd_divergence import USDDivergenceStrategy
+
+
+def _econ(n, seed, start="2020-01-01"):
+    idx = pd.bdate_range(start, periods=n)
+    return pd.DataFrame({"date": idx, "value": np.random.default_rng(seed).normal(2.0, 0.5, n)})
+
+
+@pytest.fixture
+def counted_level():
+    calls = []
+    level_fn = USDDivergenceStrategy._spread_level
+
+    def counting(frames):
+        calls.append([len(df) for df in frames])
+        return level_fn(frames)
+
+    return calls, counting
+
+
+def test_signal_reused_then_extended_incrementally(counted_level):
+    calls, level_fn = counted_level
+    store = SignalStore(persist=False)
+    spec = SignalSpec("usd_divergence.spread", ("US", "EU"), 20)
+    us, eu = _econ(300, 1), _econ(300, 2)
+
+    first = store.get(spec, [us.iloc[:250], eu.iloc[:250]], level_fn)
+    again = store.get(spec, [us.iloc[:250], eu.iloc[:250]], level_fn)
+    assert calls == [[250, 250]]
+    assert again[1] is first[1]
+
+    # econ_data grew: only the new rows are combined, the MA continues
+    level, ma = store.get(spec, [us, eu], level_fn)
+    assert calls[-1] == [50, 50]
+    full_level, full_ma = SignalStore(persist=False).get(spec, [us, eu], level_fn)
+    pd.testing.assert_series_equal(level, full_level)
+    np.testing.assert_allclose(ma.to_numpy(), full_ma.to_numpy(), atol=1e-12)
+
+    # a revised history value forces a full recompute
+    revised = us.copy()
+    revised.loc[10, "value"] += 1.0
+    store.get(spec, [revised, eu], level_fn)
+    assert calls[-1] == [300, 300]
+
+
+def test_sweep_over_target_long_computes_signal_once(monkeypatch, offline_prices):
+    offline_prices.serve(offline_prices.frame(pd.bdate_range("2021-01-04", periods=120), seed=4, level=25.0))
+    econ = {"DGS2": _econ(200, 5, "2020-06-01"), "DGS10": _econ(200, 6, "2020-06-01")}
+    monkeypatch.setattr(rb, "load_econ_series", lambda series_id, start=None, end=None: econ[series_id])
+    monkeypatch.setattr(
+        "slice.quant_engine.strategies.usd_divergence.load_econ_series",
+        lambda series_id, start=None, end=None: econ[series_id],
+    )
+    monkeypatch.setattr(signal_store, "_STORE", SignalStore(persist=False))
+
+    calls = []
+    level_fn = USDDivergenceStrategy._spread_level
+    monkeypatch.setattr(
+        USDDivergenceStrategy, "_spread_level", staticmethod(lambda frames: calls.append(1) or level_fn(frames))
+    )
+
+    results = rb.run_parameter_sweep(
+        "USD_DIVERGENCE",
+        {"tickers": ["UUP"], "spread_ma_window": 20, "cache": False},
+        {"target_long": [0.25, 0.5, 1.0]},
+        max_workers=1,
+    )
+    assert len(results) == 3
+    assert len(calls) == 1
+
+
+def test_process_store_stays_off_the_database_unless_enabled(monkeypatch):
+    monkeypatch.setattr(signal_store, "get_engine", lambda: pytest.fail("database touched"))
+    monkeypatch.delenv(signal_store.SIGNAL_STORE_ENV, raising=False)
+    monkeypatch.setattr(signal_store, "_STORE", None)
+    store = signal_store.get_signal_store()
+    assert not store.persist
+
+    spec = SignalSpec("test.offline", ("DGS10",), 3)
+    level, ma = store.get(spec, [_econ(10, 1)], lambda frames: frames[0].set_index("date")["value"])
+    assert len(level) == 10 and ma.iloc[-1] == pytest.approx(level.iloc[-3:].mean())
+    store.invalidate()
+
+    monkeypatch.setenv(signal_store.SIGNAL_STORE_ENV, "postgres")
+    monkeypatch.setattr(signal_store, "_STORE", None)
+    assert signal_store.get_signal_store().persist
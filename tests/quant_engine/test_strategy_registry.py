@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from slice.quant_engine.interface import run_backtest as rb
+from slice.quant_engine.strategies import registry
+
+
+def test_importing_run_backtest_does_not_import_backtrader_or_strategies():
+    code = (
+        "import sys\n"
+        "from slice.quant_engine.strategies.registry import list_strategies, strategy_metadata\n"
+        "import slice.quant_engine.interface.run_backtest\n"
+        "meta = strategy_metadata('GOLD_REAL_YIELDS')\n"
+        "assert 'GOLD_REAL_YIELDS' in list_strategies()\n"
+        "loaded = [m for m in sys.modules if m == 'backtrader' or m.startswith('slice.quant_engine.strategies.g')]\n"
+        "print(loaded)\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+    assert out.stdout.strip() == "[]"
+
+
+def test_builtin_metadata_is_read_from_source():
+    assert {
+        "BUY_AND_HOLD_FIRST", "CURVE_STEEPNER", "GOLD_REAL_YIELDS", "USD_DIVERGENCE",
+    } <= set(registry.list_strategies())
+
+    meta = registry.strategy_metadata("USD_DIVERGENCE")
+    assert meta.import_path == "slice.quant_engine.strategies.usd_divergence:USDDivergenceStrategy"
+    assert meta.required_econ_series == ["DGS10", "DGS2"]
+    # inherited from StrategyBase
+    assert meta.params["rebalance_frequency"] == "DAILY"
+    assert meta.params["spread_ma_window"] == 60
+
+    cls = rb._resolve_strategy("USD_DIVERGENCE")
+    assert dict(cls.params._getpairs()) == meta.params
+    assert cls.required_econ_series(cls.resolve_params({})) == meta.required_econ_series
+
+
+def test_register_import_path_and_unknown_id(monkeypatch):
+    monkeypatch.setattr(registry, "_PATHS", dict(registry._PATHS))
+    monkeypatch.setattr(registry, "_CLASSES", dict(registry._CLASSES))
+
+    registry.register_strategy(
+        "HOLD_ALIAS", "slice.quant_engine.strategies.buy_and_hold:BuyAndHoldFirstSymbol"
+    )
+    assert rb._resolve_strategy("HOLD_ALIAS") is rb._resolve_strategy("BUY_AND_HOLD_FIRST")
+
+    with pytest.raises(ValueError, match="HOLD_ALIAS"):
+        rb._resolve_strategy("NOPE")
+    with pytest.raises(ValueError, match="module:ClassName"):
+        registry.register_strategy("BAD", "no_colon")
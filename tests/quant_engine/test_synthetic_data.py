@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from slice.quant_engine.data import invalidate_econ_cache, seed_econ_series
+from slice.quant_engine.data.loader import OHLCV_COLUMNS, load_price_panel, set_price_source
+from slice.quant_engine.data.synthetic import (
+    SyntheticPriceSource,
+    synthetic_dates,
+    synthetic_econ_series,
+    synthetic_price_panel,
+    synthetic_tickers,
+)
+from slice.quant_engine.interface import run_backtest as rb
+
+
+@pytest.fixture
+def synthetic_source():
+    dates = synthetic_dates(1)
+    tickers = synthetic_tickers(3, include=["GLD"])
+    frames = synthetic_price_panel(tickers, dates, seed=3)
+    seed_econ_series("DGS10", synthetic_econ_series(dates, seed=4))
+    set_price_source(SyntheticPriceSource(frames))
+    yield tickers, frames
+    set_price_source(None)
+    invalidate_econ_cache()
+
+
+def test_synthetic_panel_shape_and_ohlc_consistency():
+    dates = synthetic_dates(2)
+    frames = synthetic_price_panel(["A", "B"], dates, seed=1)
+
+    assert len(dates) == 504
+    for df in frames.values():
+        assert list(df.columns) == OHLCV_COLUMNS
+        assert df.index.equals(dates)
+        assert (df["high"] >= df[["open", "close"]].max(axis=1)).all()
+        assert (df["low"] <= df[["open", "close"]].min(axis=1)).all()
+    assert not np.allclose(frames["A"]["close"], frames["B"]["close"])
+    pd.testing.assert_frame_equal(frames["A"], synthetic_price_panel(["A", "B"], dates, seed=1)["A"])
+
+
+def test_price_source_feeds_loader_and_run_backtest(synthetic_source, monkeypatch):
+    tickers, frames = synthetic_source
+    assert tickers == ["GLD", "SYN0000", "SYN0001"]
+
+    window = load_price_panel(["GLD", "MISSING"], start=frames["GLD"].index[10])
+    assert list(window) == ["GLD"]
+    assert len(window["GLD"]) == len(frames["GLD"]) - 10
+    assert list(load_price_panel(tickers, as_panel=True).columns) == tickers
+
+    # runs on an injected price source bypass the result cache
+    monkeypatch.setattr(rb, "get_result_cache", lambda: pytest.fail("cache used"))
+    result = rb.run_backtest("GOLD_REAL_YIELDS", {"tickers": ["GLD"], "engine": "vectorized"})
+    assert len(result.strategies[0].returns) == len(frames["GLD"])
+
+
+@pytest.mark.parametrize("strategy_id", ["BUY_AND_HOLD_FIRST", "GOLD_REAL_YIELDS"])
+def test_streaming_feed_matches_preloaded_run(synthetic_source, strategy_id):
+    params = {"tickers": ["GLD", "SYN0000"], "commission": 0.001, "start": "2000-03-01"}
+
+    loaded = rb.run_backtest(strategy_id, params)
+    streamed = rb.run_backtest(strategy_id, dict(params, streaming=True))
+
+    assert loaded.model_dump() == streamed.model_dump()
+
+    with pytest.raises(ValueError, match="streaming"):
+        rb.run_backtest(strategy_id, dict(params, streaming=True, engine="vectorized"))
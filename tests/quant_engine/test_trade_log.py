@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from slice.quant_engine.core.cerebro import run_cerebro
+from slice.quant_engine.core.trade_log import (
+    FILL_DTYPE,
+    RecordLog,
+    match_fifo_lots,
+    opening_lots,
+    trade_records,
+)
+from slice.quant_engine.data.synthetic import synthetic_dates, synthetic_price_panel
+from slice.quant_engine.strategies.momentum import CrossSectionalMomentumStrategy
+
+
+def _fills(rows):
+    log = RecordLog(FILL_DTYPE, capacity=1)
+    for row in rows:
+        log.append(row)
+    assert len(log) == len(rows)
+    return log.array
+
+
+def test_fifo_matching_splits_lots_and_flips():
+    # day, symbol, size, price, value, commission, order_ref, partial
+    fills = _fills([
+        (0, 0, 10.0, 100.0, 1000.0, 1.0, 1, False),
+        (1, 0, 5.0, 110.0, 550.0, 0.5, 2, False),
+        (2, 0, -12.0, 120.0, 1220.0, 1.2, 3, False),
+        (3, 0, -8.0, 90.0, 330.0, 0.8, 4, False),   # closes 3 long, opens 5 short
+        (4, 0, 5.0, 80.0, 450.0, 0.5, 5, False),
+        (1, 1, 3.0, 10.0, 30.0, 0.0, 6, False),     # still open: no trade
+    ])
+
+    trades = match_fifo_lots(fills)
+
+    assert trades[["day_open", "day_close"]].tolist() == [(0, 2), (1, 2), (1, 3), (3, 4)]
+    assert trades["size"].tolist() == [10.0, 2.0, 3.0, -5.0]
+    assert trades["price_close"].tolist() == [120.0, 120.0, 90.0, 80.0]
+    assert trades["pnl"].tolist() == pytest.approx([200.0, 20.0, -60.0, 50.0])
+    # 0.1 commission per unit on every fill, charged on both legs
+    assert trades["pnl_commission"].tolist() == pytest.approx([198.0, 19.6, -60.6, 49.0])
+
+    records = trade_records(trades, ["A", "B"])
+    assert records[0]["symbol"] == "A" and str(records[0]["dt_close"].date()) == "1970-01-03"
+
+
+def test_opening_lots_are_closed_first():
+    opening = opening_lots({"A": (4.0, 50.0)}, ["A"], day=7)
+    fills = _fills([(9, 0, -6.0, 60.0, 300.0, 0.0, 1, False)])
+
+    trades = match_fifo_lots(fills, opening)
+
+    assert trades[["day_open", "size", "price_open"]].tolist() == [(7, 4.0, 50.0)]
+
+
+def test_backtrader_trades_exit_at_fill_prices():
+    dates = synthetic_dates(1)
+    frames = synthetic_price_panel(["A", "B", "C", "D"], dates, seed=13)
+    params = {"momentum_lookback": 40, "momentum_skip": 5, "top_n": 2, "volatility_window": 20}
+
+    strat, _ = run_cerebro(CrossSectionalMomentumStrategy, frames, commission=0.001, strategy_params=params)
+
+    fills = strat.fills.array
+    assert fills.dtype == FILL_DTYPE and len(fills) > 0
+    sold = {(o["symbol"], o["datetime"], o["price"]) for o in strat.order_log if o["size"] < 0}
+    trades = strat.trade_log
+    assert trades
+    for trade in trades:
+        assert trade["size"] > 0
+        assert (trade["symbol"], trade["dt_close"], trade["price_close"]) in sold
+        assert trade["dt_open"] <= trade["dt_close"]
+
+    # every unit sold closes a lot (long-only strategy)
+    closed = np.sum([t["size"] for t in trades])
+    assert closed == pytest.approx(-fills["size"][fills["size"] < 0].sum())
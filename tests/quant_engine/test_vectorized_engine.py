@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from slice.quant_engine.core.cerebro import run_cerebro
+from slice.quant_engine.core.metrics import compute_backtest_metrics
+from slice.quant_engine.core.vectorized import run_vectorized
+from slice.quant_engine.interface import run_backtest as rb
+from slice.quant_engine.strategies.gold_real_yields import GoldRealYieldsStrategy
+
+
+def _econ(index, seed=1):
+    rng = np.random.default_rng(seed)
+    values = 2.0 + np.cumsum(rng.normal(0.0, 0.05, len(index)))
+    return pd.DataFrame({"date": index, "value": values})
+
+
+@pytest.fixture
+def gold_inputs(monkeypatch, offline_prices):
+    gld = offline_prices.frame(pd.bdate_range("2020-01-01", periods=400))
+    econ = _econ(gld.index)
+    monkeypatch.setattr(
+        "slice.quant_engine.strategies.gold_real_yields.load_econ_series",
+        lambda series_id, start=None, end=None: econ,
+    )
+    return {"GLD": gld}
+
+
+def test_vectorized_matches_backtrader_total_return(gold_inputs):
+    params = {"real_yield_ma_window": 20, "target_long": 0.5}
+
+    run = run_vectorized(GoldRealYieldsStrategy, gold_inputs, strategy_params=params)
+    strat, analyzers = run_cerebro(GoldRealYieldsStrategy, gold_inputs, strategy_params=params)
+
+    bt_returns = np.array(list(analyzers["returns"].get_analysis().values()))
+    assert len(run.returns) == len(bt_returns)
+
+    vec_total = compute_backtest_metrics(run.returns)["total_return"]
+    bt_total = float(np.prod(1.0 + bt_returns) - 1.0)
+    # fractional vs whole-share sizing → close, not identical
+    assert vec_total == pytest.approx(bt_total, abs=0.005)
+
+
+def test_vectorized_commission_scales_with_turnover(gold_inputs):
+    params = {"real_yield_ma_window": 20, "target_long": 0.5}
+
+    free = run_vectorized(GoldRealYieldsStrategy, gold_inputs, strategy_params=params)
+    paid = run_vectorized(
+        GoldRealYieldsStrategy, gold_inputs, commission=0.001, strategy_params=params
+    )
+
+    assert free.commissions.sum() == 0.0
+    assert paid.turnover.sum() > 0.0
+    assert paid.equity[-1] < free.equity[-1]
+    assert {o["symbol"] for o in paid.order_log} == {"GLD"}
+
+
+def test_backtest_metrics_drawdown():
+    metrics = compute_backtest_metrics(np.array([0.0, 0.1, -0.5, 0.2, 1.0]))
+
+    assert metrics["max_drawdown"] == pytest.approx(50.0)
+    assert metrics["max_drawdown_len"] == 2
+    assert metrics["total_return"] == pytest.approx(1.1 * 0.5 * 1.2 * 2.0 - 1.0)
+
+
+def test_equity_only_run_matches_standard_analyzers(gold_inputs):
+    params = {"real_yield_ma_window": 20, "target_long": 0.5}
+
+    _, standard = run_cerebro(GoldRealYieldsStrategy, gold_inputs, commission=0.001, strategy_params=params)
+    _, minimal = run_cerebro(
+        GoldRealYieldsStrategy, gold_inputs, commission=0.001, strategy_params=params, analyzers="none"
+    )
+
+    dates, returns = rb._returns_from_analyzers(standard)
+    eq_dates, eq_returns = rb._returns_from_equity(minimal["equity"], 100_000.0)
+    np.testing.assert_array_equal(dates, eq_dates)
+    np.testing.assert_allclose(eq_returns, returns, atol=1e-12)
+
+    expected = rb._metrics_from_analyzers(standard, returns)
+    post_hoc = compute_backtest_metrics(eq_returns)
+    assert post_hoc["max_drawdown_len"] == expected["max_drawdown_len"]
+    for key in ("total_return", "sharpe", "max_drawdown"):
+        assert post_hoc[key] == pytest.approx(expected[key], rel=1e-9)